@@ -13,11 +13,13 @@ from .base_regressor import MiBaseRegressor
 from .linear_regressor import MiLinearRegression
 from .logistic_regressor import MiLogisticRegression
 from .metrics import raw_bias, percent_bias
+from .pooling import RubinPool
 
 __all__ = [
     "MiBaseRegressor",
     "MiLinearRegression",
     "MiLogisticRegression",
     "raw_bias",
-    "percent_bias"
+    "percent_bias",
+    "RubinPool"
 ]
@@ -1,14 +1,74 @@
 """Module to set up Autoimpute regressors for multiply imputed analysis."""
 
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 from statsmodels.api import add_constant
 from sklearn.utils.validation import check_is_fitted
+from autoimpute.utils.checks import _forget_validation
 from autoimpute.utils.helpers import _one_hot_encode
+from autoimpute.utils.resources import core_budget, current_budget
 from autoimpute.imputations import MultipleImputer
+from autoimpute.imputations.helpers import _child_seed
+from .pooling import RubinPool
 
 # pylint:disable=attribute-defined-outside-init
+# pylint:disable=too-many-arguments
+
+def _fit_analysis_model(lib, regressor, kwgs, X, y):
+    """Private method to fit a model using sklearn or statsmodels."""
+
+    # statsmodels fit case, which requires different logic than sklearn
+    if lib == "statsmodels":
+        X = add_constant(X)
+        if kwgs:
+            model = regressor(y, X, **kwgs)
+        else:
+            model = regressor(y, X)
+        model = model.fit()
+
+    # sklearn fit case, which requires different logic than statsmodels
+    if lib == "sklearn":
+        if kwgs:
+            model = regressor(**kwgs)
+        else:
+            model = regressor()
+        # sklearn doesn't need encoding for response
+        model.fit(X, y)
+
+    # return the model after fitting it to a given dataset
+    return model
+
+def _fit_worker(lib, regressor, kwgs, X, y, budget=None):
+    """Private method to fit an analysis model in a worker process."""
+    with core_budget(budget):
+        return _fit_analysis_model(lib, regressor, kwgs, X, y)
+
+def _sklearn_params(model):
+    """Private method to get the intercept and coefficients of a model."""
+    return np.append(model.intercept_, model.coef_)
+
+def _bootstrap_params(regressor, kwgs, X, y, seeds):
+    """Private method to fit sklearn models to bootstrap samples of X, y.
+
+    Each replicate resamples rows with its own seed in `seeds`, so the
+    replicates do not depend on how they are split across workers.
+    Returns an array with the params of one replicate per row.
+    """
+    params = []
+    for seed in seeds:
+        rows = np.random.default_rng(seed).integers(0, len(X), len(X))
+        model = _fit_analysis_model(
+            "sklearn", regressor, kwgs, X.iloc[rows], y.iloc[rows]
+        )
+        params.append(_sklearn_params(model))
+    return np.array(params)
+
+def _bootstrap_worker(regressor, kwgs, X, y, seeds, budget=None):
+    """Private method to fit bootstrap replicates in a worker process."""
+    with core_budget(budget):
+        return _bootstrap_params(regressor, kwgs, X, y, seeds)
 
 class MiBaseRegressor:
     """Building blocks to create an Autoimpute regressor.
@@ -25,7 +85,8 @@ class MiBaseRegressor:
 
     model_libs = ("sklearn", "statsmodels")
 
-    def __init__(self, mi, model_lib, mi_kwgs, model_kwgs):
+    def __init__(self, mi, model_lib, mi_kwgs, model_kwgs, keep_models=False,
+                 n_jobs=1, n_boot=0, seed=None):
         """Create an instance of the MiBaseRegressor class.
 
         The MiBaseRegressor class is not a stand-alone class and should not be
@@ -49,6 +110,19 @@ class MiBaseRegressor:
             model_kwgs (dict): keyword args to instantiate regressor. Arg is
                 passed along to either sklearn or statsmodels regressor. If
                 `model_kwgs` is None, default instance of regressor created.
+            keep_models (bool): keep the analysis model of each imputation
+                in `models_`. Default is False, which only folds the
+                estimates of each model into the pool and drops the model.
+            n_jobs (int): number of processes used to fit the analysis
+                models and bootstrap replicates. Default is 1, which fits
+                sequentially. -1 uses every core of the current core budget.
+            n_boot (int): bootstrap replicates fit within each imputation
+                to estimate the within-imputation variance of sklearn
+                models, so that they are pooled with Rubin's rules too.
+                Default is 0, which pools sklearn point estimates only.
+                Ignored by statsmodels, which has its own std. errors.
+            seed (int, optional): seed for reproducible bootstrap samples.
+                Default is None.
 
         Returns:
             self. Instance of MiBaseRegressor class.
@@ -59,6 +133,10 @@ class MiBaseRegressor:
         self.mi = mi
         self.model_kwgs = model_kwgs
         self.model_lib = model_lib
+        self.keep_models = keep_models
+        self.n_jobs = n_jobs
+        self.n_boot = n_boot
+        self.seed = seed
 
     @property
     def mi_kwgs(self):
@@ -157,8 +235,8 @@ class MiBaseRegressor:
         be in the MiBaseRegressor.model_libs tuple, which contains the libs to
         use for regression of multiply imputed datasets. The library chosen is
         important. Only statsmodels (the default) provides proper parameter
-        pooling using Rubin's rules. sklearn provides mean estimate pooling
-        only. sklearn variance parameter pooling and diagnostics in dev, TBD.
+        pooling using Rubin's rules out of the box. sklearn provides mean
+        estimate pooling only, unless `n_boot` bootstraps its variance.
 
         Args:
             lib (iter): library to use
@@ -171,6 +249,69 @@ class MiBaseRegressor:
             raise ValueError(err)
         self._model_lib = lib
 
+    @property
+    def n_jobs(self):
+        """Property getter to return the value of n_jobs."""
+        return self._n_jobs
+
+    @n_jobs.setter
+    def n_jobs(self, j):
+        """Validate n_jobs to ensure it's Type and Value.
+
+        Args:
+            j (int): number of processes used to fit analysis models.
+
+        Raises:
+            TypeError: n_jobs must be an integer.
+            ValueError: n_jobs must be positive or -1.
+        """
+        if not isinstance(j, int):
+            err = "n_jobs must be an integer specifying number of processes."
+            raise TypeError(err)
+        if j < 1 and j != -1:
+            err = "n_jobs must be greater than zero, or -1 for all cores."
+            raise ValueError(err)
+        self._n_jobs = j
+
+    @property
+    def n_boot(self):
+        """Property getter to return the value of n_boot."""
+        return self._n_boot
+
+    @n_boot.setter
+    def n_boot(self, b):
+        """Validate n_boot to ensure it's Type and Value.
+
+        Args:
+            b (int): bootstrap replicates fit within each imputation.
+
+        Raises:
+            TypeError: n_boot must be an integer.
+            ValueError: n_boot must be zero, or greater than one.
+        """
+        if not isinstance(b, int):
+            err = "n_boot must be an integer specifying replicates."
+            raise TypeError(err)
+        if b < 0 or b == 1:
+            err = "n_boot must be zero, or at least 2 to estimate variance."
+            raise ValueError(err)
+        self._n_boot = b
+
+    @property
+    def _bootstrap(self):
+        """Whether sklearn models are bootstrapped for their variance."""
+        return self.model_lib == "sklearn" and self.n_boot > 0
+
+    def _workers(self, tasks):
+        """Private method to determine number of worker processes to use.
+
+        Workers are capped by the number of `tasks` and by the current core
+        budget. Returns the workers and the CoreBudget of each worker.
+        """
+        budget = current_budget()
+        requested = budget.n_cores if self.n_jobs == -1 else self.n_jobs
+        return budget.split(min(requested, max(1, tasks)))
+
     def _fit_strategy_validator(self, X, y):
         """Private method to validate data before fitting model."""
 
@@ -201,13 +342,15 @@ class MiBaseRegressor:
             raise ValueError(err)
 
         # if no errors thus far, add y to X for imputation
+        # X changed in place, so drop the validation cached by `fit`
         X[self._yn] = y
+        _forget_validation(X)
 
         # return the multiply imputed datasets
         return self.mi.fit_transform(X)
 
-    def _fit_model(self, model_type, regressor, X, y):
-        """Private method to fit a model using sklearn or statsmodels."""
+    def _encode(self, model_type, X, y):
+        """Private method to encode predictors and response for a model."""
 
         # encoding for predictor variable
         # we enforce that predictors were imputed in imputation phase.
@@ -219,46 +362,101 @@ class MiBaseRegressor:
             ycat = y.astype("category").cat
             y = ycat.codes
             self._response_categories = ycat.categories
+        return X, y
 
-        # statsmodels fit case, which requires different logic than sklearn
-        if self.model_lib == "statsmodels":
-            X = add_constant(X)
-            if self.model_kwgs:
-                model = regressor(y, X, **self.model_kwgs)
-            else:
-                model = regressor(y, X)
-            model = model.fit()
-
-        # sklearn fit case, which requires different logic than statsmodels
-        if self.model_lib == "sklearn":
-            if self.model_kwgs:
-                model = regressor(**self.model_kwgs)
-            else:
-                model = regressor()
-            # sklearn doesn't need encoding for response
-            model.fit(X, y)
+    def _boot_seeds(self, ind):
+        """Private method to get the seed of each bootstrap of imputation."""
+        seed = _child_seed(self.seed, ind)
+        return [_child_seed(seed, b) for b in range(self.n_boot)]
 
-        # return the model after fitting it to a given dataset
-        return model
+    def _apply_models_to_mi_data(self, model_dict, X=None, y=None,
+                                 mi_data=None):
+        """Private method to apply analysis model to multiply imputed data.
 
-    def _apply_models_to_mi_data(self, model_dict, X, y):
-        """Private method to apply analysis model to multiply imputed data."""
+        X and y are imputed first, unless `mi_data` already imputed is given.
+        """
 
         # find regressor based on model lib, then get mutliply imputed data
         model_type = model_dict["type"]
         regressor = model_dict[self.model_lib]
-        mi_data = self._fit_strategy_validator(X, y)
+        if mi_data is None:
+            mi_data = self._fit_strategy_validator(X, y)
         models = {}
+        pool = RubinPool()
+
+        # sequential unless n_jobs requests a process pool. the m models and
+        # bootstrap replicates are all tasks on the same pool of workers
+        n_boot = self.n_boot if self._bootstrap else 0
+        workers, budget = self._workers(self.mi.n*(1+n_boot))
+        if workers == 1:
+            fits = self._fit_sequential(mi_data, model_type, regressor)
+        else:
+            fits = self._fit_parallel(
+                mi_data, model_type, regressor, workers, budget
+            )
 
-        # then preform analysis models. Sequential only right now.
-        for dataset in mi_data:
-            ind, X = dataset
-            y = X.pop(self._yn)
-            model = self._fit_model(model_type, regressor, X, y)
-            models[ind] = model
+        # each model is folded into the pool, and kept only if requested
+        for ind, model, boot, nobs in fits:
+            self._pool_model(pool, model, boot, nobs)
+            if self.keep_models:
+                models[ind] = model
 
         # returns a dictionary: k=imp #; v=analysis model applied to imp #
-        return models
+        # and the pool of their estimates
+        return models, pool
+
+    def _fit_sequential(self, mi_data, model_type, regressor):
+        """Private generator to fit the analysis model on each imputation.
+
+        Yields the imputation number, its model, its bootstrap params if the
+        model is bootstrapped (otherwise None), and its number of records.
+        """
+        for ind, X in mi_data:
+            y = X.pop(self._yn)
+            X, y = self._encode(model_type, X, y)
+            model = _fit_analysis_model(
+                self.model_lib, regressor, self.model_kwgs, X, y
+            )
+            boot = None
+            if self._bootstrap:
+                boot = _bootstrap_params(
+                    regressor, self.model_kwgs, X, y, self._boot_seeds(ind)
+                )
+            yield ind, model, boot, len(X)
+
+    def _fit_parallel(self, mi_data, model_type, regressor, workers,
+                      budget):
+        """Private generator to fit the analysis models on a process pool.
+
+        Every imputation is submitted as it is imputed. Its bootstrap
+        replicates are split into one task per worker, so the m x n_boot
+        fits run in parallel rather than in a serial loop. Results are
+        yielded in order, as `_fit_sequential` yields them.
+        """
+        kwgs = self.model_kwgs
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = []
+            for ind, X in mi_data:
+                y = X.pop(self._yn)
+                X, y = self._encode(model_type, X, y)
+                model = executor.submit(
+                    _fit_worker, self.model_lib, regressor, kwgs, X, y,
+                    budget
+                )
+                boots = []
+                if self._bootstrap:
+                    seeds = self._boot_seeds(ind)
+                    boots = [
+                        executor.submit(_bootstrap_worker, regressor, kwgs,
+                                        X, y, seeds[c::workers], budget)
+                        for c in range(min(workers, self.n_boot))
+                    ]
+                futures.append((ind, model, boots, len(X)))
+            for ind, model, boots, nobs in futures:
+                boot = None
+                if boots:
+                    boot = np.vstack([b.result() for b in boots])
+                yield ind, model.result(), boot, nobs
 
     def _predict_strategy_validator(self, instance, X):
         """Private method to validate before prediction."""
@@ -280,83 +478,43 @@ class MiBaseRegressor:
         X = _one_hot_encode(X)
         return X
 
-    def _var_ratios(self, imps, num, denom):
-        """Private method for the variance ratios."""
-        return (num+(num/imps))/denom
-
-    def _degrees_freedom(self, imps, lambda_, v_com):
-        """Private method to calculate degrees of freedom for estimates."""
+    def _pool_model(self, pool, model, boot=None, nobs=None):
+        """Private method to fold the estimates of a model into the pool.
 
-        # note we nudge lambda if zero b/c need lambda for other stats
-        # see source code barnard.rubin.R from MICE for more
-        lambda_ = np.maximum(1e-04, lambda_)
-        v_old = (imps-1)/lambda_**2
-        v_obs = ((v_com+1)/(v_com+3))*v_com*(1-lambda_)
-        v = (v_old*v_obs)/(v_old+v_obs)
-        return v
+        sklearn models are pooled with the std. errors of their bootstrap
+        params `boot`, if bootstrapped, and as point estimates otherwise.
+        `nobs` is the number of records the sklearn model was fit on.
+        """
+        if self.model_lib == "sklearn":
+            params = _sklearn_params(model)
+            if boot is None:
+                pool.update(params)
+            else:
+                pool.update(params, boot.std(axis=0, ddof=1), nobs)
+        if self.model_lib == "statsmodels":
+            pool.update(model.params, model.bse, model.nobs)
 
-    def _get_stats_from_models(self, models):
-        """Private method to generate statistics given on model lib chosen."""
+    def _get_stats_from_pool(self, pool, models):
+        """Private method to generate statistics given on model lib chosen.
 
-        # initial setup - get items from models and get number of models
+        Per-imputation estimates are kept as `mi_params_` (and `mi_alphas_`
+        or `mi_std_errors_`) only if `keep_models`, from the models kept.
+        """
+        index = ["const"] + self.new_X_columns
         items = models.items()
-        m = self.mi.n
 
-        # pooling phase: sklearn - coefficients only, no variance
+        # pooling phase: sklearn - coefficients, and variance if bootstrap
+        # sklearn does not implement inference out of the box
         if self.model_lib == "sklearn":
-
-            # find basic parameters, but can't return much more than coeff
-            # sklearn does not implement inference out of the box
-            # will have to write methods to do so from stratch, so TBD
-            self.mi_alphas_ = [j.intercept_ for i, j in items]
-            self.mi_params_ = [j.coef_ for i, j in items]
-            alpha = sum(self.mi_alphas_) / m
-            params = sum(self.mi_params_) / m
-            coefs = pd.Series(np.insert(params, 0, alpha))
-            coefs.index = ["const"] + self.new_X_columns
-            statistics = OrderedDict(
-                coefs=coefs
-            )
+            if self.keep_models:
+                self.mi_alphas_ = [j.intercept_ for i, j in items]
+                self.mi_params_ = [j.coef_ for i, j in items]
+            if self._bootstrap:
+                return pool.pool(index)
+            return OrderedDict(coefs=pool.coefs(index))
 
         # pooling phase: statsmodels - coefficients and variance possible
-        if self.model_lib == "statsmodels":
-
-            # data and model parameters
+        if self.keep_models:
             self.mi_params_ = [j.params for i, j in items]
             self.mi_std_errors_ = [j.bse for i, j in items]
-            coefs = sum(self.mi_params_)/ m
-            k = coefs.index.size
-            n = list(items)[0][1].nobs
-            df_com = n-k
-
-            # variance metrics (See VB Ch 2.3)
-            vw = sum(map(lambda x: x**2, self.mi_std_errors_))/m
-            vb = sum(map(lambda p: (p-coefs)**2, self.mi_params_))/max(1, m-1)
-            vt = vw + vb + (vb / m)
-            stdt = np.sqrt(vt)
-
-            # variance ratios (See VB Ch 2.3)
-            # efficiency as specified in stats manual
-            lambda_ = self._var_ratios(m, vb, vt)
-            r_ = self._var_ratios(m, vb, vw)
-            v_ = self._degrees_freedom(m, lambda_, df_com)
-            fmi_ = ((v_+1)/(v_+3))*lambda_ + 2/(v_+3)
-            eff_ = (1+(np.maximum(1e-04, fmi_)/m))**-1
-
-            # create statistics with pooled metrics from above
-            statistics = OrderedDict(
-                coefs=coefs,
-                std=stdt,
-                vw=vw,
-                vb=vb,
-                vt=vt,
-                dfcom=df_com,
-                dfadj=v_,
-                lambda_=lambda_,
-                riv=r_,
-                fmi=fmi_,
-                eff=eff_
-            )
-
-        # finally, return dictionary with stats from fit used in transform
-        return statistics
+        return pool.pool()
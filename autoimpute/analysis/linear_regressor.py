@@ -1,16 +1,31 @@
 """Module containing linear regression for multiply imputed datasets."""
 
+from collections import namedtuple
+import numpy as np
 import pandas as pd
 from sklearn.base import BaseEstimator
 from sklearn.linear_model import LinearRegression
 from sklearn.utils.validation import check_is_fitted
 from statsmodels.api import OLS
-from autoimpute.utils import check_nan_columns
+from autoimpute.utils import check_nan_columns, MissingMask
+from autoimpute.utils.helpers import _design_matrix
 from .base_regressor import MiBaseRegressor
+from .pooling import RubinPool
 
 # pylint:disable=attribute-defined-outside-init
 # pylint:disable=too-many-locals
 
+# least squares fit of one imputation, with what Rubin's rules pool from OLS
+OLSResults = namedtuple("OLSResults", ["params", "bse", "nobs", "df_resid"])
+
+def _with_const(design):
+    """Private method to prepend a constant column, as `add_constant` does."""
+    return np.column_stack([np.ones(len(design)), design])
+
+def _cross_products(design, y):
+    """Private method to get X'X, X'y and y'y of a design and response."""
+    return design.T @ design, design.T @ y, y @ y
+
 class MiLinearRegression(MiBaseRegressor, BaseEstimator):
     """Linear Regression wrapper for multiply imputed datasets.
 
@@ -34,7 +49,8 @@ class MiLinearRegression(MiBaseRegressor, BaseEstimator):
     }
 
     def __init__(self, mi=None, model_lib="statsmodels", mi_kwgs=None,
-                 model_kwgs=None):
+                 model_kwgs=None, keep_models=False, n_jobs=1, n_boot=0,
+                 seed=None):
         """Create an instance of the Autoimpute MiLinearRegression class.
 
         Args:
@@ -48,6 +64,14 @@ class MiLinearRegression(MiBaseRegressor, BaseEstimator):
                 passed as mi argument, then mi_kwgs ignored.
             model_kwgs (dict, Optional): keyword args to instantiate
                 regressor. Default is None.
+            keep_models (bool, Optional): keep the analysis model fit on
+                each imputed dataset in `models_`. Default is False, which
+                pools estimates as each model is fit, then drops the model.
+            n_jobs (int, Optional): number of processes used to fit the m
+                analysis models and their bootstrap replicates. Default is 1.
+            n_boot (int, Optional): bootstrap replicates per imputation for
+                the variance of sklearn models. Default is 0, no bootstrap.
+            seed (int, Optional): seed for bootstrap samples. Default is None.
 
         Returns:
             self. Instance of the class.
@@ -57,7 +81,11 @@ class MiLinearRegression(MiBaseRegressor, BaseEstimator):
             mi=mi,
             model_lib=model_lib,
             mi_kwgs=mi_kwgs,
-            model_kwgs=model_kwgs
+            model_kwgs=model_kwgs,
+            keep_models=keep_models,
+            n_jobs=n_jobs,
+            n_boot=n_boot,
+            seed=seed
         )
 
     @check_nan_columns
@@ -70,8 +98,16 @@ class MiLinearRegression(MiBaseRegressor, BaseEstimator):
         each m datasets. The linear model comes from sklearn or statsmodels.
         Finally, the fit method calculates pooled parameters from the m linear
         models. Note that variance for pooled parameters using Rubin's rules
-        is available for statsmodels only. sklearn does not implement
-        parameter inference out of the box. Autoimpute sklearn pooling TBD.
+        is available for statsmodels, or for sklearn if `n_boot` > 0. sklearn
+        does not implement parameter inference out of the box, so its
+        within-imputation variance is estimated from bootstrap replicates.
+
+        With statsmodels and no `model_kwgs`, OLS is solved from cross
+        products. X'X and X'y of rows with no missing values are the same in
+        every imputation, so they are computed once. Only the rows with
+        imputed cells are added for each imputation, and the m systems are
+        solved as a batch. If `keep_models`, `models_` then holds OLSResults
+        with the params, std. errors, nobs and residual degrees of freedom.
 
         Args:
             X (pd.DataFrame): predictors to use. can contain missingness.
@@ -86,16 +122,97 @@ class MiLinearRegression(MiBaseRegressor, BaseEstimator):
 
         # generate the imputation datasets from multiple imputation
         # then fit the analysis models on each of the imputed datasets
-        self.models_ = self._apply_models_to_mi_data(
-            self.linear_models, X, y
-        )
+        # OLS without kwargs shares the cross products of complete rows
+        fitted = None
+        if self.model_lib == "statsmodels" and not self.model_kwgs:
+            fitted = self._fit_ols_batch(X, y)
+        if fitted is None:
+            fitted = self._apply_models_to_mi_data(
+                self.linear_models, X, y
+            )
+        self.models_, pool = fitted
 
-        # generate the fit statistics from each of the m models
-        self.statistics_ = self._get_stats_from_models(self.models_)
+        # generate the fit statistics from the pool of the m models
+        self.statistics_ = self._get_stats_from_pool(pool, self.models_)
 
         # still return an instance of the class
         return self
 
+    def _fit_ols_batch(self, X, y):
+        """Private method to fit OLS on each imputation from cross products.
+
+        Matches statsmodels OLS with `add_constant`, solved with the
+        pseudo-inverse. Falls back to fitting each imputed dataset with
+        statsmodels when the shortcut may not match it. For categorical
+        dtypes, None is returned before any imputation. When a design
+        column is constant, as `add_constant` then adds no constant, the
+        datasets already imputed are fit with statsmodels instead.
+        """
+        if any(str(dtype) == "category" for dtype in X.dtypes):
+            return None
+        mi_data = self._fit_strategy_validator(X, y)
+        preds = [c for c in X.columns if c != self._yn]
+
+        # encode as `_one_hot_encode`: numeric columns, then the dummies
+        design, names, blocks, levels = _design_matrix(X[preds])
+        objects = [c for c in preds if X[c].dtype == object]
+        order = [c for c in preds if c not in objects] + objects
+        pos = np.concatenate([np.empty(0, dtype=int)] +
+                             [blocks[c] for c in order])
+        self.new_X_columns = [names[i] for i in pos]
+
+        # cross products of complete rows are the same in every imputation
+        complete = MissingMask(X).complete_rows()
+        rows = np.flatnonzero(~complete)
+        xc = _with_const(design[np.ix_(complete, pos)])
+        yc = X[self._yn].values[complete].astype(float)
+        gram, xty, yty = _cross_products(xc, yc)
+        lo, hi = xc.min(0, initial=np.inf), xc.max(0, initial=-np.inf)
+
+        # a column constant in complete rows may stay constant once imputed
+        # keep the imputed datasets then, to fit them if the shortcut can't
+        if not (lo[1:] < hi[1:]).all():
+            mi_data = list(mi_data)
+
+        # add the rows with imputed cells for each imputation
+        imps, grams, xtys, ytys = [], [], [], []
+        for i, imputed in mi_data:
+            part = imputed.iloc[rows]
+            yi = part[self._yn].values.astype(float)
+            xi, _, _, _ = _design_matrix(part[preds], levels)
+            xi = _with_const(xi[:, pos])
+            lo_i = np.minimum(lo, xi.min(0, initial=np.inf))
+            hi_i = np.maximum(hi, xi.max(0, initial=-np.inf))
+            if (lo_i[1:] == hi_i[1:]).any():
+                return self._apply_models_to_mi_data(
+                    self.linear_models, mi_data=mi_data
+                )
+            g, b, yy = _cross_products(xi, yi)
+            imps.append(i)
+            grams.append(gram + g)
+            xtys.append(xty + b)
+            ytys.append(yty + yy)
+
+        # solve the m systems as a batch, as statsmodels does with pinv
+        grams, xtys = np.stack(grams), np.stack(xtys)
+        cov = np.linalg.pinv(grams)
+        params = np.einsum("mij,mj->mi", cov, xtys)
+        ssr = np.array(ytys) - np.einsum("mi,mi->m", params, xtys)
+        nobs = float(len(X))
+        df_resid = nobs - np.linalg.matrix_rank(grams)
+        scale = ssr / df_resid
+        bse = np.sqrt(np.diagonal(cov, axis1=1, axis2=2) * scale[:, None])
+        index = ["const"] + self.new_X_columns
+        models, pool = {}, RubinPool()
+        for j, i in enumerate(imps):
+            pool.update(params[j], bse[j], nobs)
+            if self.keep_models:
+                models[i] = OLSResults(pd.Series(params[j], index=index),
+                                       pd.Series(bse[j], index=index),
+                                       nobs, df_resid[j])
+        pool.index = index
+        return models, pool
+
     @check_nan_columns
     def predict(self, X):
         """Make predictions using statistics generated from fit.
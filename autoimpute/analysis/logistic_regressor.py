@@ -35,7 +35,8 @@ class MiLogisticRegression(MiBaseRegressor, BaseEstimator):
     }
 
     def __init__(self, mi=None, model_lib="statsmodels", mi_kwgs=None,
-                 model_kwgs=None):
+                 model_kwgs=None, keep_models=False, n_jobs=1, n_boot=0,
+                 seed=None):
         """Create an instance of the Autoimpute MiLogisticRegression class.
 
         Args:
@@ -49,6 +50,14 @@ class MiLogisticRegression(MiBaseRegressor, BaseEstimator):
                 passed as `mi` argument, then `mi_kwgs` ignored.
             model_kwgs (dict, Optional): keyword args to instantiate
                 regressor. Default is None.
+            keep_models (bool, Optional): keep the analysis model fit on
+                each imputed dataset in `models_`. Default is False, which
+                pools estimates as each model is fit, then drops the model.
+            n_jobs (int, Optional): number of processes used to fit the m
+                analysis models and their bootstrap replicates. Default is 1.
+            n_boot (int, Optional): bootstrap replicates per imputation for
+                the variance of sklearn models. Default is 0, no bootstrap.
+            seed (int, Optional): seed for bootstrap samples. Default is None.
 
         Returns:
             self. Instance of the class.
@@ -58,7 +67,11 @@ class MiLogisticRegression(MiBaseRegressor, BaseEstimator):
             mi=mi,
             model_lib=model_lib,
             mi_kwgs=mi_kwgs,
-            model_kwgs=model_kwgs
+            model_kwgs=model_kwgs,
+            keep_models=keep_models,
+            n_jobs=n_jobs,
+            n_boot=n_boot,
+            seed=seed
         )
 
     @check_nan_columns
@@ -71,8 +84,9 @@ class MiLogisticRegression(MiBaseRegressor, BaseEstimator):
         on m datasets. The logistic model comes from sklearn or statsmodels.
         Finally, the fit method calculates pooled parameters from m logistic
         models. Note that variance for pooled parameters using Rubin's rules
-        is available for statsmodels only. sklearn does not implement
-        parameter inference out of the box.
+        is available for statsmodels, or for sklearn if `n_boot` > 0. sklearn
+        does not implement parameter inference out of the box, so its
+        within-imputation variance is estimated from bootstrap replicates.
 
         Args:
             X (pd.DataFrame): predictors to use. can contain missingness.
@@ -87,12 +101,12 @@ class MiLogisticRegression(MiBaseRegressor, BaseEstimator):
 
         # generate the imputation datasets from multiple imputation
         # then fit the analysis models on each of the imputed datasets
-        self.models_ = self._apply_models_to_mi_data(
+        self.models_, pool = self._apply_models_to_mi_data(
             self.logistic_models, X, y
         )
 
-        # generate the fit statistics from each of the m models
-        self.statistics_ = self._get_stats_from_models(self.models_)
+        # generate the fit statistics from the pool of the m models
+        self.statistics_ = self._get_stats_from_pool(pool, self.models_)
 
         # still return an instance of the class
         return self
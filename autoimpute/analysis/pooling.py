@@ -0,0 +1,138 @@
+"""Module to pool the estimates of analysis models with Rubin's rules.
+
+This module contains the RubinPool, an accumulator that folds in the
+coefficients and standard errors of the analysis model fit on each imputed
+dataset, one imputation at a time. The mean and spread of the coefficients
+are updated with Welford's algorithm over NumPy arrays, so models need not
+be kept to pool them, and every pooled statistic is computed in vectorized
+form. See Van Buuren, Flexible Imputation of Missing Data, Ch 2.3.
+"""
+
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+def _var_ratios(imps, num, denom):
+    """Private method for the variance ratios."""
+    return (num+(num/imps))/denom
+
+def _degrees_freedom(imps, lambda_, v_com):
+    """Private method to calculate degrees of freedom for estimates."""
+
+    # note we nudge lambda if zero b/c need lambda for other stats
+    # see source code barnard.rubin.R from MICE for more
+    lambda_ = np.maximum(1e-04, lambda_)
+    v_old = (imps-1)/lambda_**2
+    v_obs = ((v_com+1)/(v_com+3))*v_com*(1-lambda_)
+    v = (v_old*v_obs)/(v_old+v_obs)
+    return v
+
+class RubinPool:
+    """Accumulate estimates of each imputation to pool with Rubin's rules.
+
+    Attributes:
+        m (int): number of imputations folded in.
+        mean (np.ndarray): mean of the coefficients.
+        m2 (np.ndarray): sum of squared deviations of the coefficients.
+        within (np.ndarray): mean of the squared standard errors, or None
+            if no standard errors were folded in.
+        index (list): names of the coefficients, if given as a Series.
+        nobs (float): observations in each analysis model, if given.
+    """
+
+    def __init__(self):
+        """Create an instance of the RubinPool class with no estimates."""
+        self.m = 0
+        self.mean = None
+        self.m2 = None
+        self.within = None
+        self.index = None
+        self.nobs = None
+
+    def update(self, params, bse=None, nobs=None):
+        """Fold in the estimates of one imputation.
+
+        Args:
+            params (np.ndarray, pd.Series): coefficients of the model.
+            bse (np.ndarray, pd.Series, optional): standard errors of the
+                coefficients. Default is None, e.g. for sklearn models.
+            nobs (float, optional): observations the model was fit on.
+
+        Returns:
+            self: instance of the RubinPool class.
+        """
+        if self.index is None and isinstance(params, pd.Series):
+            self.index = params.index.tolist()
+        params = np.asarray(params, dtype=float).ravel()
+        if self.mean is None:
+            self.mean = np.zeros_like(params)
+            self.m2 = np.zeros_like(params)
+        self.m += 1
+        delta = params - self.mean
+        self.mean += delta / self.m
+        self.m2 += delta * (params - self.mean)
+        if bse is not None:
+            var = np.square(np.asarray(bse, dtype=float).ravel())
+            if self.within is None:
+                self.within = np.zeros_like(var)
+            self.within += (var - self.within) / self.m
+        if nobs is not None:
+            self.nobs = nobs
+        return self
+
+    def _series(self, values, index):
+        """Private method to label pooled values with the coefficients."""
+        return pd.Series(values, index=index)
+
+    def coefs(self, index=None):
+        """Pooled coefficients, labeled by `index` or the names folded in."""
+        return self._series(self.mean, index or self.index)
+
+    def pool(self, index=None):
+        """Pool the estimates with Rubin's rules.
+
+        Args:
+            index (list, optional): names of the coefficients. Default is
+                None, which uses the names of the coefficients folded in.
+
+        Returns:
+            OrderedDict: pooled coefficients, their variance components and
+                variance ratios, and degrees of freedom.
+        """
+        m = self.m
+        index = index or self.index
+        coefs = self.mean
+        df_com = self.nobs - coefs.size
+
+        # variance metrics (See VB Ch 2.3)
+        vw = self.within
+        vb = self.m2 / max(1, m-1)
+        vt = vw + vb + (vb / m)
+        stdt = np.sqrt(vt)
+
+        # variance ratios (See VB Ch 2.3)
+        # efficiency as specified in stats manual
+        lambda_ = _var_ratios(m, vb, vt)
+        r_ = _var_ratios(m, vb, vw)
+        v_ = _degrees_freedom(m, lambda_, df_com)
+        fmi_ = ((v_+1)/(v_+3))*lambda_ + 2/(v_+3)
+        eff_ = (1+(np.maximum(1e-04, fmi_)/m))**-1
+
+        # create statistics with pooled metrics from above
+        stats = OrderedDict(
+            coefs=coefs,
+            std=stdt,
+            vw=vw,
+            vb=vb,
+            vt=vt,
+            dfcom=df_com,
+            dfadj=v_,
+            lambda_=lambda_,
+            riv=r_,
+            fmi=fmi_,
+            eff=eff_
+        )
+        return OrderedDict(
+            (k, v if np.isscalar(v) else self._series(v, index))
+            for k, v in stats.items()
+        )
@@ -12,9 +12,11 @@ from autoimpute.imputations.dataframe.
 from .base_imputer import BaseImputer
 from .single_imputer import SingleImputer
 from .multiple_imputer import MultipleImputer
+from .imputed_data import MultiplyImputedData
 
 __all__ = [
     "BaseImputer",
     "SingleImputer",
-    "MultipleImputer"
+    "MultipleImputer",
+    "MultiplyImputedData"
 ]
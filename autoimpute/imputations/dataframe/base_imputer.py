@@ -6,7 +6,10 @@ methods available for imputation analysis.
 """
 
 import warnings
+import numpy as np
 from autoimpute.utils import check_strategy_allowed
+from autoimpute.utils import check_strategy_fit, check_predictors_fit
+from autoimpute.utils import md_pattern, proportions
 from autoimpute.imputations import method_names
 from ..series import DefaultUnivarImputer, DefaultPredictiveImputer
 from ..series import DefaultTimeSeriesImputer
@@ -71,7 +74,15 @@ class BaseImputer:
                 semi-supervised method using bayesian & hot-deck imputation.
         strategies (dict): univariate and predictive strategies merged.
         visit_sequences: tuple of supported sequences for visiting columns.
-            Right now, default = left-to-right. Only sequence supported.
+            `default` = `left-to-right`, the order of columns in the data.
+            `fewest-missing-first` visits columns in order of increasing
+                proportion missing.
+            `monotone` visits columns in the same order, and columns that use
+                `all` predictors are predicted from earlier columns only.
+                For a monotone pattern, each is then fit once on every row
+                where it is observed, and imputed from complete predictors.
+                The first column has no predictors, so predictive
+                strategies fall back to `default univariate` for it.
     """
     univariate_strategies = {
         methods.DEFAULT_UNIVAR: DefaultUnivarImputer,
@@ -103,7 +114,9 @@ class BaseImputer:
 
     visit_sequences = (
         "default",
-        "left-to-right"
+        "left-to-right",
+        "fewest-missing-first",
+        "monotone"
     )
 
     def __init__(self, strategy, imp_kwgs, visit):
@@ -126,7 +139,7 @@ class BaseImputer:
                 instantiated with same arguments.
             visit (str, None): order to visit columns for imputation.
                 Default is `default`, which implements `left-to-right`.
-                More strategies (random, monotone, etc.) TBD.
+                `fewest-missing-first` and `monotone` also supported.
         """
         self.strategy = strategy
         self.imp_kwgs = imp_kwgs
@@ -214,6 +227,52 @@ class BaseImputer:
         # otherwise, set property for visit
         self._visit = v
 
+    def _visit_order(self, X):
+        """Private method to get the order to visit the columns of X.
+
+        Orders other than `left-to-right` sort columns by their proportion
+        missing, keeping the order of ties. For `monotone`, warns if rows of
+        `md_pattern` are not monotone in that order, i.e. some column is
+        observed where an earlier one is missing.
+        """
+        cols = X.columns.tolist()
+        if self.visit in ("default", "left-to-right"):
+            return cols
+        poms = proportions(X)["poms"].values
+        order = [cols[i] for i in np.argsort(poms, kind="stable")]
+        if self.visit == "monotone":
+            pattern = md_pattern(X)[order].values
+            if (np.diff(pattern, axis=1) > 0).any():
+                warnings.warn("Missing data pattern is not monotone.")
+        return order
+
+    def _dataset_columns(self, cols):
+        """Private method to get the columns of a dataset an imputer reads.
+
+        Reads the columns named in `strategy` and, for predictive columns,
+        their `predictors`. A string strategy, or `all` predictors for any
+        predictive column, needs every column. `predictors` may also be a
+        list with one specification per imputation (MultipleImputer).
+        """
+        strats = check_strategy_fit(self.strategy, cols)
+        preds = self.predictors
+        if not isinstance(preds, (list, tuple)) or \
+                all(isinstance(p, str) for p in preds):
+            preds = [preds]
+        used = set(strats)
+        for pred in preds:
+            if isinstance(pred, dict):
+                pred = dict(pred)
+            pred = check_predictors_fit(pred, cols)
+            for column, method in strats.items():
+                if method not in self.predictive_strategies:
+                    continue
+                p = pred[column]
+                if p == "all":
+                    return list(cols)
+                used.update([p] if isinstance(p, str) else p)
+        return [c for c in cols if c in used]
+
     def _fit_init_params(self, column, method, kwgs):
         """Private method to supply imputation model fit params if any."""
 
@@ -234,6 +293,23 @@ class BaseImputer:
             raise ValueError(err)
         return final_params
 
+    def _init_imputer(self, column, method):
+        """Private method to create the series imputer for a given column."""
+        imp = self.strategies[method]
+        imp_params = self._fit_init_params(column, method, self.imp_kwgs)
+
+        # try to create an instance of the imputer, given the args
+        try:
+            if imp_params is None:
+                imputer = imp()
+            else:
+                imputer = imp(**imp_params)
+        except TypeError as te:
+            name = imp.__name__
+            err = f"Invalid arguments passed to {name} __init__ method."
+            raise ValueError(err) from te
+        return imputer
+
     def _check_if_single_dummy(self, col, X):
         """Private method to check if encoding results in single cat."""
         cats = X.columns.tolist()
@@ -0,0 +1,103 @@
+"""Store multiply imputed datasets as one DataFrame plus imputed values.
+
+This module contains one class - the MultiplyImputedData. The `n` datasets
+of a MultipleImputer differ only in the values imputed, so the class keeps
+the original DataFrame once and, for each imputation, an array of the
+values imputed in each column. Memory is then |X| + n * |missing| rather
+than n * |X|. Imputed datasets are materialized only when accessed.
+"""
+
+import numpy as np
+import pandas as pd
+
+class MultiplyImputedData:
+    """Original DataFrame and the values of each imputation at its missing.
+
+    Iterating yields (imputation number, imputed DataFrame) tuples, like
+    `MultipleImputer.transform`, but each DataFrame is built when it is
+    reached. `column` gets one imputed column without building the rest.
+    Only imputed columns are copied. Columns with no missing values are
+    views of the original data, so they should not be changed in place.
+
+    Attributes:
+        data (pd.DataFrame): the DataFrame imputed. It is not copied, so it
+            should not be changed while imputations are in use.
+        rows (dict): positions of the missing rows of each imputed column.
+        values (dict): imputation number -> dict of column -> array of the
+            values imputed at `rows`.
+    """
+
+    def __init__(self, data, rows):
+        """Create an instance of the MultiplyImputedData class.
+
+        Args:
+            data (pd.DataFrame): the DataFrame imputed.
+            rows (dict): column -> positions of its missing rows.
+        """
+        self.data = data
+        self.rows = {c: np.asarray(r, dtype=np.intp) for c, r in rows.items()}
+        self.values = {}
+
+    def add(self, i, imputed):
+        """Add imputation i from its values at the missing rows.
+
+        Args:
+            i (int): imputation number.
+            imputed (dict, pd.DataFrame): column -> array of values imputed
+                at `rows`, or a full imputed DataFrame to take them from.
+
+        Returns:
+            self: instance of the MultiplyImputedData class.
+        """
+        if not isinstance(imputed, dict):
+            imputed = {c: imputed[c].values[r] for c, r in self.rows.items()}
+        self.values[i] = {c: np.asarray(imputed[c]) for c in self.rows}
+        return self
+
+    @property
+    def n(self):
+        """Number of imputations stored."""
+        return len(self.values)
+
+    def __len__(self):
+        """Number of imputations stored."""
+        return self.n
+
+    def __iter__(self):
+        """Yield each imputation number and its imputed DataFrame in order."""
+        for i in self.values:
+            yield i, self[i]
+
+    def __getitem__(self, i):
+        """Build the imputed DataFrame of imputation i.
+
+        Raises:
+            KeyError: no imputation i is stored.
+        """
+        if i not in self.values:
+            raise KeyError(f"No imputation {i}. Have {list(self.values)}.")
+        columns = [self.column(i, c) for c in self.data.columns]
+        X = pd.concat(columns, axis=1, copy=False)
+        X.columns = self.data.columns
+        return X
+
+    def column(self, i, column):
+        """Get a column of imputation i.
+
+        Columns with missing values are copied and filled with the values
+        imputed. Other columns are returned as is, without a copy.
+
+        Args:
+            i (int): imputation number.
+            column (str): column of the DataFrame.
+
+        Returns:
+            pd.Series: the imputed column.
+        """
+        series = self.data[column]
+        rows = self.rows.get(column)
+        if rows is None or not len(rows):
+            return series
+        series = series.copy()
+        series.iloc[rows] = self.values[i][column]
+        return series
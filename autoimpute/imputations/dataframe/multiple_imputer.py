@@ -7,13 +7,20 @@ method runs `n` times on its specified column. When `n` passes through the
 columns are complete, the MultipleImputer returns the `n` imputed datasets.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.utils.validation import check_is_fitted
 from autoimpute.imputations import method_names
 from autoimpute.utils import check_nan_columns, check_predictors_fit
 from autoimpute.utils import check_strategy_fit
+from autoimpute.utils.checks import _missing_mask, _validation_scope
+from autoimpute.utils.datasets import check_dataset, dataset_columns
+from autoimpute.utils.datasets import write_parquet
+from autoimpute.utils.resources import core_budget, current_budget
 from .base_imputer import BaseImputer
-from .single_imputer import SingleImputer
+from .single_imputer import SingleImputer, _transform_row_groups
+from .imputed_data import MultiplyImputedData
 methods = method_names
 
 # pylint:disable=attribute-defined-outside-init
@@ -23,6 +30,26 @@ methods = method_names
 # pylint:disable=too-many-instance-attributes
 # pylint:disable=arguments-differ
 
+def _fit_imputer(imputer, X, shared=None, budget=None):
+    """Private method to fit a SingleImputer in a worker process."""
+    with core_budget(budget):
+        return imputer._fit(X, shared)
+
+def _transform_imputer(imputer, X, mask=None, budget=None):
+    """Private method to transform with a SingleImputer in a worker process."""
+    with core_budget(budget):
+        return imputer._transform(X, mask=mask)
+
+def _imputed_values(imputer, X, rows, mask=None, budget=None):
+    """Private method to get the values a SingleImputer imputes at rows.
+
+    Only the imputed values are returned from the worker process, rather
+    than a full copy of the imputed DataFrame.
+    """
+    with core_budget(budget):
+        imputed = imputer._transform(X, mask=mask)
+        return {c: imputed[c].values[r] for c, r in rows.items()}
+
 class MultipleImputer(BaseImputer, BaseEstimator, TransformerMixin):
     """Techniques to impute Series with missing values multiple times.
 
@@ -39,7 +66,8 @@ class MultipleImputer(BaseImputer, BaseEstimator, TransformerMixin):
 
     def __init__(self, n=5, strategy="default predictive", predictors="all",
                  imp_kwgs=None, seed=None, visit="default",
-                 return_list=False):
+                 return_list=False, n_jobs=1, n_iter=1, tol=1e-2,
+                 compact=False):
         """Create an instance of the MultipleImputer class.
 
         As with sklearn classes, all arguments take default values. Therefore,
@@ -63,9 +91,29 @@ class MultipleImputer(BaseImputer, BaseEstimator, TransformerMixin):
                 imp_kwgs is ignored.
             seed (int, optional): seed setting for reproducible results.
                 Defualt is None. No validation, but values should be integer.
+                Each imputation receives an independent SeedSequence spawned
+                from the seed, which its SingleImputer spawns per column.
             return_list (bool, optional): return m as list or generator.
                 Default is False. m imputations returned as generator. More
                 memory efficient. return as list if return_list=True
+            n_jobs (int, optional): number of processes used to fit and
+                transform the `n` imputations. Default is 1, which runs each
+                imputation sequentially in the current process. -1 uses all
+                available cores. Results are identical to the sequential run
+                for the same `seed`, as each imputation has its own streams.
+                Processes are capped by the cores of the current
+                `core_budget`, and each process splits an equal share of
+                them among the samplers, estimators and BLAS it runs.
+            n_iter (int, optional): max number of sweeps over the columns in
+                each imputation. Default is 1. If greater, each imputation
+                runs its own chained equations. See SingleImputer.
+            tol (float, optional): tolerance of chained sweeps. Default is
+                0.01. See SingleImputer.
+            compact (bool, optional): return a MultiplyImputedData from
+                transform instead of `n` copies of the DataFrame. Default is
+                False. The MultiplyImputedData keeps the DataFrame once and
+                the values imputed by each imputation, and builds imputed
+                DataFrames only when they are accessed.
         """
         BaseImputer.__init__(
             self,
@@ -77,6 +125,10 @@ class MultipleImputer(BaseImputer, BaseEstimator, TransformerMixin):
         self.predictors = predictors
         self.seed = seed
         self.return_list = return_list
+        self.n_jobs = n_jobs
+        self.n_iter = n_iter
+        self.tol = tol
+        self.compact = compact
         self.copy = True
 
     @property
@@ -109,6 +161,66 @@ class MultipleImputer(BaseImputer, BaseEstimator, TransformerMixin):
         # otherwise set the property value for n
         self._n = n_
 
+    @property
+    def n_jobs(self):
+        """Property getter to return the value of the n_jobs property."""
+        return self._n_jobs
+
+    @n_jobs.setter
+    def n_jobs(self, j):
+        """Validate the n_jobs property to ensure it's Type and Value.
+
+        Args:
+            j (int): n_jobs passed as arg to class instance.
+
+        Raises:
+            TypeError: n_jobs must be an integer.
+            ValueError: n_jobs must be positive or -1.
+        """
+
+        # deal with type first
+        if not isinstance(j, int):
+            err = "n_jobs must be an integer specifying number of processes."
+            raise TypeError(err)
+
+        # then check the value is positive or -1 for all cores
+        if j < 1 and j != -1:
+            err = "n_jobs must be greater than zero, or -1 for all cores."
+            raise ValueError(err)
+
+        # otherwise set the property value for n_jobs
+        self._n_jobs = j
+
+    def _shared_fits(self, imputer, i):
+        """Private method to get fit imputers to share with imputation i.
+
+        Imputers with a deterministic fit produce the same model in every
+        imputation, so long as the column's predictors are the same. They
+        are fit once and shared. Only their random draws are repeated.
+        Chained equations refit predictive columns on each imputation's own
+        draws, so only univariate fits are shared when n_iter > 1.
+        """
+        shared = {}
+        for column, imp in imputer.statistics_.items():
+            if not imp.deterministic_fit:
+                continue
+            method = self._strats[column]
+            same_preds = self._preds[i][column] == self._preds[0][column]
+            same_preds = same_preds and self.n_iter == 1
+            if method in self.univariate_strategies or same_preds:
+                shared[column] = imp
+        return shared
+
+    def _workers(self, tasks):
+        """Private method to determine number of worker processes to use.
+
+        Workers are capped by the number of `tasks` and by the current core
+        budget. Returns the workers and the CoreBudget of each worker.
+        """
+        budget = current_budget()
+        requested = budget.n_cores if self.n_jobs == -1 else self.n_jobs
+        return budget.split(min(requested, max(1, tasks)))
+
     def _fit_strategy_validator(self, X):
         """Internal helper method to validate strategies appropriate for fit.
 
@@ -149,6 +261,7 @@ class MultipleImputer(BaseImputer, BaseEstimator, TransformerMixin):
         """Private method to prep for prediction."""
         check_is_fitted(self, "statistics_")
 
+    @check_dataset
     @check_nan_columns
     def fit(self, X, y=None):
         """Fit imputation methods to each column within a DataFrame.
@@ -159,37 +272,109 @@ class MultipleImputer(BaseImputer, BaseEstimator, TransformerMixin):
         data with that value. All currently supported methods are inductive.
 
         Args:
-            X (pd.DataFrame): pandas DataFrame on which imputer is fit.
+            X (pd.DataFrame, str, pyarrow.dataset.Dataset): pandas DataFrame
+                on which imputer is fit, or a Parquet path or Arrow dataset,
+                of which only the columns in `strategy` and `predictors` of
+                any imputation are read.
 
         Returns:
             self: instance of the PredictiveImputer class.
         """
 
-        # first, run the fit strategy validator, then create statistics
+        # first, run the fit strategy validator
         self._fit_strategy_validator(X)
-        self.statistics_ = {}
 
-        # deal with potentially setting seed for each individual predictor
+        # spawn an independent seed sequence for each SingleImputer
         if self.seed is not None:
-            self._seeds = [self.seed + i for i in range(1, self.n*13, 13)]
+            entropy = np.random.SeedSequence(self.seed).entropy
+            self._seeds = [np.random.SeedSequence(entropy, spawn_key=(i,))
+                           for i in range(self.n)]
         else:
             self._seeds = [None]*self.n
 
-        # create PredictiveImputers. sequentially only right now
-        for i in range(1, self.n+1):
-            imputer = SingleImputer(
+        # create SingleImputers, one for each imputation
+        imputers = [
+            SingleImputer(
                 strategy=self.strategy,
-                predictors=self._preds[i-1],
+                predictors=self._preds[i],
                 imp_kwgs=self.imp_kwgs,
                 copy=self.copy,
-                seed=self._seeds[i-1],
-                visit=self.visit
+                seed=self._seeds[i],
+                visit=self.visit,
+                n_iter=self.n_iter,
+                tol=self.tol
             )
-            imputer.fit(X)
-            self.statistics_[i] = imputer
-
+            for i in range(self.n)
+        ]
+
+        # fit the first imputation, then share its deterministic fits
+        first = imputers[0]._fit(X)
+        shared = [self._shared_fits(first, i) for i in range(1, self.n)]
+        rest = imputers[1:]
+
+        # fit the rest sequentially, or on a process pool if n_jobs requested
+        # each worker gets an equal share of the cores for nested parallelism
+        workers, budget = self._workers(len(rest))
+        if workers == 1:
+            fitted = [imp._fit(X, s) for imp, s in zip(rest, shared)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                fitted = list(executor.map(
+                    _fit_imputer, rest, [X]*len(rest), shared,
+                    [budget]*len(rest)
+                ))
+            # workers return copies, so point back to the one shared imputer
+            for imp, s in zip(fitted, shared):
+                imp.statistics_.update(s)
+        fitted = [first] + fitted
+        self.statistics_ = {i: imp for i, imp in enumerate(fitted, 1)}
         return self
 
+    def _transform_sequential(self, X, mask):
+        """Private generator to transform each imputation in turn.
+
+        Imputations are made lazily, after `transform` returns, so each one
+        is given the `mask` of X from validation rather than validating X.
+        """
+        for i, imp in self.statistics_.items():
+            yield i, imp._transform(X, mask=mask)
+
+    def _transform_parallel(self, X, mask, workers, budget):
+        """Private generator to transform each imputation on a process pool.
+
+        Transformations are submitted when the generator is first consumed.
+        Imputed datasets are then yielded in order as they become available.
+        Each worker transforms within its `budget` of cores.
+        """
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [(i, executor.submit(_transform_imputer, imp, X, mask,
+                                           budget))
+                       for i, imp in self.statistics_.items()]
+            for i, future in futures:
+                yield i, future.result()
+
+    def _transform_compact(self, X, mask, workers, budget):
+        """Private method to impute X into a MultiplyImputedData.
+
+        Each imputation imputes a copy of X in turn, or in a worker process,
+        and only its values at the missing rows are kept.
+        """
+        rows = {c: np.flatnonzero(mask.column(c)) for c in self._strats}
+        rows = {c: r for c, r in rows.items() if len(r)}
+        data = MultiplyImputedData(X, rows)
+        if workers == 1:
+            for i, imp in self.statistics_.items():
+                data.add(i, _imputed_values(imp, X, rows, mask))
+            return data
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [(i, executor.submit(_imputed_values, imp, X, rows,
+                                           mask, budget))
+                       for i, imp in self.statistics_.items()]
+            for i, future in futures:
+                data.add(i, future.result())
+        return data
+
+    @check_dataset
     @check_nan_columns
     def transform(self, X):
         """Impute each column within a DataFrame using fit imputation methods.
@@ -200,10 +385,13 @@ class MultipleImputer(BaseImputer, BaseEstimator, TransformerMixin):
         and transform in one sweep (in the case of transductive).
 
         Args:
-            X (pd.DataFrame): fit DataFrame to impute.
+            X (pd.DataFrame, str, pyarrow.dataset.Dataset): fit DataFrame
+                to impute, or a Parquet path or Arrow dataset.
 
         Returns:
-            X (pd.DataFrame): imputed in place or copy of original.
+            iter: tuples of imputation number and imputed copy of X, as a
+                generator or list (`return_list`). MultiplyImputedData if
+                `compact`.
 
         Raises:
             ValueError: same columns must appear in fit and transform.
@@ -213,19 +401,79 @@ class MultipleImputer(BaseImputer, BaseEstimator, TransformerMixin):
         self._transform_strategy_validator()
 
         # make it easy to access the location of the imputed values
-        self.imputed_ = {}
-        for column in self._strats.keys():
-            imp_ix = X[column][X[column].isnull()].index
-            self.imputed_[column] = imp_ix.tolist()
+        mask = _missing_mask(X)
+        self.imputed_ = {c: X.index[mask.column(c)].tolist()
+                         for c in self._strats}
+
+        # store the DataFrame once and only the imputed values if compact
+        workers, budget = self._workers(self.n)
+        if self.compact:
+            return self._transform_compact(X, mask, workers, budget)
 
         # right now, return a generator by default
-        # sequential only for now
-        imputed = ((i[0], i[1].transform(X))
-                   for i in self.statistics_.items())
+        # sequential unless n_jobs requests a process pool
+        if workers == 1:
+            imputed = self._transform_sequential(X, mask)
+        else:
+            imputed = self._transform_parallel(X, mask, workers, budget)
         if self.return_list:
             imputed = list(imputed)
         return imputed
 
+    def transform_chunks(self, chunks):
+        """Impute each DataFrame in an iterable of chunks `n` times.
+
+        Chunks are imputed one at a time by each imputation, in the current
+        process, and the `n` imputed copies of each chunk are yielded before
+        the next chunk is read. See SingleImputer.transform_chunks.
+
+        Args:
+            chunks (iter): DataFrames with the same columns as fit.
+
+        Yields:
+            list: tuples of imputation number and imputed copy of a chunk.
+        """
+        self._transform_strategy_validator()
+        self.statistics_[1]._warn_transductive()
+        imputers = self.statistics_.items()
+        rngs = {i: imp._column_rngs() for i, imp in imputers}
+        for chunk in chunks:
+            yield [(i, imp._transform_chunk(chunk, rngs[i]))
+                   for i, imp in imputers]
+
+    def transform_dataset(self, source, dest):
+        """Impute a Parquet file or Arrow dataset `n` times by row group.
+
+        Each row group is read once, then imputed by every imputation and
+        written to the Parquet file of that imputation. Row groups are read
+        and imputed on a process pool if n_jobs requests one. See
+        SingleImputer.transform_dataset.
+
+        Args:
+            source (str, pyarrow.dataset.Dataset): Parquet path or dataset
+                with the columns fit.
+            dest (str): path of the Parquet files to write, with an `{i}`
+                field for the imputation number, e.g. "imputed_{i}.parquet".
+
+        Returns:
+            list: tuples of imputation number and path of the file written.
+
+        Raises:
+            ValueError: dest must have an `{i}` field.
+        """
+        self._transform_strategy_validator()
+        if "{i}" not in dest:
+            err = "dest must have an {i} field for each imputation."
+            raise ValueError(err)
+        self.statistics_[1]._warn_transductive()
+        columns = self._dataset_columns(dataset_columns(source))
+        imputers = list(self.statistics_.values())
+        groups = _transform_row_groups(imputers, source, columns, self.n_jobs)
+        dests = [dest.format(i=i) for i in self.statistics_]
+        return list(zip(self.statistics_, write_parquet(groups, dests)))
+
+    @check_dataset
     def fit_transform(self, X, y=None):
         """Convenience method to fit then transform the same dataset."""
-        return self.fit(X, y).transform(X)
+        with _validation_scope():
+            return self.fit(X, y).transform(X)
@@ -4,19 +4,75 @@ This module contains one class - the SingleImputer. Use this class to
 impute each Series within a DataFrame one time. This class makes numerous
 imputation methods available - both univariate and multivatiate. Each method
 runs once on its specified column. When one pass through the columns is
-complete, the SingleImputer returns the single imputed dataset.
+complete, the SingleImputer returns the single imputed dataset. If n_iter > 1,
+further passes impute predictive columns again from the latest imputations of
+their predictors (chained equations), until the imputations converge.
 """
 
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.utils.validation import check_is_fitted
 from autoimpute.utils import check_nan_columns, check_predictors_fit
-from autoimpute.utils import check_strategy_fit
-from autoimpute.utils.helpers import _one_hot_encode
-from autoimpute.imputations.helpers import _get_observed
+from autoimpute.utils import check_strategy_fit, check_data_structure
+from autoimpute.utils.checks import _forget_validation, _missing_mask
+from autoimpute.utils.checks import _validation_scope
+from autoimpute.utils.datasets import check_dataset, dataset_columns
+from autoimpute.utils.datasets import row_groups, read_row_group
+from autoimpute.utils.datasets import write_parquet
+from autoimpute.utils.resources import core_budget, current_budget
+from autoimpute.utils.helpers import _design_matrix, _encode_column
+from autoimpute.imputations import method_names
+from autoimpute.imputations.helpers import _spawn_rngs, _chain_stats
+from autoimpute.imputations.helpers import _child_seed
+from autoimpute.imputations.helpers import _block_params, BLOCK_STRATEGIES
 from .base_imputer import BaseImputer
 from ..series import DefaultUnivarImputer
+methods = method_names
+
+# strategies that impute from neighboring rows, so depend on chunk boundaries
+TRANSDUCTIVE_STRATEGIES = (
+    methods.DEFAULT_TIME, methods.INTERPOLATE, methods.LOCF, methods.NOCB
+)
+
+def _design_positions(enc, preds):
+    """Private method to get design matrix positions of encoded predictors."""
+    return np.concatenate([np.empty(0, dtype=int)] + [enc[p] for p in preds])
+
+def _transform_row_group(imputers, group, i, columns, budget=None):
+    """Private method to read and impute row group `i` of a dataset.
+
+    Runs in a worker process. `group` locates the row group to read (see
+    `row_groups`). Each imputer draws from the streams of its columns for
+    row group i, so results do not depend on the workers.
+    """
+    with core_budget(budget):
+        X = read_row_group(group, columns)
+        return [imp.transform_row_group(X, i) for imp in imputers]
+
+def _transform_row_groups(imputers, source, columns, n_jobs=1):
+    """Private generator to impute each row group of a dataset in order.
+
+    Row groups are read and imputed sequentially, or on a process pool if
+    n_jobs requests one. Workers share the cores of the current budget.
+    Yields the imputed copies of each row group, one per imputer.
+    """
+    groups = row_groups(source)
+    budget = current_budget()
+    requested = budget.n_cores if n_jobs == -1 else n_jobs
+    workers, budget = budget.split(min(requested, max(1, len(groups))))
+    if workers == 1:
+        for i, group in enumerate(groups):
+            yield _transform_row_group(imputers, group, i, columns)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_transform_row_group, imputers, group,
+                                   i, columns, budget)
+                   for i, group in enumerate(groups)]
+        for future in futures:
+            yield future.result()
 
 # pylint:disable=attribute-defined-outside-init
 # pylint:disable=arguments-differ
@@ -45,7 +101,8 @@ class SingleImputer(BaseImputer, BaseEstimator, TransformerMixin):
     """
 
     def __init__(self, strategy="default predictive", predictors="all",
-                 imp_kwgs=None, copy=True, seed=None, visit="default"):
+                 imp_kwgs=None, copy=True, seed=None, visit="default",
+                 n_iter=1, tol=1e-2):
         """Create an instance of the SingleImputer class.
 
         As with sklearn classes, all arguments take default values. Therefore,
@@ -69,8 +126,21 @@ class SingleImputer(BaseImputer, BaseEstimator, TransformerMixin):
                 `imp_kwgs` is ignored.
             copy (bool, optional): create copy of DataFrame or operate inplace.
                 Default value is True. Copy created.
-            seed (int, optional): seed setting for reproducible results.
-                Defualt is None. No validation, but values should be integer.
+            seed (int, SeedSequence, optional): seed setting for reproducible
+                results. Defualt is None. Each column receives its own numpy
+                random Generator spawned from the seed, so results do not
+                depend on (or alter) numpy's global random state.
+            n_iter (int, optional): max number of sweeps over the columns.
+                Default is 1, which imputes each column once. If greater,
+                sweeps after the first impute predictive columns again from
+                the latest imputations of their predictors, refitting their
+                models in fit (chained equations, or MICE).
+            tol (float, optional): tolerance of chained sweeps. Default is
+                0.01. After each sweep, the mean and std. deviation (scaled
+                by the observed std. deviation) or level shares of each
+                column's imputations are compared to the last sweep. A
+                column is imputed again only if one of its predictors
+                changed by more than `tol`, and sweeps stop once none did.
         """
         BaseImputer.__init__(
             self,
@@ -82,6 +152,38 @@ class SingleImputer(BaseImputer, BaseEstimator, TransformerMixin):
         self.predictors = predictors
         self.copy = copy
         self.seed = seed
+        self.n_iter = n_iter
+        self.tol = tol
+
+    @property
+    def n_iter(self):
+        """Property getter to return the value of the n_iter property."""
+        return self._n_iter
+
+    @n_iter.setter
+    def n_iter(self, n_):
+        """Validate the n_iter property to ensure it's Type and Value.
+
+        Args:
+            n_ (int): n_iter passed as arg to class instance.
+
+        Raises:
+            TypeError: n_iter must be an integer.
+            ValueError: n_iter must be greater than zero.
+        """
+
+        # deal with type first
+        if not isinstance(n_, int):
+            err = "n_iter must be an integer specifying max number of sweeps."
+            raise TypeError(err)
+
+        # then check the value is greater than zero
+        if n_ < 1:
+            err = "n_iter > 0. Cannot perform fewer than 1 sweep."
+            raise ValueError(err)
+
+        # otherwise set the property value for n_iter
+        self._n_iter = n_
 
     def _fit_strategy_validator(self, X):
         """Private method to validate strategies appropriate for fit.
@@ -95,6 +197,53 @@ class SingleImputer(BaseImputer, BaseEstimator, TransformerMixin):
         self._strats = check_strategy_fit(self.strategy, cols)
         self._preds = check_predictors_fit(self.predictors, cols)
 
+        # order columns by the visit sequence. monotone visits predict from
+        # earlier columns, which are observed wherever a column is observed
+        order = self._visit_order(X)
+        self._strats = {c: self._strats[c] for c in order if c in self._strats}
+        if self.visit == "monotone":
+            self._preds = dict(self._preds)
+            for i, column in enumerate(order):
+                if self._preds.get(column) == "all":
+                    self._preds[column] = order[:i]
+
+            # the first column has no earlier columns to predict from
+            first = order[0]
+            predictive = self._strats.get(first) in self.predictive_strategies
+            if predictive and not self._preds.get(first):
+                if X[first].isnull().any():
+                    warnings.warn(f"{first} is visited first, so has no "
+                                  "predictors. Using default univariate.")
+
+    def _column_rngs(self):
+        """Private method to spawn an independent random stream per column.
+
+        Streams are a deterministic function of `seed` and column position,
+        so fit and transform are reproducible in any thread or process.
+        """
+        cols = list(self._strats.keys())
+        return dict(zip(cols, _spawn_rngs(self.seed, len(cols))))
+
+    def _pred_cols(self, column, X):
+        """Private method to get the predictors used to impute a column."""
+        preds = self._preds[column]
+        if preds == "all":
+            return [c for c in X.columns if c != column]
+        return list(preds)
+
+    def _design(self, X, levels=None):
+        """Private method to encode all predictors of X once for every model.
+
+        Only columns that predict some column are encoded. Each predictive
+        model then selects its predictors by position from the one design.
+        """
+        used = set()
+        for column, method in self._strats.items():
+            if method in self.predictive_strategies:
+                used.update(self._pred_cols(column, X))
+        cols = [c for c in X.columns if c in used]
+        return _design_matrix(X[cols], levels)
+
     def _transform_strategy_validator(self, X):
         """Private method to prep and validate before transformation."""
 
@@ -107,6 +256,7 @@ class SingleImputer(BaseImputer, BaseEstimator, TransformerMixin):
             err = "Same columns that were fit must appear in transform."
             raise ValueError(err)
 
+    @check_dataset
     @check_nan_columns
     def fit(self, X, y=None):
         """Fit specified imputation methods to each column within a DataFrame.
@@ -121,7 +271,10 @@ class SingleImputer(BaseImputer, BaseEstimator, TransformerMixin):
         used, so fit each column that appears in the given strategies.
 
         Args:
-            X (pd.DataFrame): pandas DataFrame on which imputer is fit.
+            X (pd.DataFrame, str, pyarrow.dataset.Dataset): pandas DataFrame
+                on which imputer is fit, or a Parquet path or Arrow dataset.
+                Datasets are read into memory, but only the columns named in
+                `strategy` and `predictors` are read.
             y (pd.Series, pd.DataFrame Optional): response. Default is None.
                 Determined interally in fit method. Arg is present to remain
                 compatible with sklearn Pipelines.
@@ -136,28 +289,54 @@ class SingleImputer(BaseImputer, BaseEstimator, TransformerMixin):
                 `check_predictors_fit`. See its docstrings for more info.
         """
 
+        return self._fit(X)
+
+    def _fit(self, X, shared=None):
+        """Private method to fit each column, reusing any `shared` imputers.
+
+        The MultipleImputer passes imputers it has already fit for columns
+        whose fit is deterministic. Those columns are not fit again.
+        """
+
         # first, prep columns we plan to use and make sure they are valid
         self._fit_strategy_validator(X)
         self.statistics_ = {}
+        if shared is None:
+            shared = {}
+
+        # fit univariate strategies for all columns at once, by block
+        blocks = self._fit_univariate_blocks(X, shared)
+
+        # encode predictors once, and find where each column is missing
+        design, names, enc, self._levels = self._design(X)
+        mask = _missing_mask(X)
 
         # perform fit on each column, depending on that column's strategy
         # note that right now, operations are COLUMN-by-COLUMN, iteratively
-        if self.seed is not None:
-            np.random.seed(self.seed)
+        rngs = self._column_rngs()
         for column, method in self._strats.items():
-            imp = self.strategies[method]
-            imp_params = self._fit_init_params(column, method, self.imp_kwgs)
-
-            # try to create an instance of the imputer, given the args
-            try:
-                if imp_params is None:
-                    imputer = imp()
-                else:
-                    imputer = imp(**imp_params)
-            except TypeError as te:
-                name = imp.__name__
-                err = f"Invalid arguments passed to {name} __init__ method."
-                raise ValueError(err) from te
+
+            # reuse the imputer if another imputation already fit it
+            if column in shared:
+                self.statistics_[column] = shared[column]
+                continue
+
+            # use the imputer if it was already fit with its block
+            if column in blocks:
+                blocks[column].rng = rngs[column]
+                self.statistics_[column] = blocks[column]
+                continue
+
+            # predictive methods without predictors fall back to univariate
+            if (method in self.predictive_strategies
+                    and not self._pred_cols(column, X)):
+                imputer = DefaultUnivarImputer()
+                imputer.rng = rngs[column]
+                self.statistics_[column] = imputer.fit(X[column], None)
+                continue
+
+            imputer = self._init_imputer(column, method)
+            imputer.rng = rngs[column]
 
             # identify the column for imputation
             ys = X[column]
@@ -168,25 +347,146 @@ class SingleImputer(BaseImputer, BaseEstimator, TransformerMixin):
                 imputer.fit(ys, None)
 
             # now, fit on predictive methods, which are more complex.
+            # predictors are selected from the encoded design by position.
             if method in self.predictive_strategies:
-                preds = self._preds[column]
-                if preds == "all":
-                    xs = X.drop(column, axis=1)
-                else:
-                    xs = X[preds]
+                preds = self._pred_cols(column, X)
+                ix = _design_positions(enc, preds)
 
                 # fit the data on observed values only.
-                x_, y_ = _get_observed(xs, ys)
-
-                # before imputing, need to encode categoricals
-                x_ = _one_hot_encode(x_)
-
-                imputer.fit(x_, y_)
+                obs = mask.complete_rows(preds + [column])
+                x_ = pd.DataFrame(
+                    design[np.ix_(obs, ix)],
+                    columns=[names[i] for i in ix],
+                    index=X.index[obs]
+                )
+                imputer.fit(x_, ys[obs])
 
             # finally, store imputer for each column as statistics
             self.statistics_[column] = imputer
+
+        # chained equations refit predictive columns on imputed predictors
+        if self.n_iter > 1:
+            self._impute_sweeps(X.copy(), mask, rngs, refit=True)
         return self
 
+    @check_data_structure
+    def partial_fit(self, X, y=None):
+        """Update the imputer of each column with a chunk of a DataFrame.
+
+        Univariate strategies that fit on a sketch of the observed values
+        (mean, median, norm, mode, categorical, random) can be fit one chunk
+        at a time, e.g. from `pd.read_csv(chunksize=...)`, and imputers fit
+        on separate chunks can be combined with `merge`. The first call, or
+        the first call after `fit`, starts new imputers.
+
+        Args:
+            X (pd.DataFrame): chunk of the DataFrame to fit the imputer.
+            y (None): ignored. Present to remain compatible with sklearn.
+
+        Returns:
+            self: instance of the SingleImputer class.
+
+        Raises:
+            ValueError: strategy of each column must support partial_fit.
+        """
+        if not self._partial_fitted():
+            self._fit_strategy_validator(X)
+            unsupported = {c: m for c, m in self._strats.items()
+                           if m not in BLOCK_STRATEGIES}
+            if unsupported:
+                err = f"partial_fit only supports {BLOCK_STRATEGIES}. "
+                raise ValueError(f"{err}Got {unsupported}.")
+            self._levels = {}
+            rngs = self._column_rngs()
+            self.statistics_ = {}
+            for column, method in self._strats.items():
+                imputer = self._init_imputer(column, method)
+                imputer.rng = rngs[column]
+                self.statistics_[column] = imputer
+        for column, imputer in self.statistics_.items():
+            imputer.partial_fit(X[column])
+        return self
+
+    def merge(self, other):
+        """Merge the imputers of another SingleImputer fit by partial_fit.
+
+        Args:
+            other (SingleImputer): imputer with the same columns and
+                strategies, fit on other chunks with `partial_fit`.
+
+        Returns:
+            self: instance of the SingleImputer class.
+
+        Raises:
+            ValueError: both imputers must be fit with partial_fit.
+            ValueError: both imputers must have the same strategies.
+        """
+        if not (self._partial_fitted() and other._partial_fitted()):
+            raise ValueError("Both imputers must be fit with partial_fit.")
+        if self._strats != other._strats:
+            raise ValueError("Both imputers must have the same strategies.")
+        for column, imputer in self.statistics_.items():
+            imputer.merge(other.statistics_[column])
+        return self
+
+    def _partial_fitted(self):
+        """Private method to check if every imputer was fit by partial_fit."""
+        stats = getattr(self, "statistics_", None)
+        if not stats:
+            return False
+        return all(getattr(imp, "sketch_", None) is not None
+                   for imp in stats.values())
+
+    def _fit_univariate_blocks(self, X, shared):
+        """Private method to fit univariate strategies across the DataFrame.
+
+        Columns that share a univariate strategy are fit together, using one
+        vectorized reduction over their 2-D block rather than a Series scan
+        and an imputer fit per column. Returns fit imputers keyed by column.
+        """
+        blocks = {}
+        for column, method in self._strats.items():
+            if method in BLOCK_STRATEGIES and column not in shared:
+                blocks.setdefault(method, []).append(column)
+
+        # compute the params for each block, then hand to each imputer
+        fit = {}
+        for method, cols in blocks.items():
+            params = _block_params(method, X[cols])
+            for column in cols:
+                imputer = self._init_imputer(column, method)
+                imputer.statistics_ = {
+                    "param": params[column],
+                    "strategy": imputer.strategy
+                }
+                fit[column] = imputer
+        return fit
+
+    def _constant_fills(self, missing):
+        """Private method to get fill values for constant univariate imputers.
+
+        Mean, median and (non-random) mode imputers fill every missing value
+        in a column with one value. Consecutive such columns in the visit
+        order are filled with a single vectorized write (see
+        `_fill_constants`) rather than one write per column.
+        """
+        fills = {}
+        for column, imputer in self.statistics_.items():
+            if not missing[column].size:
+                continue
+            strat = imputer.strategy
+            if strat in (methods.MEAN, methods.MEDIAN):
+                fills[column] = imputer.statistics_["param"]
+            if strat == methods.MODE:
+                modes = imputer.statistics_["param"]
+                fs = imputer.fill_strategy
+                if fs in (None, "first") or len(modes) == 1:
+                    fills[column] = modes[0]
+                elif fs == "last":
+                    fills[column] = modes[-1]
+        return fills
+
+    @check_dataset
     @check_nan_columns
     def transform(self, X):
         """Impute each column within a DataFrame using fit imputation methods.
@@ -197,7 +497,9 @@ class SingleImputer(BaseImputer, BaseEstimator, TransformerMixin):
         and transform in one sweep (in the case of transductive).
 
         Args:
-            X (pd.DataFrame): DataFrame to impute (same as fit or new data).
+            X (pd.DataFrame, str, pyarrow.dataset.Dataset): DataFrame to
+                impute (same as fit or new data), or a Parquet path or Arrow
+                dataset, of which the columns fit are read.
 
         Returns:
             X (pd.DataFrame): imputed in place or copy of original.
@@ -206,70 +508,321 @@ class SingleImputer(BaseImputer, BaseEstimator, TransformerMixin):
             ValueError: same columns must appear in fit and transform.
                 Raised through _transform_strategy_validator.
         """
+        return self._transform(X)
+
+    def transform_chunks(self, chunks):
+        """Impute each DataFrame in an iterable of chunks, one at a time.
+
+        Chunks (e.g. from `pd.read_csv(chunksize=...)`) are imputed with the
+        models from fit and yielded in order, so only one chunk needs to be
+        in memory at a time. Each column keeps drawing from one random stream
+        across chunks. Inductive strategies give the same imputations as a
+        transform of the whole frame, up to the order of random draws.
+        Transductive strategies (interpolation, locf, nocb) only see the
+        rows of each chunk, so a warning is raised if any are used.
+
+        Args:
+            chunks (iter): DataFrames with the same columns as fit.
+
+        Yields:
+            pd.DataFrame: each chunk, imputed in place or as a copy.
+
+        Raises:
+            TypeError: each chunk must be a DataFrame.
+            ValueError: same columns must appear in fit and transform.
+        """
+        check_is_fitted(self, "statistics_")
+        self._warn_transductive()
+        rngs = self._column_rngs()
+        for chunk in chunks:
+            yield self._transform_chunk(chunk, rngs)
+
+    def transform_dataset(self, source, dest, n_jobs=1):
+        """Impute a Parquet file or Arrow dataset one row group at a time.
+
+        Only the columns named in `strategy` and `predictors` are read. Each
+        row group is read, imputed like a chunk (see `transform_chunks`) and
+        written as a row group of the Parquet file `dest`, in order. Row
+        groups are read and imputed on a process pool if n_jobs requests
+        one. Each row group draws from its own random streams, derived from
+        `seed`, so the output does not depend on n_jobs.
+
+        Args:
+            source (str, pyarrow.dataset.Dataset): Parquet path or dataset
+                with the columns fit.
+            dest (str): path of the Parquet file to write. It holds the
+                columns read, imputed.
+            n_jobs (int, optional): processes used to read and impute row
+                groups. Default is 1. -1 uses all cores of the budget.
+
+        Returns:
+            str: path of the Parquet file written.
+
+        Raises:
+            ValueError: same columns must appear in fit and transform.
+        """
+        check_is_fitted(self, "statistics_")
+        self._warn_transductive()
+        columns = self._dataset_columns(dataset_columns(source))
+        groups = _transform_row_groups([self], source, columns, n_jobs)
+        return write_parquet(groups, [dest])[0]
+
+    def transform_row_group(self, X, group):
+        """Impute row group `group` of a dataset, read as a DataFrame.
+
+        The row group is imputed like a chunk (see `transform_chunks`),
+        drawing from random streams of its own, derived from `seed` and
+        `group`. So each row group is imputed the same way whichever
+        process reads it, or whether the others are imputed at all.
+
+        Args:
+            X (pd.DataFrame): row group with the columns fit.
+            group (int): position of the row group in the dataset.
+
+        Returns:
+            pd.DataFrame: imputed row group.
+        """
+        check_is_fitted(self, "statistics_")
+        return self._transform_chunk(X, self._group_rngs(group))
+
+    def _group_rngs(self, group):
+        """Private method to spawn the column streams of a row group.
+
+        The streams of row group g are children of the `seed`'s child
+        len(columns) + g, so they never overlap the streams of columns.
+        """
+        cols = list(self._strats.keys())
+        seed = _child_seed(self.seed, len(cols) + group)
+        return dict(zip(cols, _spawn_rngs(seed, len(cols))))
+
+    def _warn_transductive(self):
+        """Private method to warn that transductive strategies are chunked."""
+        trans = [c for c, imp in self.statistics_.items()
+                 if imp.strategy in TRANSDUCTIVE_STRATEGIES]
+        if trans:
+            warnings.warn(f"{trans} imputed within each chunk only.")
+
+    @check_data_structure
+    def _transform_chunk(self, X, rngs):
+        """Private method to impute a chunk, continuing the `rngs` streams.
+
+        Chunks are not checked for fully missing columns, as a column can be
+        missing throughout a chunk but not the whole dataset.
+        """
+        with _validation_scope():
+            return self._transform(X, rngs)
+
+    def _transform(self, X, rngs=None, mask=None):
+        """Private method to impute X, which has already been validated.
+
+        The MultipleImputer validates X once, then calls this method directly
+        for each of its imputations with the `mask` of X from validation.
+        Random draws start new streams for each column unless `rngs` to
+        continue are given.
+        """
+
+        # record where values are missing before any imputations are made
+        # the mask of X from validation is reused, before X is copied
+        if mask is None:
+            mask = _missing_mask(X)
 
         # copy the dataset if necessary, then prep predictors
         if self.copy:
             X = X.copy()
         self._transform_strategy_validator(X)
+        if rngs is None:
+            rngs = self._column_rngs()
+        missing = self._impute_sweeps(X, mask, rngs)
+        self.imputed_ = {c: X.index[r].tolist() for c, r in missing.items()}
+
+        # X has changed, so any validation cached for it no longer holds
+        _forget_validation(X)
+        return X
+
+    def _impute_sweeps(self, X, mask, rngs, refit=False):
+        """Private method to impute X in place, in one or more sweeps.
+
+        The first sweep imputes each column once, in order. With n_iter > 1,
+        chained sweeps follow (see `_chain`), which refit predictive columns
+        on the latest imputations if `refit`. Returns the rows where each
+        column is missing.
+        """
+        missing = {c: np.flatnonzero(mask.column(c)) for c in self.statistics_}
+
+        # encode predictors once, using the categorical levels seen in fit
+        coded = self._design(X, self._levels)[:3]
 
-        # transformation logic
-        self.imputed_ = {}
-        if self.seed is not None:
-            np.random.seed(self.seed)
+        # transformation logic, in visit order
+        # runs of constant univariate columns are filled in one write
+        fills = self._constant_fills(missing)
+        imputed, run = set(), {}
         for column, imputer in self.statistics_.items():
-            imp_ix = X[column][X[column].isnull()].index
-            self.imputed_[column] = imp_ix.tolist()
+            imputer.rng = rngs[column]
 
             # continue if there are no imputations to make
-            if imp_ix.empty:
+            if not missing[column].size:
                 continue
+            if column in fills:
+                run[column] = fills[column]
+                continue
+            self._fill_constants(X, run, missing, coded)
+            imputed.update(run)
+            run = {}
+            self._impute_column(X, column, missing[column], coded, mask,
+                                imputed)
+            imputed.add(column)
+        self._fill_constants(X, run, missing, coded)
+
+        # then sweep again over predictive columns until imputations settle
+        self.n_iter_ = 1
+        if self.n_iter > 1:
+            self._chain(X, mask, missing, coded, refit)
+        return missing
+
+    def _fill_constants(self, X, fills, missing, coded):
+        """Private method to fill constant columns of X in one write.
+
+        The design is updated with the fills, so columns imputed later are
+        predicted from them, as if each column were imputed in turn.
+        """
+        if not fills:
+            return
+        X.fillna(fills, inplace=True)
+        design, _, enc = coded
+        for column in fills:
+            if column in enc:
+                rows = missing[column]
+                encoded, _, _ = _encode_column(
+                    X[column].iloc[rows], self._levels.get(column, None)
+                )
+                design[np.ix_(rows, enc[column])] = encoded
+
+    def _impute_column(self, X, column, rows, coded, mask, imputed):
+        """Private method to impute the missing `rows` of a column of X.
+
+        Predictors not yet `imputed` get a default univariate imputation
+        first. The design is updated with the imputations, so columns
+        imputed later are predicted from them.
+        """
+        design, names, enc = coded
+        imputer = self.statistics_[column]
+        imp_ix = X.index[rows]
+
+        # implement transform logic for univariate
+        if imputer.strategy in self.univariate_strategies:
+            x_ = X[column]
+
+        # implement transform logic for predictive
+        # isolate missingness, selecting predictors from the design
+        if imputer.strategy in self.predictive_strategies:
+            preds = self._pred_cols(column, X)
+            ix = _design_positions(enc, preds)
+            x_ = pd.DataFrame(
+                design[np.ix_(rows, ix)],
+                columns=[names[i] for i in ix],
+                index=imp_ix
+            )
+
+            # default univariate impute for missing covariates
+            still = [p for p in preds if p not in imputed]
+            mis_cov = mask.to_array(still)[rows].any(axis=0)
+            for col in np.array(still, dtype=object)[mis_cov]:
+                d = DefaultUnivarImputer()
+                d.rng = imputer.rng
+                d_imps = d.fit_impute(X.loc[imp_ix, col], None)
+                x_col = X.loc[imp_ix, col].copy()
+                x_col[x_col.isnull()] = d_imps
+                encoded, enc_names, _ = _encode_column(
+                    x_col, self._levels.get(col, None)
+                )
+                if enc_names:
+                    x_[enc_names] = encoded
+
+        # perform imputation given the specified imputer and value for x_
+        X.loc[imp_ix, column] = imputer.impute(x_)
+
+        # keep the design current for columns imputed later
+        if column in enc:
+            encoded, _, _ = _encode_column(
+                X.loc[imp_ix, column], self._levels.get(column, None)
+            )
+            design[np.ix_(rows, enc[column])] = encoded
+
+    def _refit_column(self, X, column, coded, mask):
+        """Private method to refit a predictive column on imputed predictors.
+
+        The column's imputer is fit again on every row where the column is
+        observed, using the latest imputations of its predictors.
+        """
+        design, names, enc = coded
+        old = self.statistics_[column]
+        imputer = self._init_imputer(column, self._strats[column])
+        imputer.rng = old.rng
+        ix = _design_positions(enc, self._pred_cols(column, X))
+        obs = ~mask.column(column)
+        x_ = pd.DataFrame(
+            design[np.ix_(obs, ix)],
+            columns=[names[i] for i in ix],
+            index=X.index[obs]
+        )
+        self.statistics_[column] = imputer.fit(x_, X.loc[obs, column])
 
-            # implement transform logic for univariate
-            if imputer.strategy in self.univariate_strategies:
-                x_ = X[column]
-
-            # implement transform logic for predictive
-            if imputer.strategy in self.predictive_strategies:
-                preds = self._preds[column]
-                if preds == "all":
-                    x_ = X.drop(column, axis=1)
-                else:
-                    x_ = X[preds]
-
-                # isolate missingness
-                if isinstance(x_, pd.Series):
-                    x_ = x_.to_frame()
-                    x_ = x_.loc[imp_ix]
-                else:
-                    x_ = x_.loc[imp_ix, :]
-
-                # default univariate impute for missing covariates
-                mis_cov = pd.isnull(x_).sum()
-                mis_cov = mis_cov[mis_cov > 0]
-                if any(mis_cov):
-                    x_m = mis_cov.index
-                    for col in x_m:
-                        d = DefaultUnivarImputer()
-                        d_imps = d.fit_impute(x_[col], None)
-                        x_null = x_[col][x_[col].isnull()].index
-                        x_.loc[x_null, col] = d_imps
-
-                # handling encoding again for prediction of imputations
-                x_ = _one_hot_encode(x_)
-
-            # perform imputation given the specified imputer and value for x_
-            X.loc[imp_ix, column] = imputer.impute(x_)
-        return X
+    def _chain(self, X, mask, missing, coded, refit):
+        """Private method to run chained equation sweeps over X in place.
 
+        Each sweep imputes a predictive column again, refitting it first if
+        `refit`, only if one of its predictors changed by more than `tol` in
+        the last sweep. Changes are measured with `_chain_stats` of each
+        column's imputations. Sweeps stop once no column changed by more
+        than `tol`, or after `n_iter` sweeps. Sweeps run are in `n_iter_`.
+        """
+        chained = [
+            c for c, imp in self.statistics_.items()
+            if missing[c].size and imp.strategy in self.predictive_strategies
+        ]
+        observed = {c: X[c][~mask.column(c)] for c in chained}
+        stats = {
+            c: _chain_stats(X[c].iloc[missing[c]], observed[c])
+            for c in chained
+        }
+
+        # every column imputed in the first sweep has changed
+        changed = {c for c in self.statistics_ if missing[c].size}
+        sweeps = 1
+        while sweeps < self.n_iter and changed:
+            for column in chained:
+                if changed.isdisjoint(self._pred_cols(column, X)):
+                    continue
+                if refit:
+                    self._refit_column(X, column, coded, mask)
+                self._impute_column(X, column, missing[column], coded, mask,
+                                    X.columns)
+            sweeps += 1
+
+            # track how much each column's imputations moved this sweep
+            latest = {
+                c: _chain_stats(X[c].iloc[missing[c]], observed[c])
+                for c in chained
+            }
+            changed = {
+                c for c in chained
+                if np.abs(latest[c] - stats[c]).max() > self.tol
+            }
+            stats = latest
+        self.n_iter_ = sweeps
+
+    @check_dataset
     def fit_transform(self, X, y=None):
         """Convenience method to fit then transform the same dataset.
 
         Args:
-            X (pd.DataFrame): DataFrame used for fit and transform steps.
+            X (pd.DataFrame, str, pyarrow.dataset.Dataset): DataFrame used
+                for fit and transform steps, or a dataset read once for both.
             y (pd.DataFrame, pd.Series, Optional): response. Default is None.
                 Set internally by `fit` method.
 
         Returns:
             X (pd.DataFrame): imputed in place or copy of original.
         """
-        return self.fit(X, y).transform(X)
+        with _validation_scope():
+            return self.fit(X, y).transform(X)
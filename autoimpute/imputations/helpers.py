@@ -1,9 +1,33 @@
 """Private helper methods for the imputations folder."""
 
 import logging
+import threading
 import numpy as np
 import pandas as pd
+import pymc3 as pm
+from scipy.linalg import cho_solve, solve_triangular
+from scipy.special import expit
+from autoimpute.imputations import method_names
 from autoimpute.imputations.deletion import listwise_delete
+from autoimpute.imputations.errors import _not_num_matrix, _not_cat_matrix
+from autoimpute.utils.resources import _sampler_scope
+methods = method_names
+
+# ways to get the posterior of the pymc3 models used by imputers
+INFERENCE = ("nuts", "advi", "minibatch advi")
+
+# pymc3 models built on shared data, cached by likelihood and predictor count
+_PYMC3_MODELS = {}
+_PYMC3_MODELS_LOCK = threading.Lock()
+
+# terms in the truncated series used to draw Polya-Gamma variables
+PG_TERMS = 200
+
+# univariate strategies that can be fit with one pass over a 2-D block
+BLOCK_STRATEGIES = (
+    methods.MEAN, methods.MEDIAN, methods.NORM,
+    methods.MODE, methods.CATEGORICAL, methods.RANDOM
+)
 
 def _get_observed(predictors, series, verbose=False):
     """Private method to test datasets and get observed data."""
@@ -15,26 +39,478 @@ def _get_observed(predictors, series, verbose=False):
     series = predictors.pop(series.name)
     return predictors, series
 
-def _neighbors(x, n, df, choose):
-    al = len(df.index)
-    if n > al:
-        err = "# neighbors greater than # predictions. Reduce neighbor count."
-        raise ValueError(err)
-    indexarr = np.argpartition(abs(df["y_pred"] - x), n)[:n]
-    neighbs = df.loc[indexarr, "y"].values
-    return choose(neighbs)
+def _block_params(method, X):
+    """Private method to fit a univariate strategy to every column of X.
+
+    Computes the same `param` each univariate series imputer computes in its
+    `fit`, but with vectorized reductions over the whole 2-D block at once.
+    Returns a dictionary with key = column and value = param.
+    """
+    if method in (methods.MEAN, methods.MEDIAN, methods.NORM):
+        _not_num_matrix(method, X)
+    if method == methods.CATEGORICAL:
+        _not_cat_matrix(method, X)
+
+    # numerical moments and medians reduce down each column of the block
+    if method == methods.MEAN:
+        params = X.mean().to_dict()
+    if method == methods.MEDIAN:
+        params = X.median().to_dict()
+    if method == methods.NORM:
+        params = dict(zip(X.columns, zip(X.mean(), X.std())))
 
-def _local_residuals(x, n, df, choose):
-    al = len(df.index)
+    # mode pads columns with fewer modes with nan, so drop the padding
+    if method == methods.MODE:
+        modes = X.mode()
+        params = {c: modes[c].dropna().values for c in X.columns}
+
+    # stack the block once, dropping missing, then count within each column
+    if method == methods.CATEGORICAL:
+        props = X.stack().groupby(level=1).value_counts(normalize=True)
+        params = {c: props.xs(c, level=0) for c in X.columns}
+
+    # stack each dtype separately so numerical values are not upcast
+    if method == methods.RANDOM:
+        params = {}
+        for dtype in set(X.dtypes):
+            block = X.loc[:, (X.dtypes == dtype).values]
+            uniques = block.stack().groupby(level=1).unique()
+            params.update({c: list(uniques[c]) for c in block.columns})
+    return params
+
+def _donor_index(y, y_pred):
+    """Private method to sort observed donors by their prediction.
+
+    The index is built once at fit. Sorted predictions let every neighbor
+    search at impute time run as one `searchsorted` over the whole batch.
+    """
+    y_pred = np.asarray(y_pred, dtype=float)
+    order = np.argsort(y_pred, kind="mergesort")
+    return {"y": np.asarray(y)[order], "y_pred": y_pred[order]}
+
+def _nearest_donors(x, n, donors):
+    """Private method to find the n nearest donors to each prediction in x.
+
+    The n nearest donors to x lie within n positions of where x would be
+    inserted into the sorted donor predictions. A window of 2n candidates
+    is taken around each insertion point, then the n closest are selected.
+    Returns an array with one row of donor positions for each value of x.
+    """
+    pred = donors["y_pred"]
+    al = len(pred)
     if n > al:
         err = "# neighbors greater than # predictions. Reduce neighbor count."
         raise ValueError(err)
-    indexarr = np.argpartition(abs(df["y_pred"] - x), n)[:n]
-    neighbs = df.loc[indexarr, "y"].values
-    distances = df.loc[indexarr, "y_pred"].values - x
-    resids = neighbs + distances
+
+    # candidate windows of (up to) 2n donors around each insertion point
+    x = np.asarray(x, dtype=float)
+    width = min(2*n, al)
+    start = np.clip(np.searchsorted(pred, x) - n, 0, al - width)
+    window = start[:, None] + np.arange(width)
+    if width == n:
+        return window
+
+    # select the n closest candidates in each window
+    dist = np.abs(pred[window] - x[:, None])
+    closest = np.argpartition(dist, n-1, axis=1)[:, :n]
+    return np.take_along_axis(window, closest, axis=1)
+
+def _neighbors(x, n, donors, choose):
+    """Private method to choose observed values of the nearest donors."""
+    ix = _nearest_donors(x, n, donors)
+    return choose(donors["y"][ix])
+
+def _local_residuals(x, n, donors, choose):
+    """Private method to choose local residual draws of nearest donors."""
+    ix = _nearest_donors(x, n, donors)
+    distances = donors["y_pred"][ix] - np.asarray(x, dtype=float)[:, None]
+    resids = donors["y"][ix] + distances
     return choose(resids)
 
+def _row_mean(values):
+    """Private method to take the mean of each row of neighbor values."""
+    return values.mean(axis=1)
+
+def _row_choice(rng):
+    """Private method to get a function that draws one value from each row."""
+    def choose(values):
+        rows = np.arange(values.shape[0])
+        return values[rows, rng.integers(values.shape[1], size=len(rows))]
+    return choose
+
+def _chain_stats(imputed, observed):
+    """Private method to summarize a column's imputations after a sweep.
+
+    Numerical columns give the mean and standard deviation of the imputed
+    values, scaled by the standard deviation of the observed values. Other
+    columns give the share of imputations in each observed level.
+    """
+    if pd.api.types.is_numeric_dtype(observed):
+        scale = observed.std()
+        if not scale or np.isnan(scale):
+            scale = 1.0
+        values = np.asarray(imputed, dtype=float)
+        return np.array([values.mean(), values.std()]) / scale
+    levels = pd.unique(observed)
+    codes = pd.Categorical(imputed, categories=levels).codes
+    counts = np.bincount(codes[codes >= 0], minlength=len(levels))
+    return counts / len(codes)
+
+def _child_seed(seed, i):
+    """Private method to get the i-th child SeedSequence of a seed.
+
+    Children are derived with a fixed spawn key, so the same seed always
+    gives the same child i. A seed of None gives a fresh child.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        entropy, key = seed.entropy, seed.spawn_key
+    else:
+        entropy, key = np.random.SeedSequence(seed).entropy, ()
+    return np.random.SeedSequence(entropy, spawn_key=key+(i,))
+
+def _spawn_rngs(seed, n):
+    """Private method to create n independent random Generators from a seed.
+
+    Streams are derived from the seed's SeedSequence with a fixed spawn key,
+    so the same seed always produces the same n streams, no matter how many
+    times the method is called. A seed of None produces fresh streams.
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return [np.random.default_rng(_child_seed(seed, i)) for i in range(n)]
+
+def _rng_seed(rng):
+    """Private method to draw an integer seed from a Generator.
+
+    Used for libraries (pymc3, sklearn) that accept integer seeds only.
+    """
+    return int(rng.integers(2**31-1))
+
+def _pymc3_sample_kwargs(rng, sample_kwargs):
+    """Private method to seed pymc3 sampling from an imputer's Generator."""
+    kwargs = dict(sample_kwargs)
+    kwargs.setdefault("random_seed", _rng_seed(rng))
+    return kwargs
+
+def _check_inference(inference):
+    """Private method to validate the inference used for pymc3 models."""
+    if inference not in INFERENCE:
+        err = f"{inference} inference not supported. Use one of {INFERENCE}."
+        raise ValueError(err)
+
+def _pymc3_observed(imputer, X, y):
+    """Private method to get the data a pymc3 model is conditioned on.
+
+    For minibatch advi, X and y are replaced with minibatches drawn with the
+    same seed, so their rows stay aligned. The returned total scales the
+    likelihood of each batch up to the full number of observations.
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y)
+    if imputer.inference != "minibatch advi":
+        return X, y, None
+    seed = _rng_seed(imputer.rng)
+    size = min(imputer.batch_size, len(y))
+    batch = dict(batch_size=size, random_seed=seed, in_memory_size=len(y))
+    X_batch = pm.Minibatch(X, **batch)
+    y_batch = pm.Minibatch(y, **batch)
+    return X_batch, y_batch, len(y)
+
+def _pymc3_data(imputer, X, y, likelihood):
+    """Private method to get the data and priors a pymc3 model depends on.
+
+    Arrays have fixed dtypes and shapes that depend only on the number of
+    predictors, so they can be swapped into a cached model's containers.
+    """
+    X = np.asarray(X, dtype=float)
+    nc = X.shape[1]
+    data = {
+        "X": X,
+        "y": np.asarray(y, dtype=int if likelihood == "logistic" else float),
+        "am": np.asarray(imputer.am, dtype=float),
+        "asd": np.asarray(imputer.asd, dtype=float),
+        "bm": np.broadcast_to(imputer.bm, (nc,)).astype(float),
+        "bsd": np.broadcast_to(imputer.bsd, (nc,)).astype(float)
+    }
+    if likelihood == "normal":
+        data["sig"] = np.asarray(imputer.sig, dtype=float)
+    return data
+
+def _pymc3_build(likelihood, nc, data, total=None):
+    """Private method to build the pymc3 model of a bayesian regression.
+
+    If `total` is None, the data and priors are wrapped in pm.Data
+    containers, so the model can be reused with pm.set_data. Otherwise, X
+    and y are minibatches and the likelihood is scaled to `total` rows.
+    """
+    with pm.Model() as model:
+        if total is None:
+            d = {k: pm.Data(k, v) for k, v in data.items()}
+            kwargs = {}
+        else:
+            d, kwargs = data, {"total_size": total}
+        alpha = pm.Normal("alpha", d["am"], sd=d["asd"])
+        beta = pm.Normal("beta", d["bm"], sd=d["bsd"], shape=nc)
+        mu = alpha+beta.dot(d["X"].T)
+        if likelihood == "logistic":
+            p = pm.invlogit(mu)
+            pm.Bernoulli("score", p, observed=d["y"], **kwargs)
+        else:
+            sigma = pm.HalfCauchy("σ", d["sig"])
+            pm.Normal("score", mu, sd=sigma, observed=d["y"], **kwargs)
+    return model
+
+def _pymc3_model(imputer, X, y, likelihood="normal"):
+    """Private method to get the pymc3 model of an imputer's regression.
+
+    Models are cached by likelihood and number of predictors, so the graph
+    is built once and later fits only store their data to swap in with
+    `_pymc3_posterior`. Minibatch advi builds a new model on minibatches
+    and returns None for the data. `likelihood` is `normal` or `logistic`.
+    """
+    data = _pymc3_data(imputer, X, y, likelihood)
+    nc = data["X"].shape[1]
+    if imputer.inference == "minibatch advi":
+        data["X"], data["y"], total = _pymc3_observed(imputer, X, data["y"])
+        return _pymc3_build(likelihood, nc, data, total), None
+    key = (likelihood, nc)
+    with _PYMC3_MODELS_LOCK:
+        if key not in _PYMC3_MODELS:
+            model = _pymc3_build(likelihood, nc, data)
+            _pymc3_clear(model, data)
+            _PYMC3_MODELS[key] = (model, threading.Lock())
+        return _PYMC3_MODELS[key][0], data
+
+def _pymc3_clear(model, data):
+    """Private method to empty the X and y held by a cached pymc3 model.
+
+    Cached models live as long as the process, so their containers are
+    emptied once drawn from rather than keeping the last fit's rows.
+    """
+    pm.set_data({"X": data["X"][:0], "y": data["y"][:0]}, model=model)
+
+def _pymc3_posterior(imputer, model, data=None):
+    """Private method to draw from the posterior of an imputer's model.
+
+    With `nuts`, the posterior is sampled with MCMC. With `advi` and
+    `minibatch advi`, a mean-field approximation is fit with `pm.fit`,
+    stopping early once its parameters converge, and `sample` draws are
+    taken from the approximation. If `data` is given, it is swapped into a
+    cached model first, holding the model's lock while drawing so that
+    threads do not sample each other's data. Returns the trace of draws.
+    """
+    if data is None:
+        return _pymc3_draws(imputer, model)
+    # the cache may grow in other threads, so find the lock under its lock
+    with _PYMC3_MODELS_LOCK:
+        lock = next(k for m, k in _PYMC3_MODELS.values() if m is model)
+    with lock:
+        pm.set_data(data, model=model)
+        try:
+            return _pymc3_draws(imputer, model)
+        finally:
+            _pymc3_clear(model, data)
+
+def _pymc3_draws(imputer, model):
+    """Private method to sample or fit a pymc3 model with its current data."""
+    kwargs = _pymc3_sample_kwargs(imputer.rng, imputer.sample_kwargs)
+    with model:
+        if imputer.inference == "nuts":
+            with _sampler_scope(kwargs) as kwargs:
+                return pm.sample(
+                    imputer.sample,
+                    tune=imputer.tune,
+                    init=imputer.init,
+                    **kwargs
+                )
+        converged = pm.callbacks.CheckParametersConvergence(diff="absolute")
+        approx = pm.fit(
+            imputer.n_iter,
+            method="advi",
+            random_seed=kwargs["random_seed"],
+            callbacks=[converged],
+            progressbar=kwargs.get("progressbar", True)
+        )
+    return approx.sample(imputer.sample)
+
+def _posterior_fill(rng, alpha, beta, X, fill_value, link=None):
+    """Private method to impute from posterior draws of alpha and beta.
+
+    Posterior predictions for X come from matrix multiplication with draws
+    stored at fit, so no sampling happens at impute time. 'mean' averages
+    each row's prediction over the draws, and 'random' uses one randomly
+    chosen draw per row. With a `link`, the mean is taken in chunks of rows
+    to bound the size of the (draws x rows) prediction matrix.
+    """
+    X = np.asarray(X, dtype=float)
+    if not fill_value or fill_value == "mean":
+        if link is None:
+            return alpha.mean() + X.dot(beta.mean(0))
+        step = max(1, 2**20 // len(alpha))
+        return np.concatenate([
+            link(alpha[:, None] + beta.dot(X[i:i+step].T)).mean(0)
+            for i in range(0, len(X), step)
+        ])
+    if fill_value == "random":
+        ix = rng.integers(len(alpha), size=len(X))
+        eta = alpha[ix] + np.einsum("ij,ij->i", beta[ix], X)
+        return eta if link is None else link(eta)
+    err = f"{fill_value} must be 'mean' or 'random'."
+    raise ValueError(err)
+
+def _with_intercept(X):
+    """Private method to get predictors as an array with leading 1s column."""
+    X = np.asarray(X, dtype=float)
+    return np.column_stack([np.ones(len(X)), X])
+
+def _prior_arrays(am, asd, bm, bsd, nc):
+    """Private method to stack alpha and beta prior args into arrays."""
+    mean = np.concatenate([[am], np.broadcast_to(bm, (nc,))])
+    sd = np.concatenate([[asd], np.broadcast_to(bsd, (nc,))])
+    return mean.astype(float), sd.astype(float)
+
+def _mvn_draws(rng, mean, chol, scale, size):
+    """Private method to draw from N(mean, scale**2 * inv(chol @ chol.T)).
+
+    `chol` is the lower Cholesky factor of a precision matrix, so each draw
+    costs one triangular solve. `scale` is a scalar or one value per draw.
+    """
+    z = rng.standard_normal((len(mean), size))
+    return mean + (solve_triangular(chol.T, z, lower=False) * scale).T
+
+def _lm_fit_stats(lm, stats):
+    """Private method to set a LinearRegression's fit from LeastSquaresStats.
+
+    The coefficients and intercept solve the normal equations held by the
+    stats, so `lm.predict` works as if `lm` had been fit on the rows.
+    """
+    lm.coef_, lm.intercept_ = stats.solve()
+    return lm
+
+def _norm_draw_fit(stats, ridge=1e-5):
+    """Private method to store what a norm.draw needs from a least squares fit.
+
+    Stores the fit coefficients, with the intercept first if the fit has
+    one, the Cholesky factor of X'X and the residual sum of squares, all
+    from the LeastSquaresStats of the fit. As in MICE, a small `ridge`
+    times the diagonal of X'X is added to keep the factorization stable.
+    """
+    coef, intercept = stats.solve()
+    xtx = stats.xtx
+    if stats.fit_intercept:
+        coef = np.append(intercept, coef)
+        nx = stats.n * stats.mean_x
+        xtx = np.block([[np.array([[stats.n]]), nx[None, :]],
+                        [nx[:, None], xtx]])
+    chol = np.linalg.cholesky(xtx + np.diag(ridge * np.diag(xtx)))
+    df = max(stats.n - len(coef), 1)
+    return {"mean": coef, "chol": chol, "rss": stats.rss(), "df": df}
+
+def _norm_draw(rng, fit):
+    """Private method to draw regression coefficients with MICE's norm.draw.
+
+    sigma**2 is drawn as RSS / chi2(df), then the coefficients are drawn
+    from N(coef, sigma**2 * inv(X'X)). Both are exact draws from the
+    posterior of a regression with flat priors, so no sampling is needed.
+    """
+    sigma = np.sqrt(fit["rss"] / rng.chisquare(fit["df"]))
+    return _mvn_draws(rng, fit["mean"], fit["chol"], sigma, 1)[0]
+
+def _nig_posterior(X, y, m0, sd0, a0, b0):
+    """Private method for the Normal-Inverse-Gamma posterior of a regression.
+
+    The conjugate prior is coef | s2 ~ N(m0, s2 * diag(sd0**2)) and
+    s2 ~ InvGamma(a0, b0). X must include the intercept column. Returns the
+    posterior mean, the Cholesky factor of the posterior precision, and the
+    posterior shape and scale of s2.
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    prec0 = 1 / sd0**2
+    chol = np.linalg.cholesky(X.T @ X + np.diag(prec0))
+    mean = cho_solve((chol, True), prec0 * m0 + X.T @ y)
+    resid = y - X @ mean
+    dm = mean - m0
+    a = a0 + len(y) / 2
+    b = b0 + (resid @ resid + dm @ (prec0 * dm)) / 2
+    return {"mean": mean, "chol": chol, "a": a, "b": b}
+
+def _nig_draws(rng, post, size):
+    """Private method to draw alpha, beta and sigma from an NIG posterior."""
+    sigma = np.sqrt(post["b"] / rng.gamma(post["a"], size=size))
+    coef = _mvn_draws(rng, post["mean"], post["chol"], sigma, size)
+    return coef[:, 0], coef[:, 1:], sigma
+
+def _laplace_logistic(X, y, m0, sd0, max_iter=100, tol=1e-8):
+    """Private method for the Laplace approximation of a logistic posterior.
+
+    Newton's method finds the posterior mode of a logistic regression with
+    independent normal priors N(m0, sd0**2) on its coefficients. The
+    posterior is approximated with a normal at the mode, with precision
+    equal to the negative Hessian. X must include the intercept column.
+    Returns the mode and the Cholesky factor of the posterior precision.
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    prec0 = 1 / sd0**2
+    coef = np.array(m0, dtype=float)
+    for _ in range(max_iter):
+        p = expit(X @ coef)
+        grad = X.T @ (y - p) - prec0 * (coef - m0)
+        chol = np.linalg.cholesky((X.T * (p * (1 - p))) @ X
+                                  + np.diag(prec0))
+        step = cho_solve((chol, True), grad)
+        coef = coef + step
+        if np.max(np.abs(step)) < tol:
+            break
+
+    # precision at the mode, which the last step may have moved
+    p = expit(X @ coef)
+    chol = np.linalg.cholesky((X.T * (p * (1 - p))) @ X + np.diag(prec0))
+    return {"mean": coef, "chol": chol}
+
+def _pg_draws(rng, c):
+    """Private method to draw PG(1, c) variables for each value of c.
+
+    Uses the first `PG_TERMS` terms of the infinite sum of gammas that
+    defines the Polya-Gamma distribution. The expected value of the
+    remaining terms is added back, so draws have the exact mean.
+    """
+    c = np.abs(np.asarray(c, dtype=float))
+    k = np.arange(1, PG_TERMS + 1) - 0.5
+    denom = k**2 + (c[:, None] / (2*np.pi))**2
+    omega = (rng.standard_gamma(1, size=denom.shape) / denom).sum(1)
+    omega /= 2*np.pi**2
+
+    # tanh(c/2)/(2c) is the mean of PG(1, c), with limit 1/4 as c -> 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(c > 1e-8, np.tanh(c / 2) / (2*c), 0.25)
+    return omega + mean - (1 / denom).sum(1) / (2*np.pi**2)
+
+def _pg_gibbs_logistic(rng, X, y, m0, sd0, sample, tune):
+    """Private method to sample a logistic posterior with Polya-Gamma Gibbs.
+
+    Alternates draws of the Polya-Gamma augmentation variables given the
+    coefficients, and the coefficients given those variables, which are
+    then conditionally normal under the N(m0, sd0**2) priors. X must
+    include the intercept column. Returns `sample` draws after `tune`
+    burn-in draws, with one row per draw.
+    """
+    X = np.asarray(X, dtype=float)
+    kappa = np.asarray(y, dtype=float) - 0.5
+    prec0 = 1 / sd0**2
+    b = X.T @ kappa + prec0 * m0
+    coef = np.array(m0, dtype=float)
+    draws = np.empty((sample, len(coef)))
+    for i in range(tune + sample):
+        omega = _pg_draws(rng, X @ coef)
+        chol = np.linalg.cholesky((X.T * omega) @ X + np.diag(prec0))
+        mean = cho_solve((chol, True), b)
+        coef = _mvn_draws(rng, mean, chol, 1, 1)[0]
+        if i >= tune:
+            draws[i - tune] = coef
+    return draws
+
 def _pymc3_logger(verbose=False):
     """Private method to handle pymc3 logging."""
     progress = 1
@@ -17,6 +17,9 @@ from xgboost import XGBClassifier
 from sklearn.base import clone, BaseEstimator, ClassifierMixin
 from sklearn.utils.validation import check_is_fitted
 from autoimpute.utils import check_nan_columns, check_predictors_fit
+from autoimpute.utils.checks import _missing_mask, _validation_scope
+from autoimpute.utils.datasets import check_dataset
+from autoimpute.utils.resources import current_budget
 
 # pylint:disable=attribute-defined-outside-init
 # pylint:disable=arguments-differ
@@ -50,6 +53,8 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
                 If None, default is xgboost. Note that classifier must
                 conform to sklearn style. This means it must implement the
                 `predict_proba` method and act as a porper classifier.
+                A classifier's `n_jobs` is capped by the cores of the
+                current `core_budget`. The default xgboost uses all of them.
             predictors (str, iter, dict, optiona): defaults to all, i.e.
                 use all predictors. If all, every column will be used for
                 every class prediction. If a list, subset of columns used for
@@ -76,7 +81,7 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
             ValueError: classifier does not implement `predict_proba`
         """
         if c is None:
-            self._classifier = XGBClassifier()
+            self._classifier = XGBClassifier(n_jobs=-1)
         else:
             m = "predict_proba"
             if not hasattr(c, m):
@@ -93,7 +98,7 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
         # next, prep the categorical / numerical split
         # only necessary for classes that use other features
         # wont see this requirement in the single imputer
-        self.data_mi = X.isnull().astype(int)
+        self.data_mi = _missing_mask(X).to_frame().astype(int)
 
     def _predictor_strategy_validator(self, X):
         """Private method to prep for prediction."""
@@ -109,6 +114,7 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
         if diff_X or diff_mi:
             raise ValueError("Same columns must appear in fit and predict.")
 
+    @check_dataset
     @check_nan_columns
     def fit(self, X, **kwargs):
         """Fit an individual classifier for each column in the DataFrame.
@@ -120,7 +126,9 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
         specification will be supported as well.
 
         Args:
-            X (pd.DataFrame): DataFrame on which to fit classifiers
+            X (pd.DataFrame): DataFrame on which to fit classifiers. May also
+                be a Parquet path or Arrow dataset. Every column is read,
+                as each column gets a classifier.
             **kwargs: keyword arguments used by classifiers
 
         Returns:
@@ -131,6 +139,9 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
         self._fit_strategy_validator(X)
         self.statistics_ = {}
 
+        # classifiers that run jobs use no more than the current core budget
+        budget = current_budget()
+
         # iterate missingness fit using classifier and all remaining columns
         for column in self.data_mi:
             # only fit non time-based columns...
@@ -142,10 +153,14 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
                 else:
                     x = X[preds]
                 clf = clone(self.classifier)
+                if "n_jobs" in clf.get_params():
+                    n_jobs = budget.n_jobs(clf.get_params()["n_jobs"])
+                    clf.set_params(n_jobs=n_jobs)
                 cls_fit = clf.fit(x.values, y.values, **kwargs)
                 self.statistics_[column] = cls_fit
         return self
 
+    @check_dataset
     @check_nan_columns
     def predict(self, X, **kwargs):
         """Predict class of each feature. 1 for missing; 0 for not missing.
@@ -187,6 +202,7 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
         self.data_mi_preds = pd.DataFrame(preds_mat, columns=pred_cols)
         return self.data_mi_preds
 
+    @check_dataset
     @check_nan_columns
     def predict_proba(self, X, **kwargs):
         """Predict probability of missing class membership of each feature.
@@ -227,6 +243,7 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
         self.data_mi_proba = pd.DataFrame(preds_mat, columns=pred_cols)
         return self.data_mi_proba
 
+    @check_dataset
     def fit_predict(self, X):
         """Convenience method for fit and class prediction.
 
@@ -236,8 +253,10 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
         Returns:
             pd.DataFrame: DataFrame of class predictions.
         """
-        return self.fit(X).predict(X)
+        with _validation_scope():
+            return self.fit(X).predict(X)
 
+    @check_dataset
     def fit_predict_proba(self, X):
         """Convenience method for fit and class probability prediction.
 
@@ -247,7 +266,8 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
         Returns:
             pd.DataFrame: DataFrame of class probability predictions.
         """
-        return self.fit(X).predict_proba(X)
+        with _validation_scope():
+            return self.fit(X).predict_proba(X)
 
     @check_nan_columns
     def gen_test_indices(self, X, thresh=0.5, use_exist=False):
@@ -2,18 +2,52 @@
 
 The base class is quite simple but important. It specifies the contract for
 how series-imputers should behave. All series-imputers should inherit from
-this base class to be considered valid Imputers.
+this base class to be considered valid Imputers. Univariate imputers that can
+also fit on a stream of chunks inherit from ISketchImputer.
 """
 
 import abc
+import numpy as np
 from sklearn.base import BaseEstimator
+from sklearn.exceptions import NotFittedError
+# pylint:disable=attribute-defined-outside-init
+# pylint:disable=unused-argument
 
 class ISeriesImputer(BaseEstimator, metaclass=abc.ABCMeta):
     """ISeriesImputer implements the abstract base class for series-imputers.
 
     All series imputers should have a fit, impute, and fit_impute method to be
     considered valid to build imputation models. The ISeriesImputer is the
-    contract series-imputers must adhere to."""
+    contract series-imputers must adhere to.
+
+    Series-imputers that make random draws use the `rng` property, a numpy
+    random Generator. DataFrame imputers set `rng` to an independent stream
+    for each column, so imputers never share or touch global random state.
+
+    Attributes:
+        deterministic_fit (bool): whether the fitted model does not depend
+            on random draws and is left untouched when imputing. If so,
+            the MultipleImputer fits the imputer once and shares it across
+            imputations, repeating only the random draws made in `impute`.
+    """
+    deterministic_fit = True
+
+    @property
+    def rng(self):
+        """Property getter to return the imputer's random Generator."""
+        if getattr(self, "_rng", None) is None:
+            self._rng = np.random.default_rng()
+        return self._rng
+
+    @rng.setter
+    def rng(self, r):
+        """Set the random Generator used by the imputer for random draws.
+
+        Args:
+            r (Generator, SeedSequence, int, None): passed to
+                `np.random.default_rng`. A Generator is used as is.
+        """
+        self._rng = np.random.default_rng(r)
 
     @abc.abstractmethod
     def fit(self, X, y):
@@ -54,3 +88,72 @@ class ISeriesImputer(BaseEstimator, metaclass=abc.ABCMeta):
         Returns:
             imputations, scalar or array depending on imputation model.
         """
+
+class ISketchImputer(ISeriesImputer):
+    """ISketchImputer extends series-imputers that can fit on a stream.
+
+    Imputers that compute their statistics from a mergeable sketch of the
+    observed values (see autoimpute.imputations.sketches) implement
+    `partial_fit` and `merge` with this class. `partial_fit` updates the
+    sketch one chunk of a Series at a time, and `merge` adds the sketch of
+    an imputer fit on another chunk or partition. Least squares imputers
+    sketch the sufficient statistics of (X, y) instead. Statistics are
+    set from the sketch after each call, so the imputer can impute at any
+    point. The sketch is separate from statistics computed by `fit`.
+
+    Attributes:
+        strategy (str): name of the imputer's strategy, set by subclasses.
+        sketch_: sketch of the observed values seen by `partial_fit`.
+            None until the first call to `partial_fit` or `merge`.
+    """
+    strategy = None
+    sketch_ = None
+
+    @abc.abstractmethod
+    def _new_sketch(self):
+        """Contract to create an empty sketch of the observed values."""
+
+    @abc.abstractmethod
+    def _sketch_param(self):
+        """Contract to get the `param` of statistics from the sketch."""
+
+    def partial_fit(self, X, y=None):
+        """Update the imputer's sketch with a chunk of a Series.
+
+        Args:
+            X (pd.Series): chunk of the dataset to fit the imputer.
+            y (None): ignored, None to meet requirements of base class
+
+        Returns:
+            self. Instance of the class.
+        """
+        if self.sketch_ is None:
+            self.sketch_ = self._new_sketch()
+        self.sketch_.update(X[~X.isnull()].values)
+        return self._set_sketch_statistics()
+
+    def merge(self, other):
+        """Merge the sketch of another imputer of the same class into this.
+
+        Args:
+            other (ISketchImputer): imputer fit with `partial_fit`.
+
+        Returns:
+            self. Instance of the class.
+
+        Raises:
+            NotFittedError: other has no sketch to merge.
+        """
+        if other.sketch_ is None:
+            err = f"{type(other).__name__} has no sketch to merge."
+            raise NotFittedError(err)
+        if self.sketch_ is None:
+            self.sketch_ = self._new_sketch()
+        self.sketch_.merge(other.sketch_)
+        return self._set_sketch_statistics()
+
+    def _set_sketch_statistics(self):
+        """Private method to set the imputer's statistics from its sketch."""
+        param = self._sketch_param()
+        self.statistics_ = {"param": param, "strategy": self.strategy}
+        return self
@@ -10,11 +10,17 @@ columns in a dataframe, or specify either strategy for a given column.
 """
 
 import numpy as np
-import pymc3 as pm
-from pandas import Series
+from scipy.special import expit
 from sklearn.utils.validation import check_is_fitted
 from autoimpute.imputations import method_names
 from autoimpute.imputations.errors import _not_num_series
+from autoimpute.imputations.helpers import _check_inference
+from autoimpute.imputations.helpers import _pymc3_model, _pymc3_posterior
+from autoimpute.imputations.helpers import _posterior_fill, _with_intercept
+from autoimpute.imputations.helpers import _prior_arrays, _nig_posterior
+from autoimpute.imputations.helpers import _nig_draws, _mvn_draws
+from autoimpute.imputations.helpers import _laplace_logistic
+from autoimpute.imputations.helpers import _pg_gibbs_logistic
 from .base import ISeriesImputer
 methods = method_names
 # pylint:disable=attribute-defined-outside-init
@@ -32,13 +38,15 @@ class BayesianLeastSquaresImputer(ISeriesImputer):
     parameters of interest (alpha, beta, epsilon). Imputations for missing
     values are samples from posterior predictive distribution of each missing
     point. To implement bayesian least squares, the imputer utlilizes the
-    pymc3 library. The imputer can be used directly, but such behavior is
+    pymc3 library, or the closed form conjugate posterior when the engine is
+    `analytic`. The imputer can be used directly, but such behavior is
     discouraged. BayesianLeastSquaresImputer does not have the flexibility /
     robustness of dataframe imputers, nor is its behavior identical. Preferred
     use is MultipleImputer(strategy="bayesian least squares").
     """
     # class variables
     strategy = methods.BAYESIAN_LS
+    engines = ("pymc3", "analytic")
 
     def __init__(self, **kwargs):
         """Create an instance of the BayesianLeastSquaresImputer class.
@@ -66,9 +74,24 @@ class BayesianLeastSquaresImputer(ISeriesImputer):
                 to sample. Default = 1000.
             init (str, Optional): MCMC algo to use for posterior sampling.
                 Default = 'auto'. See pymc3 docs for more info on choices.
+            inference (str, Optional): how to get the posterior. Default is
+                'nuts', which samples with MCMC. 'advi' fits a variational
+                approximation with `pm.fit`, stopping once its parameters
+                converge, then draws `sample` values from it. 'minibatch
+                advi' fits the approximation on random batches of rows.
+            n_iter (int, Optional): max iterations of advi. Default 10000.
+            batch_size (int, Optional): rows in each batch when inference is
+                'minibatch advi'. Default 1000.
             fill_value (str, Optional): How to draw from the posterior to
                 create imputations. Default is None. 'random' and 'mean'
                 supported for explicit options.
+            engine (str, Optional): how to get the posterior. Default is
+                'pymc3', which samples the model with MCMC. 'analytic' uses
+                the conjugate Normal-Inverse-Gamma posterior, which is drawn
+                from exactly, with no compilation or MCMC. Its priors are
+                alpha ~ N(am, asd * sigma), beta ~ N(bm, bsd * sigma) and
+                sigma**2 ~ InvGamma(1, sig**2). `tune`, `init` and sampling
+                kwargs do not apply.
         """
         self.am = kwargs.pop("am", 0)
         self.asd = kwargs.pop("asd", 10)
@@ -78,9 +101,18 @@ class BayesianLeastSquaresImputer(ISeriesImputer):
         self.sample = kwargs.pop("sample", 1000)
         self.tune = kwargs.pop("tune", 1000)
         self.init = kwargs.pop("init", "auto")
+        self.inference = kwargs.pop("inference", "nuts")
+        self.n_iter = kwargs.pop("n_iter", 10000)
+        self.batch_size = kwargs.pop("batch_size", 1000)
         self.fill_value = kwargs.pop("fill_value", None)
+        self.engine = kwargs.pop("engine", "pymc3")
         self.sample_kwargs = kwargs
 
+    @property
+    def deterministic_fit(self):
+        """The analytic posterior is exact, so its fit is deterministic."""
+        return self.engine == "analytic"
+
     def fit(self, X, y):
         """Fit the Imputer to the dataset by fitting bayesian model.
 
@@ -90,22 +122,36 @@ class BayesianLeastSquaresImputer(ISeriesImputer):
 
         Returns:
             self. Instance of the class.
+
+        Raises:
+            ValueError: engine must be one of `pymc3` or `analytic`.
         """
         _not_num_series(self.strategy, y)
         nc = len(X.columns)
+        if self.engine not in self.engines:
+            err = f"{self.engine} engine not supported. Use {self.engines}."
+            raise ValueError(err)
+
+        # the conjugate posterior only depends on the data through X'X, X'y
+        if self.engine == "analytic":
+            m0, sd0 = _prior_arrays(self.am, self.asd, self.bm, self.bsd, nc)
+            post = _nig_posterior(_with_intercept(X), y, m0, sd0, 1,
+                                  self.sig**2)
+            self.statistics_ = {"param": post, "strategy": self.strategy}
+            return self
 
         # initialize model for bayesian linear reg. Default vals for priors
         # assume data is scaled and centered. Convergence can struggle or fail
         # if not the case and proper values for the priors are not specified
         # separately, also assumes each beta is normal and "independent"
         # while betas likely not independent, this is technically a rule of OLS
-        with pm.Model() as fit_model:
-            alpha = pm.Normal("alpha", self.am, sd=self.asd)
-            beta = pm.Normal("beta", self.bm, sd=self.bsd, shape=nc)
-            sigma = pm.HalfCauchy("σ", self.sig)
-            mu = alpha+beta.dot(X.T)
-            score = pm.Normal("score", mu, sd=sigma, observed=y)
-        self.statistics_ = {"param": fit_model, "strategy": self.strategy}
+        # the posterior is sampled once here and stored as arrays of draws
+        _check_inference(self.inference)
+        fit_model, data = _pymc3_model(self, X, y)
+        tr = _pymc3_posterior(self, fit_model, data)
+        self.trace_ = tr
+        params = {"alpha": tr["alpha"], "beta": tr["beta"], "σ": tr["σ"]}
+        self.statistics_ = {"param": params, "strategy": self.strategy}
         return self
 
     def impute(self, X):
@@ -113,7 +159,8 @@ class BayesianLeastSquaresImputer(ISeriesImputer):
 
         The transform method returns the values for imputation. Missing values
         in a given dataset are replaced with the samples from the posterior
-        predictive distribution of each missing data point.
+        predictive distribution of each missing data point. Posterior draws
+        are reused from fit, so imputing new data requires no sampling.
 
         Args:
             X (pd.DataFrame): predictors to determine imputed values.
@@ -121,35 +168,20 @@ class BayesianLeastSquaresImputer(ISeriesImputer):
         Returns:
             np.array: imputed dataset.
         """
-        # check if fitted then predict with least squares
+        # check if fitted, then get draws of alpha and beta
         check_is_fitted(self, "statistics_")
-        model = self.statistics_["param"]
-
-        # add a Deterministic node for each missing value
-        # sampling then pulls from the posterior predictive distribution
-        # each missing data point. I.e. distribution for EACH missing
-        with model:
-            mu_pred = pm.Deterministic(
-                "mu_pred", model["alpha"]+model["beta"].dot(X.T)
-            )
-            tr = pm.sample(
-                self.sample,
-                tune=self.tune,
-                init=self.init,
-                **self.sample_kwargs
-            )
-        self.trace_ = tr
+        params = self.statistics_["param"]
+
+        # draw alpha, beta and sigma exactly from the conjugate posterior
+        if self.engine == "analytic":
+            alpha, beta, sigma = _nig_draws(self.rng, params, self.sample)
+            self.trace_ = {"alpha": alpha, "beta": beta, "σ": sigma}
+        else:
+            alpha, beta = params["alpha"], params["beta"]
 
         # decide how to impute. Use mean of posterior predictive or random draw
         # not supported yet, but eventually consider using the MAP
-        if not self.fill_value or self.fill_value == "mean":
-            imp = tr["mu_pred"].mean(0)
-        elif self.fill_value == "random":
-            imp = np.apply_along_axis(np.random.choice, 0, tr["mu_pred"])
-        else:
-            err = f"{self.fill_value} must be 'mean' or 'random'."
-            raise ValueError(err)
-        return imp
+        return _posterior_fill(self.rng, alpha, beta, X, self.fill_value)
 
     def fit_impute(self, X, y):
         """Fit impute method to generate imputations where y is missing.
@@ -180,6 +212,7 @@ class BayesianBinaryLogisticImputer(ISeriesImputer):
     """
     # class variables
     strategy = methods.BAYESIAN_BINARY_LOGISTIC
+    engines = ("pymc3", "laplace", "polya-gamma")
 
     def __init__(self, **kwargs):
         """Create an instance of the BayesianBinaryLogisticImputer class.
@@ -210,9 +243,25 @@ class BayesianBinaryLogisticImputer(ISeriesImputer):
                 to sample. Default = 1000.
             init (str, Optional): MCMC algo to use for posterior sampling.
                 Default = 'auto'. See pymc3 docs for more info on choices.
+            inference (str, Optional): how to get the posterior. Default is
+                'nuts', which samples with MCMC. 'advi' fits a variational
+                approximation with `pm.fit`, stopping once its parameters
+                converge, then draws `sample` values from it. 'minibatch
+                advi' fits the approximation on random batches of rows.
+            n_iter (int, Optional): max iterations of advi. Default 10000.
+            batch_size (int, Optional): rows in each batch when inference is
+                'minibatch advi'. Default 1000.
             fill_value (str, Optional): How to draw from the posterior to
                 create imputations. Default is None. 'random' and 'mean'
                 supported for explicit options.
+            engine (str, Optional): how to get the posterior. Default is
+                'pymc3', which samples the model with MCMC. 'laplace' finds
+                the posterior mode with Newton's method and approximates the
+                posterior with a normal there. 'polya-gamma' samples the
+                exact posterior with a Polya-Gamma Gibbs sampler, keeping
+                `sample` draws after `tune` burn-in draws. Neither compiles
+                a model, and `init`, `inference` and sampling kwargs do not
+                apply to them.
         """
         self.am = kwargs.pop("am", 0)
         self.asd = kwargs.pop("asd", 10)
@@ -222,9 +271,18 @@ class BayesianBinaryLogisticImputer(ISeriesImputer):
         self.sample = kwargs.pop("sample", 1000)
         self.tune = kwargs.pop("tune", 1000)
         self.init = kwargs.pop("init", "auto")
+        self.inference = kwargs.pop("inference", "nuts")
+        self.n_iter = kwargs.pop("n_iter", 10000)
+        self.batch_size = kwargs.pop("batch_size", 1000)
         self.fill_value = kwargs.pop("fill_value", None)
+        self.engine = kwargs.pop("engine", "pymc3")
         self.sample_kwargs = kwargs
 
+    @property
+    def deterministic_fit(self):
+        """The laplace approximation is found without any random draws."""
+        return self.engine == "laplace"
+
     def fit(self, X, y):
         """Fit the Imputer to the dataset by fitting bayesian model.
 
@@ -234,7 +292,14 @@ class BayesianBinaryLogisticImputer(ISeriesImputer):
 
         Returns:
             self. Instance of the class.
+
+        Raises:
+            ValueError: engine must be one of `pymc3`, `laplace` or
+                `polya-gamma`.
         """
+        if self.engine not in self.engines:
+            err = f"{self.engine} engine not supported. Use {self.engines}."
+            raise ValueError(err)
         y = y.astype("category").cat
         y_cat_l = len(y.codes.unique())
 
@@ -244,18 +309,33 @@ class BayesianBinaryLogisticImputer(ISeriesImputer):
             raise ValueError(err)
         nc = len(X.columns)
 
+        # fit the same priors without pymc3, on the design with an intercept
+        if self.engine != "pymc3":
+            m0, sd0 = _prior_arrays(self.am, self.asd, self.bm, self.bsd, nc)
+            xs = _with_intercept(X)
+            if self.engine == "laplace":
+                params = _laplace_logistic(xs, y.codes, m0, sd0)
+            else:
+                coef = _pg_gibbs_logistic(self.rng, xs, y.codes, m0, sd0,
+                                          self.sample, self.tune)
+                params = {"alpha": coef[:, 0], "beta": coef[:, 1:]}
+                self.trace_ = params.copy()
+            params["labels"] = y.categories
+            self.statistics_ = {"param": params, "strategy": self.strategy}
+            return self
+
         # initialize model for bayesian logistic reg. Default vals for priors
         # assume data is scaled and centered. Convergence can struggle or fail
         # if not the case and proper values for the priors are not specified
         # separately, also assumes each beta is normal and "independent"
         # while betas likely not independent, this is technically a rule of OLS
-        with pm.Model() as fit_model:
-            alpha = pm.Normal("alpha", self.am, sd=self.asd)
-            beta = pm.Normal("beta", self.bm, sd=self.bsd, shape=nc)
-            p = pm.invlogit(alpha + beta.dot(X.T))
-            score = pm.Bernoulli("score", p, observed=y.codes)
-
-        params = {"model": fit_model, "labels": y.categories}
+        # the posterior is sampled once here and stored as arrays of draws
+        _check_inference(self.inference)
+        fit_model, data = _pymc3_model(self, X, y.codes, "logistic")
+        tr = _pymc3_posterior(self, fit_model, data)
+        self.trace_ = tr
+        params = {"alpha": tr["alpha"], "beta": tr["beta"],
+                  "labels": y.categories}
         self.statistics_ = {"param": params, "strategy": self.strategy}
         return self
 
@@ -264,7 +344,8 @@ class BayesianBinaryLogisticImputer(ISeriesImputer):
 
         The impute method returns the values for imputation. Missing values
         in a given dataset are replaced with the samples from the posterior
-        predictive distribution of each missing data point.
+        predictive distribution of each missing data point. Posterior draws
+        are reused from fit, so imputing new data requires no sampling.
 
         Args:
             X (pd.DataFrame): predictors to determine imputed values.
@@ -272,43 +353,29 @@ class BayesianBinaryLogisticImputer(ISeriesImputer):
         Returns:
             np.array: imputated dataset.
         """
-        # check if fitted then predict with least squares
+        # check if fitted, then get draws of alpha and beta
         check_is_fitted(self, "statistics_")
-        model = self.statistics_["param"]["model"]
-        labels = self.statistics_["param"]["labels"]
-
-        # add a Deterministic node for each missing value
-        # sampling then pulls from the posterior predictive distribution
-        # each missing data point. I.e. distribution for EACH missing
-        with model:
-            p_pred = pm.Deterministic(
-                "p_pred", pm.invlogit(model["alpha"] + model["beta"].dot(X.T))
-            )
-            tr = pm.sample(
-                self.sample,
-                tune=self.tune,
-                init=self.init,
-                **self.sample_kwargs
-            )
-        self.trace_ = tr
+        params = self.statistics_["param"]
+        labels = params["labels"]
+
+        # draw alpha and beta from the normal approximation at the mode
+        if self.engine == "laplace":
+            coef = _mvn_draws(self.rng, params["mean"], params["chol"], 1,
+                              self.sample)
+            alpha, beta = coef[:, 0], coef[:, 1:]
+            self.trace_ = {"alpha": alpha, "beta": beta}
+        else:
+            alpha, beta = params["alpha"], params["beta"]
 
         # decide how to impute. Use mean of posterior predictive or random draw
         # not supported yet, but eventually consider using the MAP
-        if not self.fill_value or self.fill_value == "mean":
-            imp = tr["p_pred"].mean(0)
-        elif self.fill_value == "random":
-            imp = np.apply_along_axis(np.random.choice, 0, tr["p_pred"])
-        else:
-            err = f"{self.fill_value} must be 'mean' or 'random'."
-            raise ValueError(err)
+        imp = _posterior_fill(self.rng, alpha, beta, X, self.fill_value,
+                              link=expit)
 
         # convert probabilities to class membership
         # then map class membership to corresponding label
-        fill_thresh = np.vectorize(lambda f: 1 if f > self.thresh else 0)
-        preds = fill_thresh(imp)
-        label_dict = {i:j for i, j in enumerate(labels.values)}
-        imp = Series(preds).replace(label_dict, inplace=False)
-        return imp.values
+        preds = (imp > self.thresh).astype(int)
+        return np.asarray(labels)[preds]
 
     def fit_impute(self, X, y):
         """Fit impute method to generate imputations where y is missing.
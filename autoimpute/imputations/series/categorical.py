@@ -12,12 +12,13 @@ import numpy as np
 from sklearn.utils.validation import check_is_fitted
 from autoimpute.imputations import method_names
 from autoimpute.imputations.errors import _not_cat_series
-from .base import ISeriesImputer
+from autoimpute.imputations.sketches import FrequentItems
+from .base import ISketchImputer
 methods = method_names
 # pylint:disable=attribute-defined-outside-init
 # pylint:disable=unnecessary-pass
 
-class CategoricalImputer(ISeriesImputer):
+class CategoricalImputer(ISketchImputer):
     """Impute missing data w/ draw from dataset's categorical distribution.
 
     The categorical imputer computes the proportion of observed values for
@@ -51,6 +52,27 @@ class CategoricalImputer(ISeriesImputer):
         self.statistics_ = {"param": proportions, "strategy": self.strategy}
         return self
 
+    def partial_fit(self, X, y=None):
+        """Update the frequent value counts with a chunk of a Series.
+
+        Args:
+            X (pd.Series): chunk of the dataset to fit the imputer.
+            y (None): ignored, None to meet requirements of base class
+
+        Returns:
+            self. Instance of the class.
+        """
+        _not_cat_series(self.strategy, X)
+        return super().partial_fit(X, y)
+
+    def _new_sketch(self):
+        """Private method to count the most frequent observed values."""
+        return FrequentItems()
+
+    def _sketch_param(self):
+        """Private method to get the param from the sketch of observed."""
+        return self.sketch_.proportions()
+
     def impute(self, X):
         """Perform imputations using the statistics generated from fit.
 
@@ -74,7 +96,7 @@ class CategoricalImputer(ISeriesImputer):
         param = self.statistics_["param"]
         cats = param.index
         proportions = param.tolist()
-        imp = np.random.choice(cats, size=len(ind), p=proportions)
+        imp = self.rng.choice(cats, size=len(ind), p=proportions)
         return imp
 
     def fit_impute(self, X, y=None):
@@ -89,6 +89,25 @@ class DefaultBaseImputer(ISeriesImputer):
         """Property getter to return the value of the cat imputer."""
         return self._cat_imputer
 
+    @property
+    def deterministic_fit(self):
+        """Fit is deterministic if both delegated imputers' fits are."""
+        num_det = self.num_imputer.deterministic_fit
+        cat_det = self.cat_imputer.deterministic_fit
+        return num_det and cat_det
+
+    @property
+    def rng(self):
+        """Property getter to return the imputer's random Generator."""
+        return ISeriesImputer.rng.fget(self)
+
+    @rng.setter
+    def rng(self, r):
+        """Set the random Generator of the imputer and its delegates."""
+        ISeriesImputer.rng.fset(self, r)
+        self.num_imputer.rng = self._rng
+        self.cat_imputer.rng = self._rng
+
     @num_imputer.setter
     def num_imputer(self, imp):
         """Validate the num imputer and set default parameters.
@@ -7,21 +7,89 @@ Dataframe imputers utilize this class when its strategy is requested. Use
 SingleImputer or MultipleImputer with strategy = `least squares` to broadcast
 the strategy across all the columns in a dataframe, or specify this strategy
 for a given column.
+
+Both imputers can also fit from the mergeable sufficient statistics of the
+regression, X'X, X'y, y'y and n (see LeastSquaresStats). `partial_fit`
+updates them one partition of rows at a time, `merge` adds those of an
+imputer fit on another partition, and `fit_stats` fits from statistics
+computed elsewhere, e.g. with `LeastSquaresStats.from_partitions` on a
+process pool. Rows are never gathered into one design matrix.
 """
 
 from numpy import sqrt
-from scipy.stats import norm
 from sklearn.utils.validation import check_is_fitted
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error
 from autoimpute.imputations import method_names
 from autoimpute.imputations.errors import _not_num_series
-from .base import ISeriesImputer
+from autoimpute.imputations.helpers import _lm_fit_stats
+from autoimpute.imputations.sketches import LeastSquaresStats
+from .base import ISketchImputer
 methods = method_names
 # pylint:disable=attribute-defined-outside-init
-# pylint:
 
-class LeastSquaresImputer(ISeriesImputer):
+class _LeastSquaresStatsMixin:
+    """Private mixin to fit a least squares imputer from its statistics.
+
+    Mixed into ISketchImputers that wrap a LinearRegression as `lm`. Its
+    methods take the place of the sketch methods of ISketchImputer.
+
+    Attributes:
+        strategy (str): name of the imputer's strategy.
+        lm (LinearRegression): linear model set from the statistics.
+    """
+    strategy = None
+    lm = None
+
+    def _new_sketch(self):
+        """Create empty sufficient statistics of the regression."""
+        return LeastSquaresStats(self.lm.fit_intercept)
+
+    def _sketch_param(self):
+        """No param by default. Only the linear model is set."""
+        return None
+
+    def partial_fit(self, X, y=None):
+        """Update the regression's statistics with a partition of rows.
+
+        Args:
+            X (pd.Dataframe): predictors in the partition.
+            y (pd.Series): response in the partition. Rows where it is
+                missing are skipped.
+
+        Returns:
+            self. Instance of the class.
+        """
+        _not_num_series(self.strategy, y)
+        if self.sketch_ is None:
+            self.sketch_ = self._new_sketch()
+        observed = y.notnull().values
+        self.sketch_.update(X[observed], y[observed])
+        return self._set_sketch_statistics()
+
+    def fit_stats(self, stats):
+        """Fit the imputer from sufficient statistics computed elsewhere.
+
+        Args:
+            stats (LeastSquaresStats): statistics of the observed rows.
+
+        Returns:
+            self. Instance of the class.
+
+        Raises:
+            ValueError: stats must agree with the model on fit_intercept.
+        """
+        if stats.fit_intercept != self.lm.fit_intercept:
+            raise ValueError("Statistics must agree on fit_intercept.")
+        self.sketch_ = stats
+        return self._set_sketch_statistics()
+
+    def _set_sketch_statistics(self):
+        """Private method to set the linear model and statistics."""
+        _lm_fit_stats(self.lm, self.sketch_)
+        return super()._set_sketch_statistics()
+
+class LeastSquaresImputer(_LeastSquaresStatsMixin, ISketchImputer):
     """Impute missing values using predictions from least squares regression.
 
     The LeastSquaresImputer produces predictions using the least squares
@@ -93,7 +161,7 @@ class LeastSquaresImputer(ISeriesImputer):
         miss_y_ix = y[y.isnull()].index
         return self.fit(X, y).impute(X.loc[miss_y_ix])
 
-class StochasticImputer(ISeriesImputer):
+class StochasticImputer(_LeastSquaresStatsMixin, ISketchImputer):
     """Impute missing values adding error to least squares regression preds.
 
     The StochasticImputer predicts using the least squares methodology. The
@@ -138,6 +206,10 @@ class StochasticImputer(ISeriesImputer):
         self.statistics_ = {"param": mse, "strategy": self.strategy}
         return self
 
+    def _sketch_param(self):
+        """Get the mean squared error of the fit from its statistics."""
+        return self.sketch_.mse()
+
     def impute(self, X):
         """Generate imputations using predictions from the fit linear model.
 
@@ -159,7 +231,7 @@ class StochasticImputer(ISeriesImputer):
 
         # add random draw from normal dist w/ mean squared error
         # from observed model. This makes lm stochastic
-        mse_dist = norm.rvs(loc=0, scale=sqrt(mse), size=len(preds))
+        mse_dist = self.rng.normal(loc=0, scale=sqrt(mse), size=len(preds))
         imp = preds + mse_dist
         return imp
 
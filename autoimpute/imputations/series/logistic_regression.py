@@ -15,10 +15,10 @@ from pandas import Series
 from sklearn.utils.validation import check_is_fitted
 from sklearn.linear_model import LogisticRegression
 from autoimpute.imputations import method_names
+from autoimpute.imputations.helpers import _rng_seed
 from .base import ISeriesImputer
 methods = method_names
 # pylint:disable=attribute-defined-outside-init
-# pylint:
 
 class BinaryLogisticImputer(ISeriesImputer):
     """Impute missing values w/ predictions from binary logistic regression.
@@ -40,11 +40,20 @@ class BinaryLogisticImputer(ISeriesImputer):
 
         Args:
             **kwargs: keyword arguments passed to LogisticRegresion.
+                If `random_state` not given, the solver is seeded from the
+                imputer's random Generator (see `rng`), and the fit is not
+                shared across imputations (see `deterministic_fit`).
 
         """
         self.solver = kwargs.pop("solver", "liblinear")
+        self.random_state = kwargs.pop("random_state", None)
         self.glm = LogisticRegression(solver=self.solver, **kwargs)
 
+    @property
+    def deterministic_fit(self):
+        """The fit is deterministic only if the solver's seed is given."""
+        return self.random_state is not None
+
     def fit(self, X, y):
         """Fit the Imputer to the dataset by fitting logistic model.
 
@@ -60,6 +69,10 @@ class BinaryLogisticImputer(ISeriesImputer):
         if y_cat_l > 2:
             err = "Binary requires 2 categories. Use multinomial instead."
             raise ValueError(err)
+        # seed the solver from the imputer's stream unless a seed was given
+        rs = self.random_state
+        rs = _rng_seed(self.rng) if rs is None else rs
+        self.glm.set_params(random_state=rs)
         self.glm.fit(X, y.codes)
         self.statistics_ = {"param": y.categories, "strategy": self.strategy}
         return self
@@ -123,16 +136,25 @@ class MultinomialLogisticImputer(ISeriesImputer):
 
         Args:
             **kwargs: keyword arguments passed to LogisticRegression.
+                If `random_state` not given, the solver is seeded from the
+                imputer's random Generator (see `rng`), and the fit is not
+                shared across imputations (see `deterministic_fit`).
 
         """
         self.solver = kwargs.pop("solver", "saga")
         self.multiclass = kwargs.pop("multi_class", "multinomial")
+        self.random_state = kwargs.pop("random_state", None)
         self.glm = LogisticRegression(
             solver=self.solver,
             multi_class=self.multiclass,
             **kwargs
         )
 
+    @property
+    def deterministic_fit(self):
+        """The fit is deterministic only if the solver's seed is given."""
+        return self.random_state is not None
+
     def fit(self, X, y):
         """Fit the Imputer to the dataset by fitting logistic model.
 
@@ -148,6 +170,10 @@ class MultinomialLogisticImputer(ISeriesImputer):
         if y_cat_l == 2:
             w = "Multiple categories (c) expected. Use binary instead if c=2."
             warnings.warn(w)
+        # seed the solver from the imputer's stream unless a seed was given
+        rs = self.random_state
+        rs = _rng_seed(self.rng) if rs is None else rs
+        self.glm.set_params(random_state=rs)
         self.glm.fit(X, y.codes)
         self.statistics_ = {"param": y.categories, "strategy": self.strategy}
         return self
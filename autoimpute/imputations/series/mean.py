@@ -10,12 +10,13 @@ for a given column.
 from sklearn.utils.validation import check_is_fitted
 from autoimpute.imputations import method_names
 from autoimpute.imputations.errors import _not_num_series
-from .base import ISeriesImputer
+from autoimpute.imputations.sketches import Moments
+from .base import ISketchImputer
 methods = method_names
 # pylint:disable=attribute-defined-outside-init
 # pylint:disable=unnecessary-pass
 
-class MeanImputer(ISeriesImputer):
+class MeanImputer(ISketchImputer):
     """Impute missing values with the mean of the observed data.
 
     This imputer imputes missing values with the mean of observed data.
@@ -46,6 +47,27 @@ class MeanImputer(ISeriesImputer):
         self.statistics_ = {"param": mu, "strategy": self.strategy}
         return self
 
+    def partial_fit(self, X, y=None):
+        """Update the running moments of the imputer with a chunk of a Series.
+
+        Args:
+            X (pd.Series): chunk of the dataset to fit the imputer.
+            y (None): ignored, None to meet requirements of base class
+
+        Returns:
+            self. Instance of the class.
+        """
+        _not_num_series(self.strategy, X)
+        return super().partial_fit(X, y)
+
+    def _new_sketch(self):
+        """Private method to create running moments of observed values."""
+        return Moments()
+
+    def _sketch_param(self):
+        """Private method to get the param from the sketch of observed."""
+        return self.sketch_.mean
+
     def impute(self, X):
         """Perform imputations using the statistics generated from fit.
 
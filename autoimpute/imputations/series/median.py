@@ -10,12 +10,13 @@ for a given column.
 from sklearn.utils.validation import check_is_fitted
 from autoimpute.imputations import method_names
 from autoimpute.imputations.errors import _not_num_series
-from .base import ISeriesImputer
+from autoimpute.imputations.sketches import QuantileSketch
+from .base import ISketchImputer
 methods = method_names
 # pylint:disable=attribute-defined-outside-init
 # pylint:disable=unnecessary-pass
 
-class MedianImputer(ISeriesImputer):
+class MedianImputer(ISketchImputer):
     """Impute missing values with the median of the observed data.
 
     This imputer imputes missing values with the median of observed data.
@@ -46,6 +47,27 @@ class MedianImputer(ISeriesImputer):
         self.statistics_ = {"param": median, "strategy": self.strategy}
         return self
 
+    def partial_fit(self, X, y=None):
+        """Update the quantile sketch of the imputer with a chunk of a Series.
+
+        Args:
+            X (pd.Series): chunk of the dataset to fit the imputer.
+            y (None): ignored, None to meet requirements of base class
+
+        Returns:
+            self. Instance of the class.
+        """
+        _not_num_series(self.strategy, X)
+        return super().partial_fit(X, y)
+
+    def _new_sketch(self):
+        """Private method to create a quantile sketch of observed values."""
+        return QuantileSketch()
+
+    def _sketch_param(self):
+        """Private method to get the param from the sketch of observed."""
+        return self.sketch_.quantile(0.5)
+
     def impute(self, X):
         """Perform imputations using the statistics generated from fit.
 
@@ -7,15 +7,15 @@ strategy across all the columns in a dataframe, or specify this strategy
 for a given column.
 """
 
-import numpy as np
 import pandas as pd
 from sklearn.utils.validation import check_is_fitted
 from autoimpute.imputations import method_names
-from .base import ISeriesImputer
+from autoimpute.imputations.sketches import FrequentItems
+from .base import ISketchImputer
 methods = method_names
 # pylint:disable=attribute-defined-outside-init
 
-class ModeImputer(ISeriesImputer):
+class ModeImputer(ISketchImputer):
     """Impute missing values with the mode of the observed data.
 
     The mode imputer calculates the mode of the observed dataset and uses
@@ -77,6 +77,14 @@ class ModeImputer(ISeriesImputer):
         self.statistics_ = {"param": mode, "strategy": self.strategy}
         return self
 
+    def _new_sketch(self):
+        """Private method to count the most frequent observed values."""
+        return FrequentItems()
+
+    def _sketch_param(self):
+        """Private method to get the param from the sketch of observed."""
+        return self.sketch_.modes()
+
     def impute(self, X):
         """Perform imputations using the statistics generated from fit.
 
@@ -117,7 +125,7 @@ class ModeImputer(ISeriesImputer):
             if num_modes == 1:
                 imp = imp[0]
             else:
-                samples = np.random.choice(imp, len(ind))
+                samples = self.rng.choice(imp, len(ind))
                 imp = pd.Series(samples, index=ind).values
 
         # finally, fill in the right fill values for missing X
@@ -7,16 +7,16 @@ broadcast the strategy across all the columns in a dataframe, or specify this
 strategy for a given column.
 """
 
-from scipy.stats import norm
 from sklearn.utils.validation import check_is_fitted
 from autoimpute.imputations import method_names
 from autoimpute.imputations.errors import _not_num_series
-from .base import ISeriesImputer
+from autoimpute.imputations.sketches import Moments
+from .base import ISketchImputer
 methods = method_names
 # pylint:disable=attribute-defined-outside-init
 # pylint:disable=unnecessary-pass
 
-class NormImputer(ISeriesImputer):
+class NormImputer(ISketchImputer):
     """Impute missing data with draws from normal distribution.
 
     The NormImputer constructs a normal distribution using the sample mean and
@@ -50,6 +50,27 @@ class NormImputer(ISeriesImputer):
         self.statistics_ = {"param": moments, "strategy": self.strategy}
         return self
 
+    def partial_fit(self, X, y=None):
+        """Update the running moments of the imputer with a chunk of a Series.
+
+        Args:
+            X (pd.Series): chunk of the dataset to fit the imputer.
+            y (None): ignored, None to meet requirements of base class
+
+        Returns:
+            self. Instance of the class.
+        """
+        _not_num_series(self.strategy, X)
+        return super().partial_fit(X, y)
+
+    def _new_sketch(self):
+        """Private method to create running moments of observed values."""
+        return Moments()
+
+    def _sketch_param(self):
+        """Private method to get the param from the sketch of observed."""
+        return (self.sketch_.mean, self.sketch_.std)
+
     def impute(self, X):
         """Perform imputations using the statistics generated from fit.
 
@@ -72,7 +93,7 @@ class NormImputer(ISeriesImputer):
 
         # create normal distribution and sample from it
         imp_mean, imp_std = self.statistics_["param"]
-        imp = norm(imp_mean, imp_std).rvs(size=len(ind))
+        imp = self.rng.normal(imp_mean, imp_std, size=len(ind))
         return imp
 
     def fit_impute(self, X, y):
@@ -9,13 +9,16 @@ dataframe, or specify this strategy for a given column.
 """
 
 import numpy as np
-import pymc3 as pm
-from pandas import DataFrame
-from scipy.stats import multivariate_normal
 from sklearn.linear_model import LinearRegression
 from sklearn.utils.validation import check_is_fitted
 from autoimpute.imputations import method_names
-from autoimpute.imputations.helpers import _neighbors
+from autoimpute.imputations.helpers import _neighbors, _donor_index
+from autoimpute.imputations.helpers import _row_mean, _row_choice
+from autoimpute.imputations.helpers import _check_inference
+from autoimpute.imputations.helpers import _pymc3_model, _pymc3_posterior
+from autoimpute.imputations.helpers import _norm_draw_fit, _norm_draw
+from autoimpute.imputations.helpers import _lm_fit_stats
+from autoimpute.imputations.sketches import LeastSquaresStats
 from autoimpute.imputations.errors import _not_num_series
 from .base import ISeriesImputer
 methods = method_names
@@ -31,14 +34,16 @@ class PMMImputer(ISeriesImputer):
     PMM finds the `n` closest neighbors from a least squares regression
     prediction set, and samples from the corresponding true values for y of
     each of those `n` predictions. The imputation is the resulting sample.
-    To implement bayesian least squares, the imputer utlilizes the pymc3
-    library. The imputer can be used directly, but such behavior is
-    discouraged. PmmImputer does not have the flexibility / robustness of
-    dataframe imputers, nor is its behavior identical. Preferred use is
-    MultipleImputer(strategy="pmm").
+    By default, the bayesian coefficients are drawn exactly from the least
+    squares fit (MICE's norm.draw). Otherwise, the imputer utlilizes the
+    pymc3 library to sample them. The imputer can be used directly, but such
+    behavior is discouraged. PmmImputer does not have the flexibility /
+    robustness of dataframe imputers, nor is its behavior identical.
+    Preferred use is MultipleImputer(strategy="pmm").
     """
     # class variables
     strategy = methods.PMM
+    engines = ("norm.draw", "pymc3")
 
     def __init__(self, **kwargs):
         """Create an instance of the PMMImputer class.
@@ -66,6 +71,14 @@ class PMMImputer(ISeriesImputer):
                 to sample. Default = 1000.
             init (str, Optional): MCMC algo to use for posterior sampling.
                 Default = 'auto'. See pymc3 docs for more info on choices.
+            inference (str, Optional): how to get the posterior. Default is
+                'nuts', which samples with MCMC. 'advi' fits a variational
+                approximation with `pm.fit`, stopping once its parameters
+                converge, then draws `sample` values from it. 'minibatch
+                advi' fits the approximation on random batches of rows.
+            n_iter (int, Optional): max iterations of advi. Default 10000.
+            batch_size (int, Optional): rows in each batch when inference is
+                'minibatch advi'. Default 1000.
             fill_value (str, Optional): How to draw from the posterior to
                 create imputations. Default is "random". 'random' and 'mean'
                 supported for explicit options.
@@ -77,6 +90,12 @@ class PMMImputer(ISeriesImputer):
             normalize (bool, Optional): sklearn LinearRegression param.
             copy_x (bool, Optional): sklearn LinearRegression param.
             n_jobs (int, Optional): sklearn LinearRegression param.
+            engine (str, Optional): how to draw alpha and beta for each
+                imputation. Default is 'norm.draw', which draws sigma**2
+                from its scaled inverse chi-square and alpha, beta from
+                N(ls estimate, sigma**2 * inv(X'X)), using the least squares
+                fit. Priors, sampling and inference args do not apply.
+                'pymc3' samples the bayesian model with pymc3 instead.
         """
         self.am = kwargs.pop("am", None)
         self.asd = kwargs.pop("asd", 10)
@@ -86,12 +105,16 @@ class PMMImputer(ISeriesImputer):
         self.sample = kwargs.pop("sample", 1000)
         self.tune = kwargs.pop("tune", 1000)
         self.init = kwargs.pop("init", "auto")
+        self.inference = kwargs.pop("inference", "nuts")
+        self.n_iter = kwargs.pop("n_iter", 10000)
+        self.batch_size = kwargs.pop("batch_size", 1000)
         self.fill_value = kwargs.pop("fill_value", "random")
         self.neighbors = kwargs.pop("neighbors", 5)
         self.fit_intercept = kwargs.pop("fit_intercept", True)
         self.normalize = kwargs.pop("normalize", False)
         self.copy_x = kwargs.pop("copy_x", True)
         self.n_jobs = kwargs.pop("n_jobs", None)
+        self.engine = kwargs.pop("engine", "norm.draw")
         self.lm = LinearRegression(
             self.fit_intercept,
             self.normalize,
@@ -109,13 +132,27 @@ class PMMImputer(ISeriesImputer):
 
         Returns:
             self. Instance of the class.
+
+        Raises:
+            ValueError: engine must be one of `norm.draw` or `pymc3`.
         """
         _not_num_series(self.strategy, y)
-        nc = len(X.columns)
+        if self.engine not in self.engines:
+            err = f"{self.engine} engine not supported. Use {self.engines}."
+            raise ValueError(err)
 
         # get predictions for the data, which will be used for "closest" vals
-        y_pred = self.lm.fit(X, y).predict(X)
-        y_df = DataFrame({"y": y, "y_pred": y_pred})
+        # least squares is solved from the sufficient statistics of the fit
+        stats = LeastSquaresStats(self.fit_intercept).update(X, y)
+        y_pred = _lm_fit_stats(self.lm, stats).predict(X)
+        donors = _donor_index(y, y_pred)
+
+        # norm.draw only needs the same statistics of the least squares fit
+        if self.engine == "norm.draw":
+            fit = _norm_draw_fit(stats)
+            params = {"fit": fit, "donors": donors}
+            self.statistics_ = {"param": params, "strategy": self.strategy}
+            return self
 
         # calculate bayes and use appropriate means for alpha and beta priors
         # here we specify the point estimates from the linear regression as the
@@ -131,13 +168,10 @@ class PMMImputer(ISeriesImputer):
         # if not the case and proper values for the priors are not specified
         # separately, also assumes each beta is normal and "independent"
         # while betas likely not independent, this is technically a rule of OLS
-        with pm.Model() as fit_model:
-            alpha = pm.Normal("alpha", self.am, sd=self.asd)
-            beta = pm.Normal("beta", self.bm, sd=self.bsd, shape=nc)
-            sigma = pm.HalfCauchy("σ", self.sig)
-            mu = alpha+beta.dot(X.T)
-            score = pm.Normal("score", mu, sd=sigma, observed=y)
-        params = {"model": fit_model, "y_obs": y_df}
+        # the model graph is cached, so the data to sample it with is stored
+        _check_inference(self.inference)
+        fit_model, data = _pymc3_model(self, X, y)
+        params = {"model": fit_model, "data": data, "donors": donors}
         self.statistics_ = {"param": params, "strategy": self.strategy}
         return self
 
@@ -158,43 +192,43 @@ class PMMImputer(ISeriesImputer):
         """
         # check if fitted then predict with least squares
         check_is_fitted(self, "statistics_")
-        model = self.statistics_["param"]["model"]
-        df = self.statistics_["param"]["y_obs"]
-        df = df.reset_index(drop=True)
-
-        # generate posterior distribution for alpha, beta coefficients
-        with model:
-            tr = pm.sample(
-                self.sample,
-                tune=self.tune,
-                init=self.init,
-                **self.sample_kwargs
-            )
-        self.trace_ = tr
-
+        params = self.statistics_["param"]
+        donors = params["donors"]
+
+        # draw alpha and beta exactly, given the least squares fit
+        if self.engine == "norm.draw":
+            coef = _norm_draw(self.rng, params["fit"])
+            if self.fit_intercept:
+                alpha_bayes, beta_bayes = coef[0], coef[1:]
+            else:
+                alpha_bayes, beta_bayes = 0, coef
+
+        # otherwise generate posterior distribution for alpha, beta
         # sample random alpha from alpha posterior distribution
         # get the mean and covariance of the multivariate betas
         # betas assumed multivariate normal by linear reg rules
         # sample beta w/ cov structure to create realistic variability
-        alpha_bayes = np.random.choice(tr["alpha"])
-        beta_means = tr["beta"].mean(0)
-        beta_cov = np.cov(tr["beta"].T)
-        beta_bayes = np.array(multivariate_normal(beta_means, beta_cov).rvs())
+        else:
+            tr = _pymc3_posterior(self, params["model"], params["data"])
+            self.trace_ = tr
+            alpha_bayes = self.rng.choice(tr["alpha"])
+            beta_means = tr["beta"].mean(0)
+            beta_cov = np.atleast_2d(np.cov(tr["beta"].T))
+            beta_bayes = self.rng.multivariate_normal(beta_means, beta_cov)
 
         # predictions for missing y, using bayes alpha + coeff samples
         # use these preds for nearest neighbor search from reg results
         # neighbors are nearest from prediction model fit on observed
         # imputed values are actual y vals corresponding to nearest neighbors
         # therefore, this is a form of "hot-deck" imputation
-        y_pred_bayes = alpha_bayes + beta_bayes.dot(X.T)
+        # donors sorted at fit, so all neighbors are found in one search
+        y_pred_bayes = np.asarray(alpha_bayes + beta_bayes.dot(X.T))
         n_ = self.neighbors
-        if X.columns.size == 1:
-            y_pred_bayes = y_pred_bayes[0]
         if self.fill_value == "mean":
-            imp = [_neighbors(x, n_, df, np.mean) for x in y_pred_bayes]
+            imp = _neighbors(y_pred_bayes, n_, donors, _row_mean)
         elif self.fill_value == "random":
-            choice = np.random.choice
-            imp = [_neighbors(x, n_, df, choice) for x in y_pred_bayes]
+            choice = _row_choice(self.rng)
+            imp = _neighbors(y_pred_bayes, n_, donors, choice)
         else:
             err = f"{self.fill_value} must be `mean` or `random`."
             raise ValueError(err)
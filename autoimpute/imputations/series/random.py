@@ -7,15 +7,15 @@ strategy = `random` to broadcast the strategy across all the columns in a
 dataframe, or specify this strategy for a given column.
 """
 
-import numpy as np
 from sklearn.utils.validation import check_is_fitted
 from autoimpute.imputations import method_names
-from .base import ISeriesImputer
+from autoimpute.imputations.sketches import DistinctSample
+from .base import ISketchImputer
 methods = method_names
 # pylint:disable=attribute-defined-outside-init
 # pylint:disable=unnecessary-pass
 
-class RandomImputer(ISeriesImputer):
+class RandomImputer(ISketchImputer):
     """Impute missing data using random draws from observed data.
 
     The RandomImputer samples with replacement from observed data. The imputer
@@ -46,6 +46,14 @@ class RandomImputer(ISeriesImputer):
         self.statistics_ = {"param": random, "strategy": self.strategy}
         return self
 
+    def _new_sketch(self):
+        """Private method to sample the distinct observed values."""
+        return DistinctSample()
+
+    def _sketch_param(self):
+        """Private method to get the param from the sketch of observed."""
+        return list(self.sketch_.values)
+
     def impute(self, X):
         """Perform imputations using the statistics generated from fit.
 
@@ -65,7 +73,7 @@ class RandomImputer(ISeriesImputer):
 
         # get the observed values and sample from them
         param = self.statistics_["param"]
-        imp = np.random.choice(param, len(ind))
+        imp = self.rng.choice(param, len(ind))
         return imp
 
     def fit_impute(self, X, y=None):
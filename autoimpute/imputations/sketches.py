@@ -0,0 +1,371 @@
+"""Mergeable sketches used to fit univariate imputers on streams of data.
+
+This module contains the sketches univariate series-imputers update in
+`partial_fit`. Each sketch summarizes the observed values of a column in
+bounded memory, is updated one batch of values at a time, and can merge
+with another sketch of the same kind. Sketches fit on separate chunks or
+partitions of a column therefore merge into the sketch of the whole column.
+- Moments: count, mean and sum of squared deviations (exact).
+- QuantileSketch: weighted compactors for quantiles with bounded rank error.
+- FrequentItems: Misra-Gries counts of the most frequent values.
+- DistinctSample: uniform sample of distinct values, by smallest hash.
+- LeastSquaresStats: sufficient statistics of a least squares regression.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import numpy as np
+import pandas as pd
+from autoimpute.utils.resources import current_budget
+
+def _partition_stats(partition, fit_intercept):
+    """Private method to get least squares stats of one (X, y) partition."""
+    X, y = partition
+    return LeastSquaresStats(fit_intercept).update(X, y)
+
+class Moments:
+    """Count, mean and sum of squared deviations of observed values.
+
+    Batches are combined with the parallel update of Chan et al., so the
+    moments are exact and do not depend on how the values were split.
+    """
+
+    def __init__(self):
+        """Create an instance of the Moments class with no values."""
+        self.n = 0
+        self.mu = 0.0
+        self.m2 = 0.0
+
+    def update(self, values):
+        """Update the moments with an array of observed values."""
+        values = np.asarray(values, dtype=float)
+        if values.size:
+            batch = Moments()
+            batch.n = values.size
+            batch.mu = values.mean()
+            batch.m2 = np.square(values - batch.mu).sum()
+            self.merge(batch)
+        return self
+
+    def merge(self, other):
+        """Merge the moments of another Moments into this one."""
+        n = self.n + other.n
+        if not other.n:
+            return self
+        delta = other.mu - self.mu
+        self.mu += delta * other.n / n
+        self.m2 += other.m2 + delta**2 * self.n * other.n / n
+        self.n = n
+        return self
+
+    @property
+    def mean(self):
+        """Mean of the values, or nan if there are none."""
+        return self.mu if self.n else np.nan
+
+    @property
+    def std(self):
+        """Sample standard deviation of the values, as in pandas."""
+        return np.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else np.nan
+
+class QuantileSketch:
+    """Quantiles of observed values from compactors of weighted values.
+
+    Level h holds values that each stand for 2**h observed values. When a
+    level holds more than `k` values, it is sorted and every other value is
+    promoted to the next level. The rank error of a quantile grows with the
+    number of levels, about log2(n / k) / k. Until the first compaction,
+    every value is kept and quantiles are exact.
+    """
+
+    def __init__(self, k=1000):
+        """Create an instance of the QuantileSketch class.
+
+        Args:
+            k (int, optional): max values per level. Default is 1000.
+        """
+        self.k = k
+        self.levels = [np.empty(0)]
+        self._offset = 0
+
+    def update(self, values):
+        """Update the sketch with an array of observed values."""
+        values = np.asarray(values, dtype=float)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Merge the levels of another QuantileSketch into this one."""
+        for h, values in enumerate(other.levels):
+            if h == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[h] = np.concatenate([self.levels[h], values])
+        self._compress()
+        return self
+
+    def _compress(self):
+        """Private method to compact each level that holds over k values.
+
+        The offset of the values promoted alternates between compactions,
+        so neither the smaller nor the larger values are favored.
+        """
+        h = 0
+        while h < len(self.levels):
+            values = self.levels[h]
+            if len(values) > self.k:
+                values = np.sort(values)
+                keep = len(values) % 2
+                promote = values[keep:][self._offset::2]
+                self._offset ^= 1
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[h+1] = np.concatenate([self.levels[h+1], promote])
+                self.levels[h] = values[:keep]
+            h += 1
+
+    def quantile(self, q):
+        """Quantile q of the values, or nan if there are none."""
+        if len(self.levels) == 1:
+            values = self.levels[0]
+            return np.quantile(values, q) if values.size else np.nan
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(v), 2.0**h) for h, v in enumerate(self.levels)
+        ])
+        order = np.argsort(values)
+        cum = np.cumsum(weights[order])
+        return values[order][np.searchsorted(cum, q * cum[-1])]
+
+class FrequentItems:
+    """Counts of the most frequent observed values (Misra-Gries).
+
+    At most `capacity` values are counted. When more are seen, the
+    (capacity + 1)th largest count is subtracted from every count, and values
+    left without a positive count are dropped. Each count then falls short
+    of the true count by at most n / (capacity + 1). If no more than
+    `capacity` distinct values are seen, counts are exact.
+    """
+
+    def __init__(self, capacity=1000):
+        """Create an instance of the FrequentItems class.
+
+        Args:
+            capacity (int, optional): max values counted. Default is 1000.
+        """
+        self.capacity = capacity
+        self.counts = {}
+        self.n = 0
+
+    def update(self, values):
+        """Update the counts with an array of observed values."""
+        values = pd.Series(values)
+        self.n += len(values)
+        self._add(values.value_counts().to_dict())
+        return self
+
+    def merge(self, other):
+        """Merge the counts of another FrequentItems into this one."""
+        self.n += other.n
+        self._add(other.counts)
+        return self
+
+    def _add(self, counts):
+        """Private method to add counts, then keep at most capacity values."""
+        merged = dict(self.counts)
+        for value, count in counts.items():
+            merged[value] = merged.get(value, 0) + count
+        if len(merged) > self.capacity:
+            cut = np.sort(list(merged.values()))[::-1][self.capacity]
+            merged = {v: c - cut for v, c in merged.items() if c > cut}
+        self.counts = merged
+
+    def modes(self):
+        """Sorted values with the largest count, as in pandas mode."""
+        if not self.counts:
+            return np.empty(0)
+        top = max(self.counts.values())
+        modes = pd.Series([v for v, c in self.counts.items() if c == top])
+        return modes.sort_values().values
+
+    def proportions(self):
+        """Share of the counts of each value, sorted from most frequent."""
+        counts = pd.Series(self.counts, dtype=float)
+        counts = counts.sort_values(ascending=False, kind="stable")
+        return counts / counts.sum()
+
+class DistinctSample:
+    """Uniform sample of the distinct observed values, by smallest hash.
+
+    Each distinct value is hashed, and the `capacity` values with smallest
+    hashes are kept. The sample does not depend on how often or in what
+    order values are seen, so samples merge by union. If no more than
+    `capacity` distinct values are seen, every one of them is kept.
+    """
+
+    def __init__(self, capacity=10000):
+        """Create an instance of the DistinctSample class.
+
+        Args:
+            capacity (int, optional): max values kept. Default is 10000.
+        """
+        self.capacity = capacity
+        self.values = np.empty(0, dtype=object)
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    def update(self, values):
+        """Update the sample with an array of observed values."""
+        values = pd.Series(pd.unique(pd.Series(values)), dtype=object)
+        hashes = pd.util.hash_pandas_object(values, index=False).values
+        self._add(values.values, hashes)
+        return self
+
+    def merge(self, other):
+        """Merge the sample of another DistinctSample into this one."""
+        self._add(other.values, other.hashes)
+        return self
+
+    def _add(self, values, hashes):
+        """Private method to add values, then keep the smallest hashes."""
+        values = np.concatenate([self.values, values])
+        hashes = np.concatenate([self.hashes, hashes])
+        hashes, first = np.unique(hashes, return_index=True)
+        self.values = values[first][:self.capacity]
+        self.hashes = hashes[:self.capacity]
+
+class LeastSquaresStats:
+    """Sufficient statistics of a least squares regression of y on X.
+
+    Stores n, the means of X and y, and the centered cross products of X and
+    y, which are X'X, X'y and y'y after centering. Centering keeps the
+    normal equations well conditioned when values are far from 0. Batches
+    combine with the parallel update of Chan et al., so statistics computed
+    on partitions, even in separate processes, merge into those of the
+    whole dataset. Coefficients and residual variance are then found
+    without the rows themselves.
+    """
+
+    def __init__(self, fit_intercept=True):
+        """Create an instance of the LeastSquaresStats class.
+
+        Args:
+            fit_intercept (bool, optional): whether the regression has an
+                intercept. Default is True.
+        """
+        self.fit_intercept = fit_intercept
+        self.n = 0
+        self.mean_x = None
+        self.mean_y = 0.0
+        self.sxx = None
+        self.sxy = None
+        self.syy = 0.0
+
+    @classmethod
+    def from_partitions(cls, partitions, fit_intercept=True, n_jobs=1):
+        """Compute statistics of each partition, then merge them.
+
+        Args:
+            partitions (iter): (X, y) pairs of predictors and response.
+            fit_intercept (bool, optional): whether the regression has an
+                intercept. Default is True.
+            n_jobs (int, optional): processes used to compute statistics of
+                the partitions. Default is 1. -1 uses all cores. Processes
+                are capped by the cores of the current `core_budget`.
+
+        Returns:
+            LeastSquaresStats: statistics of all partitions.
+        """
+        budget = current_budget()
+        requested = budget.n_cores if n_jobs == -1 else n_jobs
+        workers, _ = budget.split(requested)
+        stats = cls(fit_intercept)
+        if workers == 1:
+            for X, y in partitions:
+                stats.update(X, y)
+            return stats
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = executor.map(_partition_stats, partitions,
+                                 repeat(fit_intercept))
+            for part in parts:
+                stats.merge(part)
+        return stats
+
+    def update(self, X, y):
+        """Update the statistics with predictors X and response y."""
+        if not len(y):
+            return self
+        X = np.asarray(X, dtype=float).reshape(len(y), -1)
+        y = np.asarray(y, dtype=float)
+        batch = LeastSquaresStats(self.fit_intercept)
+        batch.n = len(y)
+        batch.mean_x, batch.mean_y = X.mean(0), y.mean()
+        xc, yc = X - batch.mean_x, y - batch.mean_y
+        batch.sxx, batch.sxy, batch.syy = xc.T @ xc, xc.T @ yc, yc @ yc
+        return self.merge(batch)
+
+    def merge(self, other):
+        """Merge the statistics of another LeastSquaresStats into this one.
+
+        Raises:
+            ValueError: both must agree on fit_intercept and predictors.
+        """
+        if other.fit_intercept != self.fit_intercept:
+            raise ValueError("Statistics must agree on fit_intercept.")
+        if not other.n:
+            return self
+        if not self.n:
+            self.n, self.mean_x = other.n, other.mean_x
+            self.mean_y = other.mean_y
+            self.sxx, self.sxy, self.syy = other.sxx, other.sxy, other.syy
+            return self
+        if other.sxx.shape != self.sxx.shape:
+            raise ValueError("Statistics must have the same predictors.")
+        n = self.n + other.n
+        w = self.n * other.n / n
+        dx, dy = other.mean_x - self.mean_x, other.mean_y - self.mean_y
+        self.sxx = self.sxx + other.sxx + np.outer(dx, dx) * w
+        self.sxy = self.sxy + other.sxy + dx * dy * w
+        self.syy = self.syy + other.syy + dy**2 * w
+        self.mean_x = self.mean_x + dx * other.n / n
+        self.mean_y = self.mean_y + dy * other.n / n
+        self.n = n
+        return self
+
+    @property
+    def xtx(self):
+        """Uncentered X'X of the predictors."""
+        return self.sxx + self.n * np.outer(self.mean_x, self.mean_x)
+
+    @property
+    def xty(self):
+        """Uncentered X'y of the predictors and response."""
+        return self.sxy + self.n * self.mean_x * self.mean_y
+
+    @property
+    def yty(self):
+        """Uncentered y'y of the response."""
+        return self.syy + self.n * self.mean_y**2
+
+    def solve(self):
+        """Least squares coefficients and intercept (0 if no intercept).
+
+        Singular systems, e.g. from collinear predictors, get the minimum
+        norm solution, as with a pseudo-inverse.
+        """
+        if self.fit_intercept:
+            coef = np.linalg.lstsq(self.sxx, self.sxy, rcond=None)[0]
+            return coef, self.mean_y - self.mean_x @ coef
+        return np.linalg.lstsq(self.xtx, self.xty, rcond=None)[0], 0.0
+
+    def rss(self):
+        """Residual sum of squares of the least squares fit."""
+        coef, _ = self.solve()
+        if self.fit_intercept:
+            rss = self.syy - coef @ self.sxy
+        else:
+            rss = self.yty - coef @ self.xty
+        return max(rss, 0.0)
+
+    def mse(self):
+        """Mean squared error of the fit on the rows it was fit with."""
+        return self.rss() / self.n
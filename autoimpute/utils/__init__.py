@@ -2,12 +2,18 @@
 
 This module handles imports from the utils directory that should be accessible
 whenever someone imports autoimpute.utils. The imports include methods for
-checks & validations as well as functions to explore patterns in missing data.
+checks & validations, functions to explore patterns in missing data, the
+MissingMask, a compact record of where values are missing, the core_budget
+context, which shares cores across nested parallelism, and readers of Parquet
+files and Arrow datasets.
 
 This module handles `from autoimpute.utils import *` with the __all__ variable
 below. This command imports the main public methods from autoimpute.utils.
 """
 
+from .mask import MissingMask
+from .resources import CoreBudget, core_budget, current_budget
+from .datasets import check_dataset, read_dataset
 from .checks import check_data_structure, check_missingness
 from .checks import check_nan_columns, check_strategy_allowed
 from .checks import check_strategy_fit, check_predictors_fit
@@ -16,6 +22,12 @@ from .patterns import inbound, outbound, influx, outflux, flux
 from .patterns import proportions, nullility_cov, nullility_corr
 
 __all__ = [
+    "MissingMask",
+    "CoreBudget",
+    "core_budget",
+    "current_budget",
+    "check_dataset",
+    "read_dataset",
     "check_data_structure",
     "check_missingness",
     "check_nan_columns",
@@ -8,8 +8,75 @@ in different classes or methods where the same checks must be performed often.
 """
 
 import functools
+import threading
+from contextlib import contextmanager
 import numpy as np
 import pandas as pd
+from autoimpute.utils.mask import MissingMask
+
+# validation results cached per thread while a top-level call is running
+_VALIDATION = threading.local()
+
+@contextmanager
+def _validation_scope():
+    """Private context to cache data validation for a top-level call.
+
+    Scopes are re-entrant. The cache is created when the outermost scope is
+    entered and cleared when it exits, so nested and repeated checks of the
+    same DataFrame within one call validate it only once.
+    """
+    depth = getattr(_VALIDATION, "depth", 0)
+    if not depth:
+        _VALIDATION.cache = {}
+    _VALIDATION.depth = depth + 1
+    try:
+        yield
+    finally:
+        _VALIDATION.depth = depth
+        if not depth:
+            _VALIDATION.cache = {}
+
+def _forget_validation(data):
+    """Private method to drop cached validation of data modified in place."""
+    if getattr(_VALIDATION, "depth", 0):
+        _VALIDATION.cache.pop(id(data), None)
+
+def _validate(data):
+    """Private method to validate data in one pass, or get cached result.
+
+    Splits columns into time series and non time series columns with one
+    pass over the dtypes and counts missing values with one MissingMask.
+    Within a `_validation_scope`, results are cached by the identity and
+    columns of the DataFrame, so the same DataFrame is not validated twice,
+    but one whose columns were changed in place is validated again.
+
+    Returns:
+        dict: the MissingMask, missing counts per column, and the columns
+            that are (`ts`) and are not (`n_ts`) time series columns.
+    """
+    in_scope = getattr(_VALIDATION, "depth", 0)
+    if in_scope:
+        cached = _VALIDATION.cache.get(id(data))
+        if (cached is not None and cached[0] is data
+                and cached[1].equals(data.columns)):
+            return cached[2]
+
+    # partition the columns by dtype kind, then count missing values
+    kinds = np.array([dtype.kind for dtype in data.dtypes], dtype=object)
+    mask = MissingMask(data)
+    validated = {
+        "mask": mask,
+        "counts": mask.col_counts(),
+        "n_ts": data.columns[np.isin(kinds, ["i", "u", "f", "c", "O"])],
+        "ts": data.columns[kinds == "M"]
+    }
+    if in_scope:
+        _VALIDATION.cache[id(data)] = (data, data.columns, validated)
+    return validated
+
+def _missing_mask(data):
+    """Private method to get the MissingMask of data, cached if validated."""
+    return _validate(data)["mask"]
 
 def check_data_structure(func):
     """Check if the data input to a function is a pandas DataFrame.
@@ -61,6 +128,21 @@ def check_data_structure(func):
         return func(d, *args, **kwargs)
     return wrapper
 
+def _check_missingness(data, validated):
+    """Private method to check missingness of data using its validation."""
+    n_ts, ts = validated["n_ts"], validated["ts"]
+    counts = validated["counts"]
+
+    # check if non-time series columns are all missing, and if so, error
+    if n_ts.any():
+        if (counts[n_ts] == len(data)).all():
+            raise ValueError("All values missing, need some complete.")
+
+    # check if any time series columns have missing data, and if so, error
+    if ts.any():
+        if (counts[ts] > 0).any():
+            raise ValueError("Time series columns must be fully complete.")
+
 def check_missingness(func):
     """Check if accepted data contains all missing or no missing values.
 
@@ -102,37 +184,24 @@ def check_missingness(func):
             ValueError: If any timeseries values in data are missing.
         """
         # b/c of check_data_structure, we know 1 of (d, a) is DataFrame
-        if isinstance(d, pd.DataFrame):
-            n_ts = d.select_dtypes(include=(np.number, np.object))
-            ts = d.select_dtypes(include=(np.datetime64,))
-        else:
-            a = args[0]
-            n_ts = a.select_dtypes(include=(np.number, np.object))
-            ts = a.select_dtypes(include=(np.datetime64,))
-
-        # check if non-time series columns are all missing, and if so, error
-        if n_ts.columns.any():
-            missing_nts = pd.isnull(n_ts.values)
-            if missing_nts.all():
-                raise ValueError("All values missing, need some complete.")
-
-        # check if any time series columns have missing data, and if so, error
-        if ts.columns.any():
-            missing_ts = pd.isnull(ts.values)
-            if missing_ts.any():
-                raise ValueError("Time series columns must be fully complete.")
-
-        # return func if no missingness violations detected, then return wrap
-        return func(d, *args, **kwargs)
+        # validation is cached for calls nested within this one
+        data = d if isinstance(d, pd.DataFrame) else args[0]
+        with _validation_scope():
+            _check_missingness(data, _validate(data))
+
+            # return func if no missingness violations detected
+            return func(d, *args, **kwargs)
     return wrapper
 
 def check_nan_columns(func):
     """Checks if any column in accepted data has all missing values.
 
-    This method acts as a decorator. It leverages `check_missingness` to
-    verify data has real and missing values. It then checks each column to
-    ensure no columns are fully missing. Decorator leverages `functools.wrap`
-    to keep function names in place.
+    This method acts as a decorator. It performs the same checks as
+    `check_missingness` to verify data has real and missing values. It then
+    checks each column to ensure no columns are fully missing. Both checks
+    share one validation of the data, which is cached for nested calls with
+    the same DataFrame. Decorator leverages `functools.wrap` to keep
+    function names in place.
 
     Args:
         func (function): The function that will be decorated.
@@ -141,7 +210,7 @@ def check_nan_columns(func):
         function: decorators return functions they wrap.
     """
     @functools.wraps(func)
-    @check_missingness
+    @check_data_structure
     def wrapper(d, *args, **kwargs):
         """Wrap function that checks if all rows in any one column missing.
 
@@ -159,18 +228,21 @@ def check_nan_columns(func):
             **kwargs: Keyword arguments for original function.
 
         Raises:
+            ValueError: If all values in data are missing.
+            ValueError: If any timeseries values in data are missing.
             ValueError: If all values in any column are missing.
         """
         # previous decorators ensure we are working with an accepted type
-        if isinstance(d, pd.DataFrame):
-            ndf = pd.isnull(d)
-        else:
-            ndf = pd.isnull(args[0])
-        nc = [c for c in ndf if ndf[c].all()]
-        if nc:
-            err = f"All values missing in column(s) {nc}. Should be removed."
-            raise ValueError(err)
-        return func(d, *args, **kwargs)
+        data = d if isinstance(d, pd.DataFrame) else args[0]
+        with _validation_scope():
+            validated = _validate(data)
+            _check_missingness(data, validated)
+            counts = validated["counts"]
+            nc = [c for c, n in counts.items() if n == len(data)]
+            if nc:
+                err = f"All values missing in column(s) {nc}. "
+                raise ValueError(f"{err}Should be removed.")
+            return func(d, *args, **kwargs)
     return wrapper
 
 def check_strategy_allowed(strat_names, s):
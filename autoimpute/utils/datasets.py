@@ -0,0 +1,155 @@
+"""Read and write the data of imputers as Parquet files or Arrow datasets.
+
+This module lets imputers take a Parquet path or a pyarrow Dataset in place
+of a pandas DataFrame. Only the columns an imputer uses are read, so wide
+tables cost I/O in proportion to the columns imputed or used as predictors.
+Datasets are read one row group at a time to impute and write them back to
+Parquet without holding the whole table in memory. pyarrow is an optional
+dependency, imported only when a dataset is used (`autoimpute[parquet]`).
+"""
+
+import os
+import functools
+
+def _pyarrow():
+    """Private method to import pyarrow, which is an optional dependency."""
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+    except ImportError as ie:
+        err = "Parquet files and Arrow datasets require pyarrow."
+        raise ImportError(err) from ie
+    return pa, ds, pq
+
+def is_dataset(data):
+    """Check if data is a Parquet path or an Arrow dataset.
+
+    Paths count if they exist, e.g. a directory of Parquet files, or end in
+    `.parquet`. Other strings are left to the imputer's type check.
+
+    Args:
+        data: data passed to an imputer.
+
+    Returns:
+        bool: whether data is a Parquet path or has an Arrow dataset's
+            `to_table`.
+    """
+    if isinstance(data, (str, os.PathLike)):
+        path = os.fspath(data)
+        return os.path.exists(path) or path.lower().endswith(".parquet")
+    return hasattr(data, "to_table")
+
+def _dataset(source):
+    """Private method to open a Parquet path as an Arrow dataset."""
+    if isinstance(source, (str, os.PathLike)):
+        _, ds, _ = _pyarrow()
+        return ds.dataset(os.fspath(source), format="parquet")
+    return source
+
+def dataset_columns(source):
+    """Get the names of the columns in a Parquet path or Arrow dataset."""
+    return list(_dataset(source).schema.names)
+
+def read_dataset(source, columns=None):
+    """Read columns of a Parquet path or Arrow dataset into a DataFrame.
+
+    Args:
+        source (str, os.PathLike, pyarrow.dataset.Dataset): data to read.
+        columns (list, optional): columns to read. Default is None, which
+            reads every column. Other columns are never read from disk.
+
+    Returns:
+        pd.DataFrame: the columns read, in the order of the dataset.
+    """
+    table = _dataset(source).to_table(columns=columns, use_threads=True)
+    return table.to_pandas()
+
+def row_groups(source):
+    """Get the file and id of each row group of a Parquet path or dataset.
+
+    The metadata of each file is read once here, so the row groups can then
+    be read one at a time, e.g. in worker processes, by their file and id.
+
+    Args:
+        source (str, os.PathLike, pyarrow.dataset.Dataset): data to split.
+
+    Returns:
+        list: (filesystem, path, id) of each row group, in dataset order.
+    """
+    return [(fragment.filesystem, fragment.path, group.id)
+            for fragment in _dataset(source).get_fragments()
+            for group in fragment.row_groups]
+
+def read_row_group(group, columns=None):
+    """Read columns of one row group of a dataset into a DataFrame.
+
+    Args:
+        group (tuple): (filesystem, path, id) of the row group, as given by
+            `row_groups`. Only the footer of its file is read to find it.
+        columns (list, optional): columns to read. Default is None.
+
+    Returns:
+        pd.DataFrame: the columns read from the row group.
+    """
+    _, _, pq = _pyarrow()
+    filesystem, path, group_id = group
+    with filesystem.open_input_file(path) as source:
+        parquet = pq.ParquetFile(source)
+        table = parquet.read_row_group(group_id, columns=columns)
+    return table.to_pandas()
+
+def write_parquet(groups, dests):
+    """Write row groups of one or more tables to Parquet files.
+
+    Args:
+        groups (iter): lists of DataFrames, one per file in `dests`. Each
+            list is written as the next row group of each file.
+        dests (list): paths of the Parquet files to write.
+
+    Returns:
+        list: paths of the files written.
+    """
+    pa, _, pq = _pyarrow()
+    writers = [None]*len(dests)
+    try:
+        for frames in groups:
+            for i, frame in enumerate(frames):
+                schema = writers[i].schema if writers[i] else None
+                table = pa.Table.from_pandas(
+                    frame, schema=schema, preserve_index=False
+                )
+                if writers[i] is None:
+                    writers[i] = pq.ParquetWriter(dests[i], table.schema)
+                writers[i].write_table(table)
+    finally:
+        for writer in writers:
+            if writer is not None:
+                writer.close()
+    return list(dests)
+
+def check_dataset(func):
+    """Read a Parquet path or Arrow dataset passed in place of a DataFrame.
+
+    This method acts as a decorator for methods of imputers that take data
+    as their first argument after self. If the data is a dataset, only the
+    columns the imputer uses are read into a DataFrame, which is passed to
+    the method instead. Imputers name those columns with a private
+    `_dataset_columns` method, given all the columns of the dataset. Without
+    it, every column is read. DataFrames pass through untouched.
+
+    Args:
+        func (function): The function that will be decorated.
+
+    Returns:
+        function: decorators return functions they wrap.
+    """
+    @functools.wraps(func)
+    def wrapper(self, data, *args, **kwargs):
+        """Wrap function that reads a dataset before it is used."""
+        if is_dataset(data):
+            used = getattr(self, "_dataset_columns", None)
+            columns = used(dataset_columns(data)) if used else None
+            data = read_dataset(data, columns)
+        return func(self, data, *args, **kwargs)
+    return wrapper
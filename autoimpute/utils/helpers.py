@@ -35,3 +35,43 @@ def _one_hot_encode(X):
     if cats > 0:
         X = pd.get_dummies(X, drop_first=True)
     return X
+
+def _encode_column(X, levels=None):
+    """Private method to one hot encode a single Series as a 2-D array.
+
+    Categoricals are encoded the same way as `_one_hot_encode`, dropping the
+    first level. Pass the `levels` kept at fit to encode new data the same
+    way. Returns the encoded array, the encoded column names, and levels.
+    """
+    types = pd.api.types
+    if not (types.is_object_dtype(X) or types.is_categorical_dtype(X)):
+        return np.asarray(X, dtype=float)[:, None], [X.name], None
+    if levels is None:
+        levels = list(pd.Categorical(X.dropna()).categories[1:])
+    lv = np.array(levels, dtype=object)
+    values = np.asarray(X, dtype=object)
+    encoded = (values[:, None] == lv[None, :]).astype(float)
+    return encoded, [f"{X.name}_{l}" for l in levels], levels
+
+def _design_matrix(X, levels=None):
+    """Private method to encode a DataFrame once into a numeric design matrix.
+
+    Models for different columns can then select their predictors as column
+    positions of the one matrix rather than each copying and encoding the
+    DataFrame again. Returns the design as a float array, the names of its
+    columns, a block map from each column of X to the positions of its
+    encoded columns, and the categorical levels used to encode each column.
+    """
+    levels = {} if levels is None else dict(levels)
+    arrays, names, blocks = [], [], {}
+    for col in X.columns:
+        encoded, enc_names, enc_levels = _encode_column(
+            X[col], levels.get(col, None)
+        )
+        if enc_levels is not None:
+            levels[col] = enc_levels
+        blocks[col] = np.arange(len(names), len(names) + len(enc_names))
+        arrays.append(encoded)
+        names.extend(enc_names)
+    design = np.hstack(arrays) if arrays else np.empty((len(X), 0))
+    return design, names, blocks, levels
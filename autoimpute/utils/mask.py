@@ -0,0 +1,161 @@
+"""Compact record of where values are missing in a DataFrame.
+
+This module contains one class - the MissingMask. The MissingMask computes
+missingness for a DataFrame once and stores it bit-packed, using 1 bit per
+cell. Checks, pattern methods and imputers throughout autoimpute consume the
+mask rather than calling `pd.isnull` on the full DataFrame again. The mask
+provides fast column and row counts, row pattern keys, and complete rows.
+"""
+
+import numpy as np
+import pandas as pd
+
+# number of set bits in each possible byte, used to count packed bits
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+class MissingMask:
+    """Bit-packed missingness indicator for each cell of a DataFrame.
+
+    Missingness for each column is packed into bytes, 8 rows per byte, so
+    the mask takes 1/8 the memory of a boolean DataFrame. Column counts and
+    complete rows are computed directly on the packed bytes. Row counts and
+    patterns unpack one column at a time.
+
+    Attributes:
+        columns (pd.Index): columns of the DataFrame the mask was built from.
+        index (pd.Index): index of the DataFrame the mask was built from.
+        shape (tuple): number of rows and columns in the DataFrame.
+    """
+
+    def __init__(self, data):
+        """Create an instance of the MissingMask class.
+
+        Args:
+            data (pd.DataFrame): DataFrame to record missingness of.
+
+        Raises:
+            TypeError: data must be a pandas DataFrame.
+        """
+        if not isinstance(data, pd.DataFrame):
+            err = f"{data.__class__.__name__} not of type pd.DataFrame"
+            raise TypeError(err)
+        self.columns = data.columns
+        self.index = data.index
+        self.shape = data.shape
+        self._pos = {c: i for i, c in enumerate(self.columns)}
+
+        # pack one column at a time, so full boolean frame never created
+        n_bytes = (self.shape[0] + 7) // 8
+        self._bits = np.empty((self.shape[1], n_bytes), dtype=np.uint8)
+        for i in range(self.shape[1]):
+            self._bits[i] = np.packbits(pd.isnull(data.iloc[:, i].values))
+
+    def _positions(self, columns):
+        """Private method to get the positions of columns in the mask."""
+        if columns is None:
+            return np.arange(self.shape[1])
+        return np.array([self._pos[c] for c in columns], dtype=int)
+
+    def column(self, col):
+        """Get a boolean array, True where values in a column are missing.
+
+        Args:
+            col (str): name of the column.
+
+        Returns:
+            np.ndarray: boolean missingness indicator for each row.
+        """
+        bits = self._bits[self._pos[col]]
+        return np.unpackbits(bits)[:self.shape[0]].astype(bool)
+
+    def to_array(self, columns=None):
+        """Get the unpacked mask as a 2-D boolean array.
+
+        Args:
+            columns (iter, optional): subset of columns. Default is None,
+                which returns every column.
+
+        Returns:
+            np.ndarray: boolean array with shape (rows, columns).
+        """
+        bits = self._bits[self._positions(columns)]
+        arr = np.unpackbits(bits, axis=1)[:, :self.shape[0]]
+        return arr.T.astype(bool)
+
+    def to_frame(self, columns=None):
+        """Get the unpacked mask as a boolean DataFrame, like `pd.isnull`."""
+        cols = self.columns if columns is None else columns
+        return pd.DataFrame(self.to_array(columns), columns=cols,
+                            index=self.index)
+
+    def col_counts(self):
+        """Count the missing values in each column.
+
+        Returns:
+            pd.Series: number of missing values, indexed by column.
+        """
+        counts = _POPCOUNT[self._bits].sum(axis=1)
+        return pd.Series(counts, index=self.columns)
+
+    def row_counts(self):
+        """Count the missing values in each row.
+
+        Returns:
+            np.ndarray: number of missing values in each row.
+        """
+        counts = np.zeros(self.shape[0], dtype=np.int64)
+        for bits in self._bits:
+            counts += np.unpackbits(bits)[:self.shape[0]]
+        return counts
+
+    def complete_rows(self, columns=None):
+        """Get rows with no missing values in any of the given columns.
+
+        Args:
+            columns (iter, optional): subset of columns. Default is None,
+                which checks every column.
+
+        Returns:
+            np.ndarray: boolean array, True where a row is fully observed.
+        """
+        pos = self._positions(columns)
+        if not pos.size:
+            return np.ones(self.shape[0], dtype=bool)
+        missing = np.bitwise_or.reduce(self._bits[pos], axis=0)
+        return ~np.unpackbits(missing)[:self.shape[0]].astype(bool)
+
+    def pattern_keys(self, columns=None):
+        """Get a hashable key for the missingness pattern of each row.
+
+        Rows with equal keys have the same missingness pattern across the
+        given columns. Keys are the row's packed bits, viewed as bytes.
+
+        Args:
+            columns (iter, optional): subset of columns. Default is None,
+                which uses every column.
+
+        Returns:
+            np.ndarray: 1-D array with one key for each row.
+        """
+        rows = np.packbits(self.to_array(columns), axis=1)
+        key = np.dtype((np.void, rows.shape[1]))
+        return np.ascontiguousarray(rows).view(key).ravel()
+
+    def patterns(self, columns=None):
+        """Get the unique row patterns of missingness and their counts.
+
+        Args:
+            columns (iter, optional): subset of columns. Default is None,
+                which uses every column.
+
+        Returns:
+            tuple: 2-D boolean array of unique patterns (True = missing) and
+                1-D array with the number of rows with each pattern.
+        """
+        n_cols = self.shape[1] if columns is None else len(columns)
+        keys, counts = np.unique(self.pattern_keys(columns),
+                                 return_counts=True)
+        packed = np.frombuffer(keys.tobytes(), dtype=np.uint8)
+        packed = packed.reshape(len(keys), -1)
+        unique = np.unpackbits(packed, axis=1)[:, :n_cols].astype(bool)
+        return unique, counts
@@ -12,6 +12,7 @@ import numpy as np
 import pandas as pd
 from autoimpute.utils import check_data_structure, check_missingness
 from autoimpute.utils.helpers import _sq_output, _index_output
+from autoimpute.utils.mask import MissingMask
 
 @check_data_structure
 def md_locations(data, both=False):
@@ -36,7 +37,7 @@ def md_locations(data, both=False):
     Raises:
         TypeError: if data is not a DataFrame. Error raised through decorator.
     """
-    md_df = pd.isnull(data)*1
+    md_df = MissingMask(data).to_frame()*1
     if both:
         md_df = pd.concat([data, md_df], axis=1)
     return md_df
@@ -62,7 +63,7 @@ def md_pairs(data):
         TypeError: if data is not a DataFrame. Error raised through decorator.
     """
     int_ln = lambda arr: np.logical_not(arr)*1
-    r = int_ln(pd.isnull(data.values))
+    r = int_ln(MissingMask(data).to_array())
     rr = np.matmul(r.T, r)
     mm = np.matmul(int_ln(r).T, int_ln(r))
     mr = np.matmul(int_ln(r).T, r)
@@ -80,7 +81,8 @@ def md_pattern(data):
     indicates the number of different row patterns of missingness. The 'nmis'
     column is the number of missing values in a given row pattern. The
     'count' is number of total rows with a given row pattern.
-    In this method, 0 = missing, 1 = missing.
+    In this method, 0 = missing, 1 = missing. As in md.pattern, columns are
+    ordered by their number of missing values, fewest first.
 
     Args:
         data (pd.DataFrame): DataFrame to calculate missing data pattern.
@@ -89,19 +91,20 @@ def md_pattern(data):
         pd.DataFrame: DataFrame with missing data pattern and two
             additional columns w/ row-wise stats: `count` and `nmis`.
     """
-    cols = data.columns.tolist()
-    r = pd.isnull(data.values)
-    nmis = np.sum(r, axis=0)
-    r = r[:, np.argsort(nmis)]
-    num_string = lambda row: "".join(str(e) for e in row)
-    pat = np.apply_along_axis(num_string, 1, r*1)
-    sort_r = r[np.argsort(pat), :]*1
-    sort_r_df = _sq_output(sort_r, cols, False)
-    sort_r_df = sort_r_df.groupby(cols).size().reset_index()
-    sort_r_df.columns = cols + ["count"]
-    sort_r_df["nmis"] = sort_r_df[cols].sum(axis=1)
-    sort_r_df[cols] = sort_r_df[cols].apply(np.logical_not)*1
-    return sort_r_df[["count"] + cols + ["nmis"]]
+    r, count = MissingMask(data).patterns()
+
+    # order columns by number missing, keeping ties in data order
+    by_nmis = np.argsort(count @ r, kind="stable")
+    cols = data.columns[by_nmis].tolist()
+    r = r[:, by_nmis]
+
+    # order patterns by column, observed before missing, as groupby would
+    order = np.lexsort(r.T[::-1])
+    r, count = r[order], count[order]
+    pattern_df = _sq_output(np.logical_not(r)*1, cols, False)
+    pattern_df["count"] = count
+    pattern_df["nmis"] = r.sum(axis=1)
+    return pattern_df[["count"] + cols + ["nmis"]]
 
 @check_missingness
 def nullility_cov(data):
@@ -124,7 +127,7 @@ def nullility_cov(data):
         ValueError: If DataFrame values all missing and none complete.
             Also raised through decorator.
     """
-    data_cov = data.isnull().cov()
+    data_cov = MissingMask(data).to_frame().cov()
     return data_cov.dropna(axis=0, how="all").dropna(axis=1, how="all")
 
 @check_missingness
@@ -155,7 +158,7 @@ def nullility_corr(data, method="pearson"):
     if method not in accepted_methods:
         err = f"Correlation method must be in {accepted_methods}"
         raise ValueError(err)
-    data_corr = data.isnull().corr(method=method)
+    data_corr = MissingMask(data).to_frame().corr(method=method)
     return data_corr.dropna(axis=0, how="all").dropna(axis=1, how="all")
 
 def _inbound(pairs):
@@ -302,8 +305,8 @@ def proportions(data):
     Raises:
         TypeError: if data not DataFrame. Error raised through decorator.
     """
-    poms = np.mean(pd.isnull(data), axis=0)
-    pobs = np.mean(np.logical_not(pd.isnull(data)), axis=0)
+    poms = MissingMask(data).col_counts() / len(data)
+    pobs = 1 - poms
     proportions_dict = dict(poms=poms, pobs=pobs)
     proportions_ = _index_output(proportions_dict, data.columns)
     return proportions_
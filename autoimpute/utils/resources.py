@@ -0,0 +1,131 @@
+"""Share one budget of cores across the nested parallelism in autoimpute.
+
+This module contains the CoreBudget and the `core_budget` context. Several
+levels of autoimpute can run in parallel: the MultipleImputer's imputations,
+pymc3 chains, estimators with `n_jobs` (sklearn, xgboost), and BLAS threads.
+Left alone, each level uses every core, so nesting them spawns cores**2
+threads. Within a `core_budget`, outer levels take their share of the cores
+first and pass what is left to the levels nested inside them.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from threadpoolctl import threadpool_limits
+
+# most cores pymc3 uses for chains by default, kept under a budget
+MAX_SAMPLER_CORES = 4
+
+# budgets entered in each thread, innermost last
+_BUDGETS = threading.local()
+
+class CoreBudget:
+    """Number of cores a job may use, split across nested parallelism.
+
+    Attributes:
+        n_cores (int): cores available to the job and everything it runs.
+    """
+
+    def __init__(self, n_cores=None):
+        """Create an instance of the CoreBudget class.
+
+        Args:
+            n_cores (int, optional): cores in the budget. Default is None,
+                which means all available cores. -1 also means all cores.
+
+        Raises:
+            TypeError: n_cores must be an integer.
+            ValueError: n_cores must be positive or -1.
+        """
+        if n_cores is None or n_cores == -1:
+            n_cores = os.cpu_count() or 1
+        if not isinstance(n_cores, int):
+            err = "n_cores must be an integer specifying number of cores."
+            raise TypeError(err)
+        if n_cores < 1:
+            err = "n_cores must be greater than zero, or -1 for all cores."
+            raise ValueError(err)
+        self.n_cores = n_cores
+
+    def __repr__(self):
+        """Representation of the budget with its number of cores."""
+        return f"CoreBudget(n_cores={self.n_cores})"
+
+    def split(self, n_workers):
+        """Split the budget among workers that run at the same time.
+
+        Args:
+            n_workers (int): workers requested, e.g. processes in a pool.
+
+        Returns:
+            tuple: number of workers the budget allows, and the CoreBudget
+                each of those workers gets for the work nested inside it.
+        """
+        workers = max(1, min(n_workers, self.n_cores))
+        return workers, CoreBudget(max(1, self.n_cores // workers))
+
+    def n_jobs(self, requested):
+        """Resolve an estimator's `n_jobs` within the budget.
+
+        None keeps the estimator's default. Negative values count back from
+        all cores in the budget, as in joblib, and positive values are
+        capped at the budget.
+        """
+        if requested is None:
+            return None
+        if requested < 0:
+            return max(1, self.n_cores + 1 + requested)
+        return min(requested, self.n_cores)
+
+    @property
+    def sampler_cores(self):
+        """Cores pymc3 may use to sample chains in parallel."""
+        return min(self.n_cores, MAX_SAMPLER_CORES)
+
+def current_budget():
+    """Get the innermost CoreBudget entered, or a budget of all cores."""
+    stack = getattr(_BUDGETS, "stack", None)
+    if stack:
+        return stack[-1]
+    return CoreBudget()
+
+@contextmanager
+def core_budget(n_cores=None):
+    """Run autoimpute within a budget of cores.
+
+    Inside the context, parallel work in autoimpute splits `n_cores` among
+    its levels rather than each level using all cores, and BLAS threads are
+    limited to the budget. Budgets nest, and the innermost one applies.
+
+    Args:
+        n_cores (int, CoreBudget, optional): cores in the budget. Default is
+            None, which means all available cores.
+
+    Yields:
+        CoreBudget: the budget in effect within the context.
+    """
+    budget = n_cores
+    if not isinstance(budget, CoreBudget):
+        budget = CoreBudget(n_cores)
+    if not hasattr(_BUDGETS, "stack"):
+        _BUDGETS.stack = []
+    _BUDGETS.stack.append(budget)
+    try:
+        with threadpool_limits(limits=budget.n_cores, user_api="blas"):
+            yield budget
+    finally:
+        _BUDGETS.stack.pop()
+
+@contextmanager
+def _sampler_scope(sample_kwargs):
+    """Private context to run pymc3 sampling within the current budget.
+
+    Sets the `cores` sampled on unless the user gave them, and limits BLAS
+    threads so that chains sampled in parallel share the budget.
+    """
+    budget = current_budget()
+    kwargs = dict(sample_kwargs)
+    kwargs.setdefault("cores", budget.sampler_cores)
+    threads = max(1, budget.n_cores // max(1, kwargs["cores"]))
+    with threadpool_limits(limits=threads, user_api="blas"):
+        yield kwargs
@@ -23,6 +23,7 @@ REQUIRED = [
     "xgboost",
     "scikit-learn",
     "pymc3",
+    "threadpoolctl",
     "seaborn",
     "missingno"
 ]
@@ -39,7 +40,9 @@ CLASSIFIERS = [
     "Topic :: Software Development",
     "Topic :: Scientific/Engineering"
 ]
-EXTRAS = {}
+EXTRAS = {
+    "parquet": ["pyarrow"]
+}
 
 here = os.path.abspath(os.path.dirname(__file__))
 
@@ -0,0 +1,63 @@
+"""Tests written to ensure estimates are pooled with Rubin's rules.
+
+Tests use the pytest library. The tests in this module ensure the following:
+- `test_pool_matches_rubins_rules` streamed pool equals pooling all at once.
+- `test_pool_coefs_only` estimates without std. errors pool coefficients.
+"""
+
+import numpy as np
+import pandas as pd
+from autoimpute.analysis import RubinPool
+from autoimpute.analysis.pooling import _var_ratios, _degrees_freedom
+# pylint:disable=len-as-condition
+# pylint:disable=pointless-string-statement
+
+def _estimates(m=5, k=3, seed=0):
+    """Helper function to make the params and std. errors of m models."""
+    rng = np.random.default_rng(seed)
+    index = ["const", "x1", "x2"][:k]
+    params = [pd.Series(rng.normal(size=k), index=index) for _ in range(m)]
+    bse = [pd.Series(rng.uniform(0.1, 1, size=k), index=index)
+           for _ in range(m)]
+    return params, bse
+
+def test_pool_matches_rubins_rules():
+    """Test the Welford pool equals Rubin's rules over all the models."""
+    params, bse = _estimates()
+    m, n = len(params), 100
+    pool = RubinPool()
+    for p, s in zip(params, bse):
+        pool.update(p, s, n)
+    stats = pool.pool()
+
+    # Rubin's rules over the list of models, as pooled before the pool
+    coefs = sum(params) / m
+    vw = sum(map(lambda x: x**2, bse)) / m
+    vb = sum(map(lambda p: (p-coefs)**2, params)) / max(1, m-1)
+    vt = vw + vb + (vb / m)
+    lambda_ = _var_ratios(m, vb, vt)
+    v_ = _degrees_freedom(m, lambda_, n - coefs.size)
+    fmi_ = ((v_+1)/(v_+3))*lambda_ + 2/(v_+3)
+    expected = {
+        "coefs": coefs, "std": np.sqrt(vt), "vw": vw, "vb": vb, "vt": vt,
+        "dfcom": n - coefs.size, "dfadj": v_, "lambda_": lambda_,
+        "riv": _var_ratios(m, vb, vw), "fmi": fmi_,
+        "eff": (1+(np.maximum(1e-04, fmi_)/m))**-1
+    }
+    assert list(stats) == list(expected)
+    for stat, value in expected.items():
+        assert np.allclose(stats[stat], value)
+        if isinstance(value, pd.Series):
+            assert list(stats[stat].index) == list(value.index)
+
+def test_pool_coefs_only():
+    """Test coefficients alone are pooled, labeled by the index given."""
+    params, _ = _estimates(m=4)
+    pool = RubinPool()
+    for p in params:
+        pool.update(p.values)
+    assert pool.m == 4
+    assert pool.within is None
+    coefs = pool.coefs(["a", "b", "c"])
+    assert list(coefs.index) == ["a", "b", "c"]
+    assert np.allclose(coefs, sum(params) / 4)
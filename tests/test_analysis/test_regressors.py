@@ -0,0 +1,109 @@
+"""Tests written to ensure the analysis regressors fit multiply imputed data.
+
+Tests use the pytest library. The tests in this module ensure the following:
+- `test_fit_adds_response` fit works after y is added to the validated X.
+- `test_ols_batch_matches_statsmodels` batch OLS equals OLS per dataset.
+- `test_ols_fallback_imputes_once` fallback fits the datasets imputed.
+- `test_keep_models` models kept only if requested, same pooled estimates.
+- `test_bootstrap_n_jobs` sklearn bootstrap pooling does not depend on n_jobs.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from autoimpute.imputations import MultipleImputer
+from autoimpute.analysis import MiLinearRegression, MiLogisticRegression
+from autoimpute.utils import dataframes
+dfs = dataframes
+# pylint:disable=len-as-condition
+# pylint:disable=pointless-string-statement
+
+def _regression_data(seed=0, n=300):
+    """Helper function to make predictors and a response with missingness."""
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.normal(size=(n, 2)), columns=["x1", "x2"])
+    y = pd.Series(1 + X.values @ [2, -1] + rng.normal(size=n), name="y")
+    X.loc[rng.random(n) < 0.2, "x1"] = np.nan
+    y[rng.random(n) < 0.2] = np.nan
+    return X, y
+
+def test_fit_adds_response():
+    """Test fit imputes X with y added, not the X validated before that."""
+    X, y = _regression_data()
+    mi = MultipleImputer(n=3, strategy="mean", return_list=True)
+    lm = MiLinearRegression(mi=mi).fit(X[["x1"]], y)
+    assert list(lm.statistics_["coefs"].index) == ["const", "x1"]
+    log_X = dfs.df_bayes_log[["x1", "x2"]].copy()
+    mi = MultipleImputer(n=2, strategy={"x1": "mean", "x2": "mean",
+                                        "y": "mode"})
+    glm = MiLogisticRegression(mi=mi).fit(log_X, dfs.df_bayes_log["y"])
+    assert not glm.statistics_["coefs"].isnull().any()
+
+def test_ols_batch_matches_statsmodels():
+    """Test OLS from shared cross products equals statsmodels on each."""
+    X, y = _regression_data()
+    def mi():
+        return MultipleImputer(n=3, strategy="norm", seed=5, return_list=True)
+    batch = MiLinearRegression(mi=mi(), keep_models=True).fit(X.copy(), y)
+    each = MiLinearRegression(mi=mi(), model_kwgs={"missing": "none"},
+                              keep_models=True).fit(X.copy(), y)
+    assert list(batch.statistics_) == list(each.statistics_)
+    for stat, value in batch.statistics_.items():
+        assert np.allclose(value, each.statistics_[stat], rtol=1e-8)
+    for i, model in batch.models_.items():
+        assert np.allclose(model.params, each.models_[i].params)
+        assert np.allclose(model.bse, each.models_[i].bse)
+        assert model.df_resid == each.models_[i].df_resid
+
+def test_ols_fallback_imputes_once():
+    """Test a constant column falls back to statsmodels without reimputing."""
+    X, y = _regression_data()
+    X["c"] = 1.0
+    mi = MultipleImputer(n=2, strategy="mean", return_list=True)
+    calls = []
+    fit_transform = mi.fit_transform
+    def counted(data):
+        calls.append(data)
+        return fit_transform(data)
+    mi.fit_transform = counted
+    lm = MiLinearRegression(mi=mi).fit(X, y)
+    assert len(calls) == 1
+    assert list(lm.statistics_["coefs"].index) == ["x1", "x2", "c"]
+
+@pytest.mark.parametrize("model_lib", ["statsmodels", "sklearn"])
+def test_keep_models(model_lib):
+    """Test models are kept only if requested, with the same statistics."""
+    X, y = _regression_data()
+    def fit(keep):
+        mi = MultipleImputer(n=3, strategy="norm", seed=5, return_list=True)
+        lm = MiLinearRegression(mi=mi, model_lib=model_lib,
+                                keep_models=keep)
+        return lm.fit(X.copy(), y)
+    kept, dropped = fit(True), fit(False)
+    assert len(kept.models_) == 3
+    assert len(kept.mi_params_) == 3
+    assert dropped.models_ == {}
+    assert not hasattr(dropped, "mi_params_")
+    for stat, value in kept.statistics_.items():
+        assert np.allclose(value, dropped.statistics_[stat])
+    coefs = sum(kept.mi_params_) / 3
+    if model_lib == "sklearn":
+        coefs = np.insert(coefs, 0, sum(kept.mi_alphas_) / 3)
+    assert np.allclose(kept.statistics_["coefs"], coefs)
+
+def test_bootstrap_n_jobs():
+    """Test bootstrapped sklearn models pool the same with any n_jobs."""
+    X, y = _regression_data()
+    def fit(n_jobs):
+        mi = MultipleImputer(n=3, strategy="norm", seed=5, return_list=True)
+        lm = MiLinearRegression(mi=mi, model_lib="sklearn", n_boot=20,
+                                seed=8, n_jobs=n_jobs)
+        return lm.fit(X.copy(), y)
+    one, two = fit(1), fit(2)
+    assert "std" in one.statistics_
+    assert (one.statistics_["vw"] > 0).all()
+    assert list(one.statistics_) == list(two.statistics_)
+    for stat, value in one.statistics_.items():
+        assert np.allclose(value, two.statistics_[stat])
+    with pytest.raises(ValueError):
+        MiLinearRegression(model_lib="sklearn", n_boot=1)
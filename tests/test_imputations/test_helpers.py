@@ -0,0 +1,144 @@
+"""Tests written to ensure private imputation helpers work as expected.
+
+Tests use the pytest library. The tests in this module ensure the following:
+- `test_nearest_donors` sorted search finds the same neighbors as brute force.
+- `test_too_many_neighbors` error if more neighbors than donors requested.
+- `test_pg_draws_mean` Polya-Gamma draws have the exact mean.
+- `test_norm_draw` norm.draw coefficients center on least squares.
+- `test_nig_draws` conjugate draws have the posterior mean and covariance.
+- `test_laplace_logistic` Laplace mode and variance of an intercept model.
+- `test_pymc3_model_cached` pymc3 models built once per likelihood and shape.
+- `test_pymc3_data_cleared` cached models hold no rows once drawn from.
+- `test_pymc3_minibatch_model` minibatch advi builds and fits its own model.
+"""
+
+import pytest
+import numpy as np
+from scipy.optimize import brentq
+from scipy.special import expit
+from autoimpute.imputations.helpers import _donor_index, _nearest_donors
+from autoimpute.imputations.helpers import _pg_draws
+from autoimpute.imputations.helpers import _norm_draw_fit, _norm_draw
+from autoimpute.imputations.helpers import _nig_posterior, _nig_draws
+from autoimpute.imputations.helpers import _laplace_logistic, _mvn_draws
+from autoimpute.imputations.helpers import _pymc3_model, _pymc3_posterior
+from autoimpute.imputations.sketches import LeastSquaresStats
+from autoimpute.imputations.series import BayesianLeastSquaresImputer
+from autoimpute.imputations.series import BayesianBinaryLogisticImputer
+
+def test_nearest_donors():
+    """Test nearest donors match a brute force search over all donors."""
+    rng = np.random.default_rng(11)
+    y_pred = rng.normal(size=500)
+    donors = _donor_index(y_pred * 2, y_pred)
+    x = np.concatenate([rng.normal(size=200), [-10, 10]])
+    for n in (1, 5, 300):
+        ix = _nearest_donors(x, n, donors)
+        found = np.sort(np.abs(donors["y_pred"][ix] - x[:, None]), axis=1)
+        brute = np.sort(np.abs(y_pred[None, :] - x[:, None]), axis=1)[:, :n]
+        assert np.allclose(found, brute)
+        assert np.allclose(donors["y"][ix], donors["y_pred"][ix] * 2)
+
+def test_too_many_neighbors():
+    """Test error raised when more neighbors requested than donors."""
+    donors = _donor_index(np.arange(3), np.arange(3))
+    with pytest.raises(ValueError):
+        _nearest_donors(np.array([1.0]), 4, donors)
+
+def test_pg_draws_mean():
+    """Test Polya-Gamma draws average to tanh(c/2)/(2c), or 1/4 at c = 0."""
+    rng = np.random.default_rng(4)
+    c = np.repeat([0.0, 1.0, 5.0], 20000)
+    draws = _pg_draws(rng, c).reshape(3, -1)
+    assert (draws > 0).all()
+    expected = [0.25, np.tanh(0.5) / 2, np.tanh(2.5) / 10]
+    assert np.allclose(draws.mean(1), expected, rtol=0.02)
+
+def test_norm_draw():
+    """Test norm.draw coefficients have least squares mean and covariance."""
+    rng = np.random.default_rng(8)
+    X = np.column_stack([np.ones(200), rng.normal(size=(200, 2))])
+    y = X @ [1.0, 2.0, -3.0] + rng.normal(size=200)
+    coef = np.linalg.lstsq(X, y, rcond=None)[0]
+    fit = _norm_draw_fit(LeastSquaresStats().update(X[:, 1:], y))
+    draws = np.array([_norm_draw(rng, fit) for _ in range(5000)])
+    s2 = fit["rss"] / (fit["df"] - 2)
+    cov = s2 * np.linalg.inv(X.T @ X)
+    assert np.allclose(draws.mean(0), coef, atol=0.01)
+    assert np.allclose(np.cov(draws.T), cov, rtol=0.1, atol=1e-4)
+
+def test_nig_draws():
+    """Test NIG draws match the posterior solved from the normal equations."""
+    rng = np.random.default_rng(12)
+    X = np.column_stack([np.ones(100), rng.normal(size=(100, 2))])
+    y = X @ [1.0, 2.0, -3.0] + rng.normal(size=100)
+    m0, sd0 = np.array([0.0, 1.0, 0.0]), np.array([2.0, 0.5, 1.0])
+    post = _nig_posterior(X, y, m0, sd0, 2.0, 2.0)
+    prec = X.T @ X + np.diag(1 / sd0**2)
+    mean = np.linalg.solve(prec, m0 / sd0**2 + X.T @ y)
+    assert np.allclose(post["mean"], mean)
+    alpha, beta, sigma = _nig_draws(rng, post, 20000)
+    draws = np.column_stack([alpha, beta])
+    s2 = post["b"] / (post["a"] - 1)
+    assert np.allclose(draws.mean(0), mean, atol=0.01)
+    assert np.allclose(np.cov(draws.T), s2 * np.linalg.inv(prec),
+                       rtol=0.1, atol=1e-4)
+    assert np.isclose(np.mean(sigma**2), s2, rtol=0.02)
+
+def test_laplace_logistic():
+    """Test the Laplace mode and variance of an intercept-only model."""
+    rng = np.random.default_rng(13)
+    y = (rng.random(300) < 0.3).astype(float)
+    m0, sd0 = 0.5, 1.5
+    post = _laplace_logistic(np.ones((300, 1)), y, np.array([m0]),
+                             np.array([sd0]))
+    def score(c):
+        return np.sum(y - expit(c)) - (c - m0) / sd0**2
+    mode = brentq(score, -10, 10)
+    p = expit(mode)
+    var = 1 / (300 * p * (1 - p) + 1 / sd0**2)
+    assert np.isclose(post["mean"][0], mode)
+    assert np.isclose(1 / post["chol"][0, 0]**2, var)
+    draws = _mvn_draws(rng, post["mean"], post["chol"], 1.0, 20000)
+    assert np.isclose(draws.mean(), mode, atol=0.01)
+    assert np.isclose(draws.var(), var, rtol=0.05)
+
+def test_pymc3_model_cached():
+    """Test pymc3 models are reused, with data kept separate per fit."""
+    rng = np.random.default_rng(3)
+    imp = BayesianLeastSquaresImputer(bm=1)
+    X, y = rng.normal(size=(50, 2)), rng.normal(size=50)
+    model, data = _pymc3_model(imp, X, y)
+    model_b, data_b = _pymc3_model(imp, X[:30], y[:30])
+    assert model is model_b
+    assert data["X"].shape == (50, 2) and data_b["X"].shape == (30, 2)
+    assert np.array_equal(data["bm"], [1.0, 1.0])
+    model_c, _ = _pymc3_model(imp, X[:, :1], y)
+    imp_l = BayesianBinaryLogisticImputer()
+    model_l, _ = _pymc3_model(imp_l, X, y > 0, "logistic")
+    assert model_c is not model and model_l is not model
+
+def test_pymc3_data_cleared():
+    """Test cached models drop the rows of a fit once drawn from."""
+    rng = np.random.default_rng(5)
+    imp = BayesianLeastSquaresImputer(inference="advi", n_iter=200,
+                                      sample=20, progressbar=False)
+    X, y = rng.normal(size=(40, 3)), rng.normal(size=40)
+    model, data = _pymc3_model(imp, X, y)
+    assert model["X"].get_value().shape == (0, 3)
+    trace = _pymc3_posterior(imp, model, data)
+    assert len(trace["alpha"]) == 20
+    assert model["X"].get_value().shape == (0, 3)
+    assert model["y"].get_value().shape == (0,)
+
+def test_pymc3_minibatch_model():
+    """Test minibatch advi builds a model of its own and fits it."""
+    rng = np.random.default_rng(6)
+    imp = BayesianLeastSquaresImputer(inference="minibatch advi",
+                                      batch_size=10, n_iter=200, sample=20,
+                                      progressbar=False)
+    X, y = rng.normal(size=(40, 2)), rng.normal(size=40)
+    model, data = _pymc3_model(imp, X, y)
+    assert data is None
+    assert model is not _pymc3_model(imp, X, y)[0]
+    assert len(_pymc3_posterior(imp, model)["beta"]) == 20
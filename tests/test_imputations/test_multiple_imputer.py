@@ -0,0 +1,101 @@
+"""Tests written to ensure the MultipleImputer in imputations package works.
+
+Tests use the pytest library. The tests in this module ensure the following:
+- `test_bad_n_jobs` throw error if n_jobs is not a valid number of processes.
+- `test_parallel_matches_sequential` n_jobs > 1 gives same imputations.
+- `test_deterministic_fits_shared` deterministic fits shared, draws differ.
+- `test_logistic_fits_shared` seeded logistic fits shared, unseeded not.
+- `test_chained_fits_not_shared` chained equations refit each imputation.
+- `test_transform_chunks` each chunk imputed once per imputation.
+- `test_compact_matches_copies` compact imputations equal full copies.
+"""
+
+import pytest
+import numpy as np
+from autoimpute.imputations import MultipleImputer
+from autoimpute.utils import dataframes
+dfs = dataframes
+# pylint:disable=len-as-condition
+# pylint:disable=pointless-string-statement
+
+@pytest.mark.parametrize("n_jobs", [0, -2, 1.5])
+def test_bad_n_jobs(n_jobs):
+    """Test that invalid n_jobs throw an error when instantiating."""
+    with pytest.raises((TypeError, ValueError)):
+        MultipleImputer(n_jobs=n_jobs)
+
+def test_parallel_matches_sequential():
+    """Test process pool imputations equal sequential ones for same seed."""
+    strategy = {"A": "norm", "B": "random", "C": "mean"}
+    seq = MultipleImputer(n=3, strategy=strategy, seed=101, return_list=True)
+    par = MultipleImputer(n=3, strategy=strategy, seed=101, return_list=True,
+                          n_jobs=2)
+    seq_imps = seq.fit_transform(dfs.df_num)
+    par_imps = par.fit_transform(dfs.df_num)
+    assert len(seq_imps) == len(par_imps) == 3
+    for (i, s), (j, p) in zip(seq_imps, par_imps):
+        assert i == j
+        assert s.equals(p)
+
+def test_deterministic_fits_shared():
+    """Test deterministic fits are shared while random draws still differ."""
+    strategy = {"A": "norm", "B": "least squares", "C": "mean"}
+    imp = MultipleImputer(n=3, strategy=strategy, seed=101, return_list=True)
+    imps = imp.fit_transform(dfs.df_num)
+    first, second = imp.statistics_[1], imp.statistics_[2]
+    for col in strategy:
+        assert first.statistics_[col] is second.statistics_[col]
+    assert not imps[0][1]["A"].equals(imps[1][1]["A"])
+
+def test_logistic_fits_shared():
+    """Test logistic fits are shared only if the solver's seed is given."""
+    strategy = {"y": "binary logistic"}
+    unseeded = MultipleImputer(n=2, strategy=strategy, seed=101)
+    unseeded.fit(dfs.df_bayes_log)
+    first, second = unseeded.statistics_[1], unseeded.statistics_[2]
+    assert first.statistics_["y"] is not second.statistics_["y"]
+    seeded = MultipleImputer(n=2, strategy=strategy, seed=101,
+                             imp_kwgs={"y": {"random_state": 0}})
+    seeded.fit(dfs.df_bayes_log)
+    first, second = seeded.statistics_[1], seeded.statistics_[2]
+    assert first.statistics_["y"] is second.statistics_["y"]
+
+def test_chained_fits_not_shared():
+    """Test chained equations share univariate fits only."""
+    strategy = {"A": "stochastic", "B": "least squares", "C": "mean"}
+    imp = MultipleImputer(n=2, strategy=strategy, seed=101, n_iter=5)
+    imp.fit(dfs.df_num)
+    first, second = imp.statistics_[1], imp.statistics_[2]
+    assert first.statistics_["C"] is second.statistics_["C"]
+    assert first.statistics_["B"] is not second.statistics_["B"]
+
+def test_transform_chunks():
+    """Test chunks are yielded with one imputed copy per imputation."""
+    strategy = {"A": "norm", "B": "least squares", "C": "mean"}
+    imp = MultipleImputer(n=3, strategy=strategy, seed=101).fit(dfs.df_num)
+    chunks = (dfs.df_num.iloc[i:i+500] for i in range(0, 1000, 500))
+    imputed = list(imp.transform_chunks(chunks))
+    assert len(imputed) == 2
+    for chunk in imputed:
+        assert [i for i, _ in chunk] == [1, 2, 3]
+        assert not any(c.isnull().any().any() for _, c in chunk)
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_compact_matches_copies(n_jobs):
+    """Test compact data builds the same imputations as full copies."""
+    strategy = {"A": "norm", "B": "least squares"}
+    full = MultipleImputer(n=3, strategy=strategy, seed=101, return_list=True)
+    compact = MultipleImputer(n=3, strategy=strategy, seed=101, compact=True,
+                              n_jobs=n_jobs)
+    imps = full.fit_transform(dfs.df_num)
+    data = compact.fit_transform(dfs.df_num)
+    assert len(data) == 3
+    for (i, f), (j, c) in zip(imps, data):
+        assert i == j
+        assert f.equals(c)
+        assert data.column(i, "A").equals(f["A"])
+    base = data.data["C"].values
+    assert np.shares_memory(data.column(1, "C").values, base)
+    assert np.shares_memory(data[1]["C"].values, base)
+    assert data.data["A"].isnull().any()
+    assert data.values[1]["A"].shape == (dfs.df_num["A"].isnull().sum(),)
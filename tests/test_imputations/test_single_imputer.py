@@ -11,12 +11,34 @@ Tests use the pytest library. The tests in this module ensure the following:
 - `test_categorical_univar_imputers` test all categorical strategies.
 - `test_stochastic_predictive_imputer` test stochastic strategy.
 - `test_bayesian_reg_imputer` test bayesian regression strategy.
+- `test_bayesian_reg_analytic` test conjugate engine of bayesian regression.
 - `test_bayesian_logistic_imputer` test bayesian logistic strategy.
+- `test_bayesian_logistic_engines` test laplace and polya-gamma engines.
+- `test_bayesian_posterior_reused` transform reuses posterior from fit.
+- `test_bayesian_advi` test variational inference for bayesian strategies.
 - `test_pmm_lrd_imputer` test pmm and lrd strategy.
+- `test_pmm_lrd_engines` test norm.draw and pymc3 engines of pmm and lrd.
+- `test_bad_engine` throw error if engine or inference is not supported.
+- `test_seed_reproducible_threads` same seed gives same draws in threads.
+- `test_block_fit_matches_series_fit` block fit equals fit per column.
+- `test_constant_fills_visit_order` mean columns filled in visit order.
+- `test_design_new_data` predictors encoded with fit levels on new data.
+- `test_design_category` category predictors encoded as object ones.
+- `test_chained_equations` chained sweeps stop early once imputations settle.
+- `test_bad_n_iter` throw error if n_iter is not a valid number of sweeps.
+- `test_monotone_visit` monotone visit predicts from earlier columns only.
+- `test_monotone_first_column` first monotone column imputed univariately.
+- `test_fewest_missing_visit` columns visited by increasing missingness.
+- `test_transform_chunks` chunked transform equals whole-frame transform.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
 import pytest
 from autoimpute.imputations import SingleImputer
+from autoimpute.imputations.series import MeanImputer, MedianImputer
+from autoimpute.imputations.series import ModeImputer
 from autoimpute.utils import dataframes
 dfs = dataframes
 # pylint:disable=len-as-condition
@@ -121,12 +143,71 @@ def test_bayesian_reg_imputer():
     imp_n = SingleImputer(strategy="bayesian least squares")
     imp_n.fit_transform(dfs.df_num)
 
+def test_bayesian_reg_analytic():
+    """Test analytic engine matches least squares when priors are flat."""
+    imp_b = SingleImputer(strategy={"y":"bayesian least squares"},
+                          imp_kwgs={"y":{"engine": "analytic",
+                                         "asd": 1e6, "bsd": 1e6}},
+                          seed=5)
+    imputed = imp_b.fit_transform(dfs.df_bayes_reg)
+    assert not imputed["y"].isnull().any()
+    assert imp_b.statistics_["y"].deterministic_fit
+    obs = dfs.df_bayes_reg.dropna()
+    xs = np.column_stack([np.ones(len(obs)), obs[["x1", "x2", "x3"]]])
+    ols = np.linalg.lstsq(xs, obs["y"], rcond=None)[0]
+    post = imp_b.statistics_["y"].statistics_["param"]
+    assert np.allclose(post["mean"], ols, rtol=1e-4)
+
 def test_bayesian_logistic_imputer():
     """Test bayesian works for binary column of PredictiveImputer."""
     imp_b = SingleImputer(strategy={"y":"bayesian binary logistic"},
                           imp_kwgs={"y":{"fill_value": "random"}})
     imp_b.fit_transform(dfs.df_bayes_log)
 
+def test_bayesian_logistic_engines():
+    """Test laplace and polya-gamma engines impute observed labels."""
+    labels = set(dfs.df_bayes_log["y"].dropna())
+    for engine in ("laplace", "polya-gamma"):
+        imp_b = SingleImputer(strategy={"y":"bayesian binary logistic"},
+                              imp_kwgs={"y":{"engine": engine,
+                                             "fill_value": "random",
+                                             "sample": 200, "tune": 100}},
+                              seed=6)
+        imputed = imp_b.fit_transform(dfs.df_bayes_log)
+        assert set(imputed["y"]) == labels
+        trace = imp_b.statistics_["y"].trace_
+        assert trace["beta"].shape == (200, 3)
+    assert imp_b.statistics_["y"].deterministic_fit is False
+    imp_l = SingleImputer(strategy={"y":"bayesian binary logistic"},
+                          imp_kwgs={"y":{"engine": "laplace"}})
+    imp_l.fit(dfs.df_bayes_log)
+    assert imp_l.statistics_["y"].deterministic_fit
+
+def test_bayesian_posterior_reused():
+    """Test repeated transforms reuse the posterior sampled during fit."""
+    imp_b = SingleImputer(strategy={"y":"bayesian least squares"},
+                          imp_kwgs={"y":{"fill_value": "random",
+                                         "sample": 100, "tune": 100}},
+                          seed=3)
+    imp_b.fit(dfs.df_bayes_reg)
+    trace = imp_b.statistics_["y"].trace_
+    first = imp_b.transform(dfs.df_bayes_reg)
+    second = imp_b.transform(dfs.df_bayes_reg)
+    assert imp_b.statistics_["y"].trace_ is trace
+    assert not first["y"].isnull().any()
+    assert first.equals(second)
+
+def test_bayesian_advi():
+    """Test advi and minibatch advi fit the bayesian regression model."""
+    for inference in ("advi", "minibatch advi"):
+        imp_b = SingleImputer(strategy={"y":"bayesian least squares"},
+                              imp_kwgs={"y":{"inference": inference,
+                                             "n_iter": 2000,
+                                             "batch_size": 100}},
+                              seed=2)
+        imputed = imp_b.fit_transform(dfs.df_bayes_reg)
+        assert not imputed["y"].isnull().any()
+
 def test_pmm_lrd_imputer():
     """Test pmm and lrd work for numerical column of PredictiveImputer."""
     # test pmm first - test kwargs and params
@@ -139,4 +220,164 @@ def test_pmm_lrd_imputer():
     imp_lrd = SingleImputer(strategy={"y":"lrd"},
                             imp_kwgs={"y": {"fill_value": "random",
                                       "copy_x": False}})
-    imp_lrd.fit_transform(dfs.df_bayes_reg)
\ No newline at end of file
+    imp_lrd.fit_transform(dfs.df_bayes_reg)
+
+def test_pmm_lrd_engines():
+    """Test pmm and lrd draw coefficients with norm.draw unless pymc3 used."""
+    for strat in ("pmm", "lrd"):
+        imp = SingleImputer(strategy={"y": strat}, seed=9)
+        imputed = imp.fit_transform(dfs.df_bayes_reg)
+        assert not imputed["y"].isnull().any()
+        assert not hasattr(imp.statistics_["y"], "trace_")
+        imp_b = SingleImputer(strategy={"y": strat},
+                              imp_kwgs={"y": {"engine": "pymc3",
+                                              "sample": 100, "tune": 100}})
+        imp_b.fit_transform(dfs.df_bayes_reg)
+        assert len(imp_b.statistics_["y"].trace_["alpha"]) > 0
+
+@pytest.mark.parametrize("strategy,kwgs,data", [
+    ("bayesian least squares", {"engine": "gibbs"}, dfs.df_bayes_reg),
+    ("bayesian binary logistic", {"engine": "gibbs"}, dfs.df_bayes_log),
+    ("bayesian least squares", {"inference": "gibbs"}, dfs.df_bayes_reg),
+    ("pmm", {"engine": "gibbs"}, dfs.df_bayes_reg),
+])
+def test_bad_engine(strategy, kwgs, data):
+    """Test that unsupported engines or inference throw a ValueError."""
+    imp = SingleImputer(strategy={"y": strategy}, imp_kwgs={"y": kwgs})
+    with pytest.raises(ValueError):
+        imp.fit(data)
+
+def test_seed_reproducible_threads():
+    """Test seeded imputations are reproducible and leave global rng alone."""
+    strategy = {"A": "norm", "B": "random", "C": "mean"}
+    state = np.random.get_state()[1].copy()
+    def run(seed):
+        imp = SingleImputer(strategy=strategy, seed=seed)
+        return imp.fit_transform(dfs.df_num)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        imps = list(executor.map(run, [7, 7, 7, 7]))
+    for imp in imps[1:]:
+        assert imp.equals(imps[0])
+    assert (np.random.get_state()[1] == state).all()
+
+def test_block_fit_matches_series_fit():
+    """Test univariate params fit by block equal those fit per column."""
+    series_imps = {"mean": MeanImputer, "median": MedianImputer,
+                   "mode": ModeImputer}
+    for strat, series_imp in series_imps.items():
+        imp = SingleImputer(strategy=strat)
+        imp.fit(dfs.df_num)
+        for col, imputer in imp.statistics_.items():
+            expected = series_imp().fit(dfs.df_num[col], None)
+            exp_param = expected.statistics_["param"]
+            assert np.all(imputer.statistics_["param"] == exp_param)
+        imputed = imp.transform(dfs.df_num)
+        assert not imputed.isnull().any().any()
+
+def test_constant_fills_visit_order():
+    """Test mean columns visited after a predictive one are not used by it."""
+    df = dfs.df_num
+    imp = SingleImputer(strategy={"A": "least squares", "B": "mean",
+                                  "C": "mean"})
+    imputed = imp.fit_transform(df)
+    rows = df["A"].isnull()
+    # B is still missing when A is imputed, so gets a default imputation
+    # from the rows being imputed, not the fit mean of B
+    x_ = df.loc[rows, ["B", "C"]]
+    x_ = x_.fillna({"B": x_["B"].mean()})
+    expected = imp.statistics_["A"].lm.predict(x_)
+    assert np.allclose(imputed.loc[rows, "A"], expected)
+    assert np.allclose(imputed.loc[df["B"].isnull(), "B"], df["B"].mean())
+
+def test_design_new_data():
+    """Test categorical predictors are encoded with fit levels on new data."""
+    imp = SingleImputer(strategy={"salary": "least squares",
+                                  "gender": "multinomial logistic"})
+    imp.fit(dfs.df_mix)
+    new = dfs.df_mix[dfs.df_mix["gender"] != "Male"]
+    new.loc[new.index[:5], "salary"] = np.nan
+    imputed = imp.transform(new)
+    assert not imputed[["salary", "gender"]].isnull().any().any()
+    lm = imp.statistics_["salary"].lm
+    assert lm.coef_.size == len(imp._levels["gender"]) + 2
+
+def test_design_category():
+    """Test category dtype predictors are encoded like object predictors."""
+    strategy = {"salary": "least squares"}
+    obj = SingleImputer(strategy=strategy, seed=4).fit(dfs.df_mix)
+    df_cat = dfs.df_mix.copy()
+    df_cat["gender"] = df_cat["gender"].astype("category")
+    cat = SingleImputer(strategy=strategy, seed=4).fit(df_cat)
+    assert cat._levels["gender"] == obj._levels["gender"]
+    lm_obj = obj.statistics_["salary"].lm
+    lm_cat = cat.statistics_["salary"].lm
+    assert np.allclose(lm_cat.coef_, lm_obj.coef_)
+
+def test_chained_equations():
+    """Test chained sweeps refit predictive columns and stop early."""
+    strategy = {"A": "least squares", "B": "least squares", "C": "mean"}
+    imp = SingleImputer(strategy=strategy, n_iter=20, seed=5)
+    imputed = imp.fit_transform(dfs.df_num)
+    assert not imputed.isnull().any().any()
+    assert 1 < imp.n_iter_ < 20
+    one = SingleImputer(strategy=strategy, seed=5)
+    one.fit_transform(dfs.df_num)
+    assert one.n_iter_ == 1
+    coef = imp.statistics_["A"].lm.coef_
+    assert not np.allclose(coef, one.statistics_["A"].lm.coef_)
+
+@pytest.mark.parametrize("n_iter", [0, 1.5])
+def test_bad_n_iter(n_iter):
+    """Test that invalid n_iter throw an error when instantiating."""
+    with pytest.raises((TypeError, ValueError)):
+        SingleImputer(n_iter=n_iter)
+
+def test_monotone_visit():
+    """Test monotone visit fits each column on earlier columns only."""
+    rng = np.random.default_rng(17)
+    df = pd.DataFrame(rng.normal(size=(300, 3)), columns=["A", "B", "C"])
+    df.loc[:99, "A"] = np.nan
+    df.loc[:49, "B"] = np.nan
+    strategy = {"A": "least squares", "B": "least squares", "C": "mean"}
+    imp = SingleImputer(strategy=strategy, visit="monotone")
+    imputed = imp.fit_transform(df)
+    assert not imputed.isnull().any().any()
+    assert list(imp.statistics_) == ["C", "B", "A"]
+    assert len(imp.statistics_["B"].lm.coef_) == 1
+    assert len(imp.statistics_["A"].lm.coef_) == 2
+    df.loc[150, "C"] = np.nan
+    with pytest.warns(UserWarning):
+        SingleImputer(strategy=strategy, visit="monotone").fit(df)
+
+def test_monotone_first_column():
+    """Test the first monotone column falls back to univariate imputation."""
+    rng = np.random.default_rng(17)
+    df = pd.DataFrame(rng.normal(size=(300, 3)), columns=["A", "B", "C"])
+    df.loc[:99, "A"] = np.nan
+    df.loc[:49, "B"] = np.nan
+    df.loc[:9, "C"] = np.nan
+    imp = SingleImputer(strategy="least squares", visit="monotone")
+    with pytest.warns(UserWarning):
+        imputed = imp.fit_transform(df)
+    assert not imputed.isnull().any().any()
+    assert imp.statistics_["C"].strategy == "default univariate"
+    assert np.allclose(imputed.loc[:9, "C"], df["C"].mean())
+    assert len(imp.statistics_["A"].lm.coef_) == 2
+
+def test_fewest_missing_visit():
+    """Test columns are visited in order of increasing missingness."""
+    imp = SingleImputer(visit="fewest-missing-first")
+    imp.fit(dfs.df_num)
+    counts = dfs.df_num.isnull().sum().sort_values(kind="stable")
+    assert list(imp.statistics_) == counts.index.tolist()
+
+def test_transform_chunks():
+    """Test imputing chunks gives the same result as the whole frame."""
+    strategy = {"A": "mean", "B": "least squares", "C": "median"}
+    imp = SingleImputer(strategy=strategy).fit(dfs.df_num)
+    whole = imp.transform(dfs.df_num)
+    chunks = (dfs.df_num.iloc[i:i+300] for i in range(0, 1000, 300))
+    chunked = pd.concat(imp.transform_chunks(chunks))
+    assert chunked.equals(whole)
+    with pytest.raises(TypeError):
+        next(imp.transform_chunks([dfs.df_num.values]))
@@ -0,0 +1,147 @@
+"""Tests written to ensure the sketches used by partial_fit work as expected.
+
+Tests use the pytest library. The tests in this module ensure the following:
+- `test_moments_merge` merged moments equal moments of all the values.
+- `test_quantile_sketch` median within the rank error of the sketch.
+- `test_frequent_items` counts exact until capacity, then heavy hitters kept.
+- `test_distinct_sample` sample does not depend on how values are split.
+- `test_partial_fit_matches_fit` partial fits on chunks equal a full fit.
+- `test_partial_fit_predictive` predictive strategies cannot partial_fit.
+- `test_merge_unfit` merging an imputer without a sketch raises an error.
+- `test_least_squares_stats` merged stats solve the full least squares fit.
+- `test_stochastic_partial_fit` partitions fit stochastic as a full fit.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from sklearn.exceptions import NotFittedError
+from autoimpute.imputations import SingleImputer
+from autoimpute.imputations.series import StochasticImputer, MeanImputer
+from autoimpute.imputations.sketches import Moments, QuantileSketch
+from autoimpute.imputations.sketches import FrequentItems, DistinctSample
+from autoimpute.imputations.sketches import LeastSquaresStats
+from autoimpute.utils import dataframes
+dfs = dataframes
+
+def test_moments_merge():
+    """Test moments merged from batches equal moments of all values."""
+    values = np.random.default_rng(1).normal(3, 2, size=1000)
+    left = Moments().update(values[:300])
+    right = Moments().update(values[300:700]).update(values[700:])
+    merged = left.merge(right)
+    assert merged.n == 1000
+    assert np.isclose(merged.mean, values.mean())
+    assert np.isclose(merged.std, values.std(ddof=1))
+
+def test_quantile_sketch():
+    """Test the sketch median is exact when small, and close when large."""
+    values = np.random.default_rng(2).normal(size=100000)
+    small = QuantileSketch().update(values[:999])
+    assert small.quantile(0.5) == np.median(values[:999])
+    sketch = QuantileSketch()
+    for i in range(0, 100000, 7000):
+        sketch.merge(QuantileSketch().update(values[i:i+7000]))
+    assert sum(len(v) for v in sketch.levels) < 20000
+    rank = (values < sketch.quantile(0.5)).mean()
+    assert abs(rank - 0.5) < 0.01
+
+def test_frequent_items():
+    """Test counts are exact for few values and keep the most frequent."""
+    values = np.array(["a"]*50 + ["b"]*30 + ["c"]*20)
+    items = FrequentItems().update(values[:40]).merge(
+        FrequentItems().update(values[40:]))
+    assert items.counts == {"a": 50, "b": 30, "c": 20}
+    assert list(items.modes()) == ["a"]
+    assert np.allclose(items.proportions().values, [0.5, 0.3, 0.2])
+    rng = np.random.default_rng(3)
+    noise = rng.integers(100, 10000, size=5000)
+    heavy = FrequentItems(capacity=50).update(np.append(noise, [1]*2000))
+    assert list(heavy.modes()) == [1]
+
+def test_distinct_sample():
+    """Test the sample of distinct values is the same for any split."""
+    values = np.random.default_rng(4).integers(0, 500, size=2000)
+    whole = DistinctSample(capacity=100).update(values)
+    parts = DistinctSample(capacity=100).update(values[:900]).merge(
+        DistinctSample(capacity=100).update(values[900:]))
+    assert len(whole.values) == 100
+    assert set(whole.values) == set(parts.values)
+    every = DistinctSample().update(values)
+    assert set(every.values) == set(values)
+
+def test_partial_fit_matches_fit():
+    """Test partial fits on chunks, then merged, equal a fit of the whole."""
+    strategy = {"gender": "mode", "salary": "mean", "age": "norm",
+                "amm": "median"}
+    df = dfs.df_mix
+    full = SingleImputer(strategy=strategy).fit(df)
+    first = SingleImputer(strategy=strategy)
+    for i in range(0, 300, 100):
+        first.partial_fit(df.iloc[i:i+100])
+    second = SingleImputer(strategy=strategy).partial_fit(df.iloc[300:])
+    merged = first.merge(second)
+    for col in ("salary", "amm"):
+        assert np.isclose(merged.statistics_[col].statistics_["param"],
+                          full.statistics_[col].statistics_["param"])
+    mu, sd = merged.statistics_["age"].statistics_["param"]
+    assert np.allclose([mu, sd], full.statistics_["age"].statistics_["param"])
+    modes = merged.statistics_["gender"].statistics_["param"]
+    assert list(modes) == list(full.statistics_["gender"].statistics_["param"])
+    assert not merged.transform(df).isnull().any().any()
+
+def test_partial_fit_predictive():
+    """Test partial_fit raises an error for predictive strategies."""
+    with pytest.raises(ValueError):
+        SingleImputer(strategy="least squares").partial_fit(dfs.df_num)
+    with pytest.raises(ValueError):
+        SingleImputer(strategy="mean").merge(SingleImputer(strategy="mean"))
+
+def test_merge_unfit():
+    """Test sketches start empty and cannot be merged until partial fit."""
+    imp = MeanImputer()
+    assert imp.sketch_ is None
+    with pytest.raises(NotFittedError):
+        imp.merge(MeanImputer())
+    imp.partial_fit(dfs.df_num["A"])
+    assert MeanImputer().merge(imp).sketch_.n == imp.sketch_.n
+    fit = SingleImputer(strategy="mean").fit(dfs.df_num)
+    with pytest.raises(ValueError):
+        fit.merge(SingleImputer(strategy="mean").partial_fit(dfs.df_num))
+
+@pytest.mark.parametrize("fit_intercept", [True, False])
+def test_least_squares_stats(fit_intercept):
+    """Test stats merged across processes solve the full least squares."""
+    rng = np.random.default_rng(5)
+    X = rng.normal(100, 1, size=(1000, 3))
+    y = X @ [1.0, -2.0, 0.5] + 40 + rng.normal(size=1000)
+    parts = [(X[i:i+250], y[i:i+250]) for i in range(0, 1000, 250)]
+    stats = LeastSquaresStats.from_partitions(parts, fit_intercept, n_jobs=2)
+    design = np.column_stack([np.ones(1000), X]) if fit_intercept else X
+    coef, rss = np.linalg.lstsq(design, y, rcond=None)[:2]
+    beta, alpha = stats.solve()
+    assert stats.n == 1000
+    assert np.allclose(np.append(alpha, beta)[1-fit_intercept:], coef)
+    assert np.isclose(stats.rss(), rss[0])
+    assert np.allclose(stats.xtx, X.T @ X)
+
+def test_stochastic_partial_fit():
+    """Test stochastic fit on partitions matches a fit on all rows."""
+    rng = np.random.default_rng(6)
+    X = pd.DataFrame(rng.normal(size=(400, 2)), columns=["a", "b"])
+    y = pd.Series(X.values @ [2.0, 1.0] + rng.normal(size=400))
+    y[::10] = np.nan
+    observed = y.notnull()
+    full = StochasticImputer().fit(X[observed], y[observed])
+    left = StochasticImputer().partial_fit(X[:150], y[:150])
+    right = StochasticImputer().partial_fit(X[150:], y[150:])
+    left.merge(right)
+    assert np.allclose(left.lm.coef_, full.lm.coef_)
+    assert np.isclose(left.lm.intercept_, full.lm.intercept_)
+    assert np.isclose(left.statistics_["param"], full.statistics_["param"])
+    stats = LeastSquaresStats().update(X[observed], y[observed])
+    refit = StochasticImputer().fit_stats(stats)
+    assert np.allclose(refit.lm.coef_, full.lm.coef_)
+    assert len(refit.impute(X[:5])) == 5
+    with pytest.raises(ValueError):
+        StochasticImputer(fit_intercept=False).fit_stats(stats)
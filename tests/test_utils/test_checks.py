@@ -7,6 +7,7 @@ Tests use the pytest library. The tests in this module ensure the following:
 - `check_missingness` raises errors for fully missing datasets.
 - `check_missingness` raises errors for time series missing in datasets.
 - `remove_nan_columns` removes columns if the entire column is missing.
+- `test_validation_cached_in_scope` validation reused only within a scope.
 """
 
 import pytest
@@ -14,6 +15,7 @@ import numpy as np
 import pandas as pd
 from autoimpute.utils.checks import check_data_structure, check_missingness
 from autoimpute.utils.checks import check_nan_columns
+from autoimpute.utils.checks import _validate, _validation_scope
 
 @check_data_structure
 def check_data(data):
@@ -154,3 +156,32 @@ def test_nan_columns():
     assert pd.isnull(df["C"]).all()
     with pytest.raises(ValueError):
         check_nan_cols(df)
+
+def test_validation_cached_in_scope():
+    """Check validation is cached by DataFrame identity within a scope.
+
+    Within a validation scope, validating the same DataFrame again returns
+    the cached result, while a copy, or the DataFrame once a column is
+    added in place, is validated anew. Once the outermost scope exits, the
+    cache is cleared.
+
+    Args:
+        None: DataFrame hard-coded internally.
+
+    Returns:
+        None: asserts validation is reused only within the scope.
+    """
+    df = pd.DataFrame({"A": [1, np.nan, 3], "B": ["a", None, "c"]})
+    with _validation_scope():
+        first = _validate(df)
+        with _validation_scope():
+            assert _validate(df) is first
+        assert _validate(df) is first
+        assert _validate(df.copy()) is not first
+        wider = df.copy()
+        cached = _validate(wider)
+        wider["C"] = 1
+        assert _validate(wider) is not cached
+        assert list(_validate(wider)["counts"].index) == ["A", "B", "C"]
+    assert _validate(df) is not first
+    assert list(first["counts"]) == [1, 1]
@@ -0,0 +1,86 @@
+"""Tests written to ensure imputers read and write Parquet datasets.
+
+Tests use the pytest library. The tests in this module ensure the following:
+- `test_dataset_columns` only columns in strategy and predictors are read.
+- `test_fit_parquet` fit on a Parquet path matches fit on the DataFrame.
+- `test_is_dataset` only Parquet paths or datasets are read as datasets.
+- `test_row_groups` row groups found once, then read by file and id.
+- `test_transform_dataset` row groups imputed the same with any n_jobs.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from autoimpute.imputations import SingleImputer, MultipleImputer
+from autoimpute.utils.datasets import read_dataset, row_groups, is_dataset
+from autoimpute.utils.datasets import read_row_group
+pytest.importorskip("pyarrow")
+
+def _parquet(tmp_path):
+    """Write a wide frame with missing values to Parquet, in row groups."""
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame(rng.normal(size=(400, 6)), columns=list("abcdef"))
+    df.loc[rng.random(400) < 0.2, "a"] = np.nan
+    df.loc[rng.random(400) < 0.2, "b"] = np.nan
+    path = str(tmp_path / "wide.parquet")
+    df.to_parquet(path, index=False, row_group_size=100)
+    return df, path
+
+def test_dataset_columns():
+    """Test imputers read only the columns they impute or predict from."""
+    cols = list("abcdef")
+    imp = SingleImputer(strategy={"a": "least squares", "b": "mean"},
+                        predictors={"a": ["c", "d"]})
+    assert imp._dataset_columns(cols) == ["a", "b", "c", "d"]
+    imp = SingleImputer(strategy={"a": "least squares"})
+    assert imp._dataset_columns(cols) == cols
+    imp = MultipleImputer(strategy={"a": "pmm"},
+                          predictors=[{"a": ["c"]}, {"a": "e"}], n=2)
+    assert imp._dataset_columns(cols) == ["a", "c", "e"]
+
+def test_fit_parquet(tmp_path):
+    """Test fitting on a Parquet path equals fitting on its columns."""
+    df, path = _parquet(tmp_path)
+    strategy = {"a": "least squares", "b": "mean"}
+    predictors = {"a": ["c", "d"]}
+    imp = SingleImputer(strategy=strategy, predictors=predictors).fit(path)
+    ref = SingleImputer(strategy=strategy, predictors=predictors)
+    ref.fit(df[list("abcd")])
+    assert np.allclose(imp.statistics_["a"].lm.coef_,
+                       ref.statistics_["a"].lm.coef_)
+    assert list(imp.transform(path).columns) == list("abcd")
+
+def test_is_dataset(tmp_path):
+    """Test stray strings fail the type check rather than read as Parquet."""
+    _, path = _parquet(tmp_path)
+    assert is_dataset(path) and is_dataset(tmp_path)
+    assert is_dataset(str(tmp_path / "new.parquet"))
+    assert not is_dataset("foo")
+    with pytest.raises(TypeError):
+        SingleImputer().fit("foo")
+
+def test_row_groups(tmp_path):
+    """Test each row group is read by its file and id, in order."""
+    df, path = _parquet(tmp_path)
+    groups = row_groups(path)
+    assert [g[2] for g in groups] == [0, 1, 2, 3]
+    second = read_row_group(groups[1], ["a", "c"])
+    assert second.equals(df[["a", "c"]].iloc[100:200].reset_index(drop=True))
+
+def test_transform_dataset(tmp_path):
+    """Test row groups written in order, the same for any n_jobs."""
+    df, path = _parquet(tmp_path)
+    imp = SingleImputer(strategy={"a": "stochastic", "b": "norm"},
+                        predictors={"a": ["c"]}, seed=4).fit(path)
+    one = imp.transform_dataset(path, str(tmp_path / "one.parquet"))
+    two = imp.transform_dataset(path, str(tmp_path / "two.parquet"), 2)
+    one, two = read_dataset(one), read_dataset(two)
+    assert list(one.columns) == list("abc")
+    assert not one.isnull().any().any()
+    assert np.allclose(one.values, two.values)
+    assert np.allclose(one["c"], df["c"])
+    mi = MultipleImputer(n=2, strategy={"a": "norm"}, seed=4).fit(path)
+    files = mi.transform_dataset(path, str(tmp_path / "mi_{i}.parquet"))
+    assert [i for i, _ in files] == [1, 2]
+    with pytest.raises(ValueError):
+        mi.transform_dataset(path, str(tmp_path / "mi.parquet"))
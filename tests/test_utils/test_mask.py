@@ -0,0 +1,57 @@
+"""Tests written to ensure the MissingMask in the utils package works.
+
+Tests use the pytest library. The tests in this module ensure the following:
+- `test_mask_matches_isnull` mask unpacks to the same values as pd.isnull.
+- `test_mask_counts` column and row counts match counts from pd.isnull.
+- `test_mask_complete_rows` complete rows match listwise deletion.
+- `test_mask_patterns` unique patterns and counts match pandas groupby.
+- `test_mask_not_dataframe` mask requires a DataFrame.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from autoimpute.utils import MissingMask
+
+# odd number of rows, so the packed bits do not fill the last byte
+df_mask = pd.DataFrame({
+    "A": [1, np.nan, 3, 4, np.nan, 6, 7, 8, 9, np.nan, 11],
+    "B": ["a", None, "c", "d", "e", None, "g", "h", "i", "j", "k"],
+    "C": [np.nan, 2, 3, 4, 5, 6, 7, 8, np.nan, 10, 11]
+})
+
+def test_mask_matches_isnull():
+    """Test the unpacked mask is the same as pd.isnull."""
+    mask = MissingMask(df_mask)
+    assert mask.to_frame().equals(pd.isnull(df_mask))
+    for col in df_mask:
+        assert (mask.column(col) == df_mask[col].isnull().values).all()
+
+def test_mask_counts():
+    """Test column and row counts of missing values."""
+    mask = MissingMask(df_mask)
+    assert mask.col_counts().equals(df_mask.isnull().sum())
+    assert (mask.row_counts() == df_mask.isnull().sum(axis=1).values).all()
+
+def test_mask_complete_rows():
+    """Test complete rows are the rows kept by listwise deletion."""
+    mask = MissingMask(df_mask)
+    complete = df_mask.index[mask.complete_rows()]
+    assert complete.equals(df_mask.dropna().index)
+    complete_b = df_mask.index[mask.complete_rows(["B"])]
+    assert complete_b.equals(df_mask.dropna(subset=["B"]).index)
+
+def test_mask_patterns():
+    """Test row patterns and their counts match a pandas groupby."""
+    mask = MissingMask(df_mask)
+    patterns, counts = mask.patterns()
+    expected = df_mask.isnull().groupby(list(df_mask.columns)).size()
+    found = {tuple(p): c for p, c in zip(patterns, counts)}
+    assert found == expected.to_dict()
+    keys = mask.pattern_keys()
+    assert len(np.unique(keys)) == len(expected)
+
+def test_mask_not_dataframe():
+    """Test the mask raises a TypeError if data is not a DataFrame."""
+    with pytest.raises(TypeError):
+        MissingMask(df_mask["A"])
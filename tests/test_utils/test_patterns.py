@@ -13,6 +13,7 @@ from FIMD, section 4.1.
 Tests use the pytest library. The tests in this module ensure the following:
 - `test_md_locations` checks missingness identified properly as 1/0.
 - `test_md_pattern` checks against result from MICE md.pattern.
+- `test_md_pattern_order` checks columns ordered by number missing.
 - `test_md_pairs` checks against result from MICE md.pairs
 - `test_inbound` checks against inbound calc in 4.1 (no explicit method)
 - `test_outbound` checks against outbound calc in 4.1 (no explicit method)
@@ -93,6 +94,20 @@ def test_md_pattern():
     assert all(md_pat[["A", "B", "C"]] == df_pattern[["A", "B", "C"]])
     assert all(md_pat["nmis"] == df_pattern["nmis"])
 
+def test_md_pattern_order():
+    """Test that pattern columns are ordered by number missing, fewest first.
+
+    Ties keep the order of the columns in the data, and each column's
+    pattern moves with its label.
+    """
+    md_pat = md_pattern(df_general[["C", "B", "A"]])
+    assert md_pat.columns.tolist() == ["count", "A", "C", "B", "nmis"]
+    assert md_pat["count"].tolist() == [2, 1, 3, 2]
+    assert md_pat["A"].tolist() == [1, 1, 1, 0]
+    assert md_pat["C"].tolist() == [1, 1, 0, 1]
+    assert md_pat["B"].tolist() == [1, 0, 1, 0]
+    assert md_pat["nmis"].tolist() == [0, 1, 1, 2]
+
 def test_md_pairs():
     """Test that missing data pairs equal to expected results.
 
@@ -0,0 +1,43 @@
+"""Tests written to ensure the core budget in the utils package works.
+
+Tests use the pytest library. The tests in this module ensure the following:
+- `test_budget_split` workers and their budgets never exceed the cores.
+- `test_budget_n_jobs` estimator n_jobs resolved within the budget.
+- `test_budget_nesting` innermost budget applies and is removed on exit.
+- `test_bad_budget` throw error if n_cores is not a valid number of cores.
+"""
+
+import pytest
+from autoimpute.utils import CoreBudget, core_budget, current_budget
+
+def test_budget_split():
+    """Test splitting a budget shares its cores among the workers."""
+    workers, inner = CoreBudget(8).split(3)
+    assert workers == 3 and inner.n_cores == 2
+    workers, inner = CoreBudget(2).split(5)
+    assert workers == 2 and inner.n_cores == 1
+    assert CoreBudget(16).sampler_cores == 4
+
+def test_budget_n_jobs():
+    """Test n_jobs of estimators are capped by the budget."""
+    budget = CoreBudget(4)
+    assert budget.n_jobs(None) is None
+    assert budget.n_jobs(-1) == 4
+    assert budget.n_jobs(-2) == 3
+    assert budget.n_jobs(8) == 4
+    assert budget.n_jobs(2) == 2
+
+def test_budget_nesting():
+    """Test nested budgets apply innermost first, then restore the outer."""
+    with core_budget(4) as outer:
+        assert current_budget() is outer
+        with core_budget(1):
+            assert current_budget().n_cores == 1
+        assert current_budget() is outer
+    assert current_budget() is not outer
+
+@pytest.mark.parametrize("n_cores", [0, -2, 1.5])
+def test_bad_budget(n_cores):
+    """Test that invalid n_cores throw an error when creating a budget."""
+    with pytest.raises((TypeError, ValueError)):
+        CoreBudget(n_cores)